@@ -0,0 +1,231 @@
+# core/brush.py
+from collections import OrderedDict
+
+import numpy as np
+
+# 브러시 감쇠 곡선 종류
+FALLOFF_LINEAR = "linear"        # 1 - d/r (높이기/낮추기, 스무딩)
+FALLOFF_QUADRATIC = "quadratic"  # 1 - (d/r)^2 (평탄화)
+
+
+def radial_falloff(grid_radius, falloff=FALLOFF_LINEAR):
+    """
+    원형 브러시 스탬프(감쇠 마스크) 생성
+
+    (2r+1) x (2r+1) 크기의 배열로, 중심 셀이 [r, r]에 위치한다.
+    반경 밖의 셀은 감쇠값 0, inside 마스크 False 를 가진다.
+
+    Args:
+        grid_radius (int): 그리드 단위 브러시 반경
+        falloff (str): 감쇠 곡선 (FALLOFF_LINEAR / FALLOFF_QUADRATIC)
+
+    Returns:
+        tuple: (감쇠값 배열, 반경 내부 여부 bool 배열)
+    """
+    if grid_radius <= 0:
+        # 반경 0 브러시는 중심 셀 하나에만 최대 강도로 적용
+        return np.ones((1, 1)), np.ones((1, 1), dtype=bool)
+
+    offsets = np.arange(-grid_radius, grid_radius + 1, dtype=np.float64)
+    distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+    inside = distance <= grid_radius
+
+    ratio = distance / grid_radius
+    if falloff == FALLOFF_LINEAR:
+        weights = 1.0 - ratio
+    elif falloff == FALLOFF_QUADRATIC:
+        weights = 1.0 - ratio ** 2
+    else:
+        raise ValueError(f"알 수 없는 감쇠 곡선: {falloff}")
+
+    weights[~inside] = 0.0
+    return weights, inside
+
+
+class BrushStampCache:
+    """
+    브러시 스탬프 LRU 캐시
+
+    한 번의 스트로크는 같은 반경의 브러시를 수백 번 재사용하므로,
+    (브러시 크기, 해상도, 감쇠 곡선) 별로 float32 감쇠 커널을 만들어 두고
+    재사용한다. 격자 가장자리에서 잘린 커널도 잘린 범위별로 캐시한다.
+    """
+
+    def __init__(self, maxsize=64):
+        """
+        Args:
+            maxsize (int): 보관할 최대 스탬프 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.maxsize = maxsize
+        self._stamps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, brush_size, resolution, falloff=FALLOFF_LINEAR, clip=None):
+        """
+        감쇠 커널 반환 (없으면 생성 후 캐시)
+
+        Args:
+            brush_size (float): 브러시 크기 (반경, 미터)
+            resolution (float): 지형 해상도 (격자/m)
+            falloff (str): 감쇠 곡선
+            clip (tuple): 잘린 범위 (kx0, kx1, kz0, kz1), None이면 전체 커널
+
+        Returns:
+            tuple: (float32 감쇠값 배열, 반경 내부 여부 bool 배열)
+        """
+        key = (brush_size, resolution, falloff, clip)
+        stamp = self._stamps.get(key)
+        if stamp is not None:
+            self.hits += 1
+            self._stamps.move_to_end(key)
+            return stamp
+
+        self.misses += 1
+        if clip is None:
+            weights, inside = radial_falloff(int(brush_size * resolution), falloff)
+            stamp = (weights.astype(np.float32), inside)
+        else:
+            full = self._stamps.get((brush_size, resolution, falloff, None))
+            weights, inside = full or self.get(brush_size, resolution, falloff)
+            kx0, kx1, kz0, kz1 = clip
+            stamp = (np.ascontiguousarray(weights[kx0:kx1, kz0:kz1]),
+                     np.ascontiguousarray(inside[kx0:kx1, kz0:kz1]))
+
+        self._stamps[key] = stamp
+        while len(self._stamps) > self.maxsize:
+            self._stamps.popitem(last=False)
+        return stamp
+
+    def clear(self):
+        """캐시 및 카운터 초기화"""
+        self._stamps.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        캐시 사용 통계
+
+        Returns:
+            dict: hits, misses, size, maxsize, hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._stamps),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# 모든 지형이 공유하는 기본 스탬프 캐시 (키에 해상도가 포함되므로 공유 가능)
+stamp_cache = BrushStampCache()
+
+
+# 일괄 스탬프(apply_stamps) 연산 종류
+STAMP_OPS = ("raise", "lower", "flatten", "smooth")
+
+# 한 묶음에서 처리할 최대 스탬프 셀 수 (임시 배열 메모리 상한)
+MAX_BATCH_CELLS = 1 << 22
+
+
+def split_batches(cell_counts, limit=MAX_BATCH_CELLS):
+    """
+    스탬프 목록을 순서를 유지한 채 셀 수 상한 이하의 연속 구간으로 분할
+
+    Args:
+        cell_counts (ndarray): 스탬프별 셀 수
+        limit (int): 구간당 최대 셀 수 (스탬프 하나가 상한보다 커도 단독 구간으로 처리)
+
+    Returns:
+        list: (시작, 끝) 인덱스 튜플 목록
+    """
+    batches = []
+    start = 0
+    total = 0
+    for i, count in enumerate(cell_counts):
+        if i > start and total + count > limit:
+            batches.append((start, i))
+            start = i
+            total = 0
+        total += count
+    if start < len(cell_counts):
+        batches.append((start, len(cell_counts)))
+    return batches
+
+
+def stamp_waves(boxes, block=8):
+    """
+    겹치는 스탬프의 순서를 보존하도록 스탬프를 웨이브(wave)로 분류
+
+    각 스탬프는 자신보다 앞선 스탬프 중 겹치는 것들보다 뒤의 웨이브에 배치된다.
+    같은 웨이브의 스탬프끼리는 서로 겹치지 않으므로 한 번에 적용해도 순차 적용과
+    결과가 같다. 겹침 판정은 block x block 셀 단위의 거친 격자로 보수적으로 한다.
+
+    Args:
+        boxes (ndarray): (n, 4) 스탬프 영역 [min_x, max_x, min_z, max_z] (양끝 포함)
+        block (int): 겹침 판정 격자 크기 (셀)
+
+    Returns:
+        ndarray: 스탬프별 웨이브 번호 (0부터)
+    """
+    bx0 = boxes[:, 0] // block
+    bx1 = boxes[:, 1] // block + 1
+    bz0 = boxes[:, 2] // block
+    bz1 = boxes[:, 3] // block + 1
+    ox, oz = bx0.min(), bz0.min()
+
+    # 블록별로 마지막으로 배치된 웨이브 번호 (+1, 0은 비어 있음)
+    last_wave = np.zeros((bx1.max() - ox, bz1.max() - oz), dtype=np.int32)
+    waves = np.empty(len(boxes), dtype=np.int32)
+    for k in range(len(boxes)):
+        blocks = last_wave[bx0[k] - ox:bx1[k] - ox, bz0[k] - oz:bz1[k] - oz]
+        wave = blocks.max() + 1
+        blocks[...] = wave
+        waves[k] = wave - 1
+    return waves
+
+
+def space_stroke(points, spacing, prev=None, carry=0.0):
+    """
+    스트로크 입력 위치를 경로를 따라 일정 간격의 스탬프 위치로 변환
+
+    이전 호출의 마지막 점(prev)과 남은 거리(carry)를 이어받으므로, 입력을 몇 번에
+    나눠 넣어도 한 번에 넣은 것과 같은 스탬프가 나온다.
+
+    Args:
+        points (list): 입력 위치 [(x, z), ...]
+        spacing (float): 스탬프 간격 (m)
+        prev (tuple): 이전 호출의 마지막 위치, None 이면 첫 점에 바로 스탬프
+        carry (float): 이전 호출의 마지막 스탬프 이후 이동 거리
+
+    Returns:
+        tuple: (스탬프 X 좌표 배열, 스탬프 Z 좌표 배열, prev, carry)
+    """
+    xs, zs = [], []
+    for x, z in points:
+        if prev is None:
+            # 스트로크 첫 점에는 바로 스탬프
+            xs.append(np.array([x]))
+            zs.append(np.array([z]))
+            prev = (x, z)
+            carry = 0.0
+            continue
+
+        px, pz = prev
+        length = np.hypot(x - px, z - pz)
+        if length > 0:
+            # 이 구간에서 스탬프가 찍힐 거리
+            offsets = np.arange(spacing - carry, length + 1e-9, spacing)
+            t = offsets / length
+            xs.append(px + (x - px) * t)
+            zs.append(pz + (z - pz) * t)
+            last = offsets[-1] if len(offsets) else -carry
+            carry = length - last
+        prev = (x, z)
+
+    if not xs:
+        return np.empty(0), np.empty(0), prev, carry
+    return np.concatenate(xs), np.concatenate(zs), prev, carry
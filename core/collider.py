@@ -0,0 +1,131 @@
+# core/collider.py
+import struct
+
+import numpy as np
+
+from core.heightmap import COPY_ROWS, UINT16_MAX
+
+# 콜라이더 파일 식별자와 형식 버전
+COLLIDER_MAGIC = b"MGCL"
+COLLIDER_VERSION = 1
+
+# 콜라이더 종류 (파일 헤더의 종류 번호)
+COLLIDER_TYPES = ("heightfield", "mesh")
+
+# 헤더: 식별자, 버전, 종류, 개수 2개 (행/열 또는 정점/면), 배율 x/y/z, 오프셋 x/y/z
+# 40바이트로 맞춰 뒤따르는 배열이 4바이트 경계에서 시작하게 한다
+_HEADER = struct.Struct("<4sHHII6f")
+
+
+def _write_header(stream, collider_type, count0, count1, scale, offset):
+    """콜라이더 파일 헤더 기록"""
+    stream.write(_HEADER.pack(COLLIDER_MAGIC, COLLIDER_VERSION, COLLIDER_TYPES.index(collider_type),
+                              count0, count1, *scale, *offset))
+
+
+def heightfield_scale(height_range):
+    """
+    높이 범위를 uint16 샘플로 나타내는 (오프셋, 샘플당 높이)
+
+    Args:
+        height_range (tuple): (최소 높이, 최대 높이)
+
+    Returns:
+        tuple: (offset, scale_y)
+    """
+    low, high = height_range
+    return low, ((high - low) / UINT16_MAX if high > low else 1.0)
+
+
+def encode_heightfield(heights, offset, scale_y):
+    """높이를 uint16 높이장 샘플로 변환"""
+    samples = np.round((np.asarray(heights, dtype=np.float64) - offset) / scale_y)
+    return np.clip(samples, 0, UINT16_MAX).astype("<u2")
+
+
+def heightfield_transform(height_range, spacing, origin=(0.0, 0.0), height_scale=1.0):
+    """
+    높이장 샘플의 월드 배율과 오프셋
+
+    샘플 (행 i, 열 j, 값 s) 의 월드 좌표는 offset + (j, s, i) x scale 이다.
+
+    Args:
+        height_range (tuple): 높이맵 단위 (최소 높이, 최대 높이)
+        spacing (float): 격자점 간격 (월드 단위)
+        origin (tuple): 샘플 (0, 0) 의 월드 (x, z)
+        height_scale (float): 높이맵 높이 1 의 월드 높이
+
+    Returns:
+        tuple: (scale (x, y, z), offset (x, y, z))
+    """
+    low, scale_y = heightfield_scale(height_range)
+    return (spacing, scale_y * height_scale, spacing), (origin[0], low * height_scale, origin[1])
+
+
+def write_heightfield_collider(path, heightmap, height_range, spacing, origin=(0.0, 0.0), height_scale=1.0):
+    """
+    높이장(heightfield) 콜라이더를 바이너리 파일로 저장
+
+    높이는 uint16 원시 샘플(행 우선, axis0 = 행 = z) 로 저장하며, 월드 좌표는
+    heightfield_transform 의 배율과 오프셋으로 복원한다. 행 묶음 단위로 변환해
+    바로 기록하므로 임시 메모리는 COPY_ROWS 행 분량이다.
+
+    Args:
+        path (str): 저장 경로
+        heightmap: 높이맵 (ndarray, TiledHeightmap 등)
+        height_range (tuple): 높이맵 단위 (최소 높이, 최대 높이)
+        spacing (float): 격자점 간격 (월드 단위)
+        origin (tuple): 샘플 (0, 0) 의 월드 (x, z)
+        height_scale (float): 높이맵 높이 1 의 월드 높이
+    """
+    low, scale_y = heightfield_scale(height_range)
+    scale, offset = heightfield_transform(height_range, spacing, origin, height_scale)
+    rows, cols = heightmap.shape
+    with open(path, "wb") as stream:
+        _write_header(stream, "heightfield", rows, cols, scale, offset)
+        for row in range(0, rows, COPY_ROWS):
+            encode_heightfield(heightmap[row:row + COPY_ROWS], low, scale_y).tofile(stream)
+
+
+def write_mesh_collider(path, vertices, faces):
+    """
+    메시 콜라이더를 바이너리 파일로 저장 (float32 정점, uint32 면 버퍼)
+
+    Args:
+        path (str): 저장 경로
+        vertices (ndarray): (k, 3) 정점
+        faces (ndarray): (n, 3) 면 인덱스
+    """
+    vertices = np.ascontiguousarray(vertices, dtype="<f4")
+    faces = np.ascontiguousarray(faces, dtype="<u4")
+    with open(path, "wb") as stream:
+        _write_header(stream, "mesh", len(vertices), len(faces), (1.0, 1.0, 1.0), (0.0, 0.0, 0.0))
+        vertices.tofile(stream)
+        faces.tofile(stream)
+
+
+def read_collider(path):
+    """
+    콜라이더 파일 읽기 (배열은 파일에 메모리 매핑된 읽기 전용 뷰)
+
+    Args:
+        path (str): 콜라이더 파일 경로
+
+    Returns:
+        dict: "type" 과 높이장이면 "heights" (uint16), "scale" (x, y, z), "offset" (x, y, z),
+              메시면 "vertices" (float32), "faces" (uint32)
+    """
+    with open(path, "rb") as stream:
+        magic, version, kind, count0, count1, *transform = _HEADER.unpack(stream.read(_HEADER.size))
+    if magic != COLLIDER_MAGIC or version != COLLIDER_VERSION:
+        raise ValueError(f"지원하지 않는 콜라이더 파일: {path}")
+
+    collider_type = COLLIDER_TYPES[kind]
+    if collider_type == "heightfield":
+        heights = np.memmap(path, dtype="<u2", mode="r", offset=_HEADER.size, shape=(count0, count1))
+        return {"type": collider_type, "heights": heights, "scale": tuple(transform[:3]),
+                "offset": tuple(transform[3:])}
+
+    vertices = np.memmap(path, dtype="<f4", mode="r", offset=_HEADER.size, shape=(count0, 3))
+    faces = np.memmap(path, dtype="<u4", mode="r", offset=_HEADER.size + vertices.nbytes, shape=(count1, 3))
+    return {"type": collider_type, "vertices": vertices, "faces": faces}
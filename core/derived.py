@@ -0,0 +1,160 @@
+# core/derived.py
+import numpy as np
+
+from core.heightmap import COPY_ROWS
+
+# 높이맵에서 파생되는 래스터 종류
+DERIVED_MAPS = ("normal", "slope", "curvature")
+
+# 옥타헤드럴 인코딩 법선의 성분 최댓값 (int16 정규화)
+OCT_SCALE = 32767
+
+
+def encode_octahedral(normals):
+    """
+    단위 법선을 옥타헤드럴 좌표 2개(int16)로 인코딩
+
+    Args:
+        normals (ndarray): (..., 3) 단위 벡터 (x, y, z)
+
+    Returns:
+        ndarray: (..., 2) int16 (성분당 -32767 ~ 32767)
+    """
+    normals = np.asarray(normals, dtype=np.float32)
+    projected = normals / np.abs(normals).sum(axis=-1, keepdims=True)
+    u, v, w = projected[..., 0], projected[..., 2], projected[..., 1]
+    # 아래쪽(-Y) 반구는 바깥 삼각형으로 접어 넣음
+    folded_u = np.where(w < 0, (1 - np.abs(v)) * np.where(u >= 0, 1, -1), u)
+    folded_v = np.where(w < 0, (1 - np.abs(u)) * np.where(v >= 0, 1, -1), v)
+    encoded = np.stack([folded_u, folded_v], axis=-1)
+    return np.round(encoded * OCT_SCALE).astype(np.int16)
+
+
+def decode_octahedral(encoded):
+    """
+    옥타헤드럴 인코딩 법선 복원
+
+    Args:
+        encoded (ndarray): (..., 2) int16
+
+    Returns:
+        ndarray: (..., 3) float32 단위 법선 (x, y, z)
+    """
+    u = encoded[..., 0].astype(np.float32) / OCT_SCALE
+    v = encoded[..., 1].astype(np.float32) / OCT_SCALE
+    w = 1 - np.abs(u) - np.abs(v)
+    fold = np.minimum(w, 0)
+    u = u + np.where(u >= 0, fold, -fold)
+    v = v + np.where(v >= 0, fold, -fold)
+    normals = np.stack([u, w, v], axis=-1)
+    return normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+
+
+def _gradients(heights, spacing):
+    """축별 높이 기울기 (중앙 차분, 블록 가장자리는 단방향 차분)"""
+    grad_x = np.gradient(heights, spacing, axis=0) if heights.shape[0] > 1 else np.zeros_like(heights)
+    grad_z = np.gradient(heights, spacing, axis=1) if heights.shape[1] > 1 else np.zeros_like(heights)
+    return grad_x, grad_z
+
+
+def compute_derived(name, heights, spacing):
+    """
+    높이 블록의 파생 래스터 계산
+
+    셀 값은 1칸 이웃까지만 참조하므로, 1칸 테두리를 포함한 블록에서 계산하면
+    테두리 안쪽 값은 격자 전체에서 계산한 것과 같다.
+
+    Args:
+        name (str): "normal", "slope", "curvature"
+        heights (ndarray): float64 높이 블록 (m)
+        spacing (float): 격자 간격 (m)
+
+    Returns:
+        ndarray: "normal" 은 (..., 2) int16 옥타헤드럴 법선, "slope" 는 경사각(도),
+                 "curvature" 는 라플라시안(1/m), 뒤의 둘은 float16
+    """
+    if name == "curvature":
+        padded = np.pad(heights, 1, mode="edge")
+        laplacian = (padded[2:, 1:-1] + padded[:-2, 1:-1] + padded[1:-1, 2:] + padded[1:-1, :-2]
+                     - 4 * heights) / (spacing * spacing)
+        return laplacian.astype(np.float16)
+
+    grad_x, grad_z = _gradients(heights, spacing)
+    if name == "slope":
+        return np.degrees(np.arctan(np.hypot(grad_x, grad_z))).astype(np.float16)
+
+    normals = np.stack([-grad_x, np.ones_like(heights), -grad_z], axis=-1)
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+    return encode_octahedral(normals)
+
+
+class DerivedMaps:
+    """
+    법선/경사/곡률 래스터 캐시
+
+    처음 조회할 때 전체를 행 띠 단위로 계산하고, 이후에는 래스터마다 변경 알림
+    버스를 구독해 편집 범위(+ 1칸 테두리) 만 조회 시점에 다시 계산한다.
+    """
+
+    def __init__(self, terrain):
+        """
+        Args:
+            terrain (Terrain): 대상 지형
+        """
+        self.terrain = terrain
+        self._maps = {}
+        self._changes = {}
+        self._source = None
+
+    def _update_rect(self, name, rect):
+        """
+        범위의 래스터 다시 계산 (차분에 필요한 1칸 테두리까지 읽음)
+
+        COPY_ROWS 행 띠 단위로 계산하므로, 처음 전체를 계산할 때도 임시 float64
+        메모리는 띠 크기에 비례한다.
+        """
+        shape = self.terrain.heightmap.shape
+        x0, x1, z0, z1 = rect
+        hz0, hz1 = max(0, z0 - 1), min(shape[1], z1 + 1)
+        for bx0 in range(x0, x1, COPY_ROWS):
+            bx1 = min(bx0 + COPY_ROWS, x1)
+            hx0, hx1 = max(0, bx0 - 1), min(shape[0], bx1 + 1)
+            heights = np.asarray(self.terrain.heightmap[hx0:hx1, hz0:hz1], dtype=np.float64)
+            values = compute_derived(name, heights, 1.0 / self.terrain.resolution)
+            self._maps[name][bx0:bx1, z0:z1] = values[bx0 - hx0:bx1 - hx0, z0 - hz0:z1 - hz0]
+
+    def get(self, name):
+        """
+        파생 래스터 반환 (필요한 범위만 갱신)
+
+        Args:
+            name (str): "normal", "slope", "curvature"
+
+        Returns:
+            ndarray: compute_derived 형식의 격자 전체 래스터
+                     (갱신 시 제자리에서 바뀌므로 읽기 전용으로 사용한다)
+        """
+        if name not in DERIVED_MAPS:
+            raise ValueError(f"지원하지 않는 파생 래스터: {name}")
+
+        shape = self.terrain.heightmap.shape
+        if self._source is not self.terrain.heightmap:
+            # 높이맵이 교체되었으면 모든 캐시를 버림
+            self._maps = {}
+            self._source = self.terrain.heightmap
+
+        if name not in self._changes:
+            self._changes[name] = self.terrain.changes.subscribe("derived_" + name)
+        changes = self._changes[name]
+
+        if name not in self._maps:
+            changes.pull()
+            self._maps[name] = np.empty(shape + ((2,) if name == "normal" else ()),
+                                        dtype=np.int16 if name == "normal" else np.float16)
+            self._update_rect(name, (0, shape[0], 0, shape[1]))
+        else:
+            for x0, x1, z0, z1 in changes.pull():
+                # 차분은 이웃 셀을 참조하므로 1칸 바깥 셀 값도 바뀜
+                self._update_rect(name, (max(0, x0 - 1), min(shape[0], x1 + 1),
+                                         max(0, z0 - 1), min(shape[1], z1 + 1)))
+        return self._maps[name]
@@ -0,0 +1,131 @@
+# core/dirty.py
+
+
+def merge_rects(a, b):
+    """
+    두 범위를 포함하는 경계 상자 반환
+
+    범위는 (axis0 시작, axis0 끝, axis1 시작, axis1 끝) 높이맵 인덱스이며 끝은 미포함.
+    None 은 빈 범위로 취급한다.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3]))
+
+
+def rects_touch(a, b):
+    """두 범위가 겹치거나 맞닿아 있는지 여부"""
+    return a[0] <= b[1] and b[0] <= a[1] and a[2] <= b[3] and b[2] <= a[3]
+
+
+class DirtySubscriber:
+    """
+    변경 범위 구독자
+
+    발행된 범위를 쌓아 두었다가 pull 시점에 한 번에 가져간다. 겹치거나 맞닿은
+    범위는 즉시 합치고, 범위 수가 max_regions 를 넘으면 하나의 경계 상자로 합친다.
+    """
+
+    def __init__(self, name, max_regions=8):
+        """
+        Args:
+            name (str): 구독자 이름 (preview, mesh, pyramid 등)
+            max_regions (int): 따로 보관할 최대 범위 수
+        """
+        self.name = name
+        self.max_regions = max_regions
+        self._pending = []
+
+    def _add(self, rect):
+        """범위 추가 (겹치는 범위와 병합)"""
+        merged = True
+        while merged:
+            merged = False
+            for i, other in enumerate(self._pending):
+                if rects_touch(rect, other):
+                    rect = merge_rects(rect, other)
+                    del self._pending[i]
+                    merged = True
+                    break
+        self._pending.append(rect)
+
+        if len(self._pending) > self.max_regions:
+            bounds = None
+            for other in self._pending:
+                bounds = merge_rects(bounds, other)
+            self._pending = [bounds]
+
+    def has_pending(self):
+        """가져가지 않은 범위가 있는지 여부"""
+        return bool(self._pending)
+
+    def pull(self):
+        """
+        쌓인 범위 목록을 가져오고 비움
+
+        Returns:
+            list: 서로 겹치지 않는 범위 튜플 목록
+        """
+        regions, self._pending = self._pending, []
+        return regions
+
+    def pull_merged(self):
+        """
+        쌓인 범위를 하나의 경계 상자로 합쳐 가져오고 비움
+
+        Returns:
+            tuple: 경계 상자, 변경이 없으면 None
+        """
+        bounds = None
+        for rect in self.pull():
+            bounds = merge_rects(bounds, rect)
+        return bounds
+
+
+class DirtyRegionBus:
+    """
+    높이맵 변경 알림 버스
+
+    지형을 수정하는 모든 메서드가 편집 범위를 발행하고, 미리보기·메시·피라미드·
+    자동 저장·내보내기 같은 캐시는 각자 구독자를 통해 필요할 때(프레임당 한 번)
+    쌓인 범위를 가져가 해당 부분만 갱신한다.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+
+    def subscribe(self, name, max_regions=8):
+        """
+        구독자 등록 (같은 이름이면 기존 구독자 반환)
+
+        Returns:
+            DirtySubscriber: 구독자
+        """
+        subscriber = self._subscribers.get(name)
+        if subscriber is None:
+            subscriber = DirtySubscriber(name, max_regions)
+            self._subscribers[name] = subscriber
+        return subscriber
+
+    def unsubscribe(self, name):
+        """구독자 제거"""
+        self._subscribers.pop(name, None)
+
+    def publish(self, rect):
+        """
+        변경 범위 발행
+
+        Args:
+            rect (tuple): (axis0 시작, axis0 끝, axis1 시작, axis1 끝), 끝은 미포함
+        """
+        rect = tuple(int(v) for v in rect)
+        if rect[0] >= rect[1] or rect[2] >= rect[3]:
+            return
+        for subscriber in self._subscribers.values():
+            subscriber._add(rect)
+
+    def publish_all(self, shape):
+        """전체 격자 변경 발행"""
+        self.publish((0, shape[0], 0, shape[1]))
@@ -0,0 +1,185 @@
+# core/erosion.py
+import time
+
+import numpy as np
+
+# 침식 방식
+EROSION_TYPES = ("hydraulic", "thermal")
+
+# 기본 침식 매개변수 (높이/물/퇴적물 단위는 m)
+DEFAULT_EROSION_PARAMS = {
+    "rain": 0.01,             # 반복마다 모든 셀에 내리는 물
+    "capacity": 4.0,          # 흐른 물의 양 대비 운반 가능한 퇴적물 비율
+    "erosion_rate": 0.3,      # 운반 여유분 중 깎아내는 비율
+    "deposition_rate": 0.3,   # 운반 초과분 중 내려놓는 비율
+    "evaporation": 0.05,      # 반복마다 증발하는 물의 비율
+    "talus_angle": 35.0,      # 열 침식 안식각 (도, 이보다 가파른 경사만 무너짐)
+    "thermal_rate": 0.5,      # 안식각을 넘는 높이차 중 옮기는 비율
+}
+
+
+def _neighbor_drops(values):
+    """
+    네 이웃(+x, -x, +z, -z) 방향의 높이 차 (자기 값 - 이웃 값)
+
+    격자 밖 이웃은 차이를 0으로 두므로 격자 가장자리 밖으로는 흐르지 않는다.
+    """
+    drops = np.zeros((4,) + values.shape)
+    drops[0, :-1] = values[:-1] - values[1:]
+    drops[1, 1:] = values[1:] - values[:-1]
+    drops[2, :, :-1] = values[:, :-1] - values[:, 1:]
+    drops[3, :, 1:] = values[:, 1:] - values[:, :-1]
+    return drops
+
+
+def _transfer(flows):
+    """
+    방향별 유출량 (4, ...) 을 이웃으로 옮긴 뒤의 셀별 순변화량 (유입 - 유출)
+    """
+    change = -flows.sum(axis=0)
+    change[1:] += flows[0, :-1]
+    change[:-1] += flows[1, 1:]
+    change[:, 1:] += flows[2, :, :-1]
+    change[:, :-1] += flows[3, :, 1:]
+    return change
+
+
+def _split_outflow(drops, amount):
+    """셀별 유출량을 아래로 향하는 이웃에 높이 차에 비례해 나눔"""
+    downhill = np.maximum(drops, 0.0)
+    total = downhill.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(total > 0, amount / total, 0.0)
+    return downhill * share
+
+
+def thermal_step(heights, talus, rate):
+    """
+    열 침식 1회 (안식각보다 가파른 경사의 흙이 아래 이웃으로 무너짐)
+
+    Args:
+        heights (ndarray): 높이 (float64, 제자리에서 수정)
+        talus (float): 셀 한 칸당 허용 높이 차 (tan(안식각) x 셀 간격)
+        rate (float): 허용치를 넘는 높이 차 중 옮기는 비율 (0 ~ 0.5)
+    """
+    drops = _neighbor_drops(heights)
+    excess = np.maximum(drops - talus, 0.0)
+    moved = rate * excess.max(axis=0)
+    heights += _transfer(_split_outflow(excess, moved))
+
+
+def hydraulic_step(heights, water, sediment, params):
+    """
+    수력 침식 1회 (강우, 물 흐름, 침식/퇴적, 증발)
+
+    물은 수면(지형 + 물) 이 낮은 이웃으로 높이 차에 비례해 흐르고, 퇴적물은 물과
+    같은 비율로 함께 옮겨진다. 흐른 물의 양으로 운반 용량을 정해 용량보다 적게
+    운반 중이면 지형을 깎고, 많으면 내려놓는다. 지형 + 퇴적물의 합은 보존된다.
+
+    Args:
+        heights, water, sediment (ndarray): 같은 형태의 float64 배열 (제자리에서 수정)
+        params (dict): DEFAULT_EROSION_PARAMS 형식의 매개변수
+    """
+    water += params["rain"]
+
+    drops = _neighbor_drops(heights + water)
+    outflow = np.minimum(water, 0.5 * drops.max(axis=0).clip(min=0.0))
+    water_flows = _split_outflow(drops, outflow)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        carried = np.where(water > 0, sediment / water, 0.0)
+    water += _transfer(water_flows)
+    sediment += _transfer(water_flows * carried)
+
+    # 운반 용량과의 차이만큼 침식 또는 퇴적
+    capacity = params["capacity"] * outflow
+    surplus = sediment - capacity
+    exchange = np.where(surplus > 0,
+                        params["deposition_rate"] * surplus,
+                        params["erosion_rate"] * surplus)
+    heights += exchange
+    sediment -= exchange
+
+    water *= 1.0 - params["evaporation"]
+
+
+def erode_block(block, origin=(0, 0), erosion_type="hydraulic", iterations=50, cell_size=1.0,
+                params=None, progress=None):
+    """
+    높이 블록에 침식을 반복 적용 (core.parallel.run_tiles 커널 형식)
+
+    한 번의 반복에서 셀의 새 값은 두 칸 안의 셀에만 의존하므로 (이웃의 유출량이
+    그 이웃의 이웃에 따라 정해짐), 블록 주변에 2 x iterations 칸의 halo 를 붙여 나눠
+    계산하면 타일 안쪽 결과는 전체 격자를 한 번에 계산한 것과 같다.
+    블록 가장자리는 닫힌 경계로 취급한다 (물, 흙이 밖으로 나가지 않음).
+
+    Args:
+        block (ndarray): 높이 블록 (수정하지 않음)
+        origin (tuple): block[0, 0] 의 높이맵 인덱스 (사용하지 않음)
+        erosion_type (str): "hydraulic" 또는 "thermal"
+        iterations (int): 반복 횟수
+        cell_size (float): 격자 간격 (m, 열 침식 안식각 계산에 사용)
+        params (dict): DEFAULT_EROSION_PARAMS 의 항목
+        progress (callable): progress(완료 반복 수, 전체 반복 수) 진행 콜백
+
+    Returns:
+        ndarray: 침식된 float64 높이 블록
+    """
+    if erosion_type not in EROSION_TYPES:
+        raise ValueError(f"지원하지 않는 침식 방식: {erosion_type}")
+    settings = dict(DEFAULT_EROSION_PARAMS, **(params or {}))
+    heights = np.array(block, dtype=np.float64)
+
+    if erosion_type == "thermal":
+        talus = np.tan(np.radians(settings["talus_angle"])) * cell_size
+        for step in range(iterations):
+            thermal_step(heights, talus, settings["thermal_rate"])
+            if progress is not None:
+                progress(step + 1, iterations)
+        return heights
+
+    water = np.zeros_like(heights)
+    sediment = np.zeros_like(heights)
+    for step in range(iterations):
+        hydraulic_step(heights, water, sediment, settings)
+        if progress is not None:
+            progress(step + 1, iterations)
+    # 남은 퇴적물은 제자리에 내려놓음
+    heights += sediment
+    return heights
+
+
+def benchmark_erosion(sizes=(129, 257, 513, 1025), iterations=20, erosion_type="hydraulic"):
+    """
+    격자 크기별 침식 처리량 측정
+
+    Args:
+        sizes (tuple): 측정할 정사각 격자 한 변의 격자점 수
+        iterations (int): 크기별 반복 횟수
+        erosion_type (str): 침식 방식
+
+    Returns:
+        list: {"size", "seconds", "cells_per_second"} 목록 (초당 셀 x 반복 수)
+    """
+    from core.noise import noise_heights
+
+    results = []
+    for size in sizes:
+        coords = np.arange(size, dtype=np.float64)
+        heights = noise_heights(coords[:, None], coords[None, :], 50.0, "ridged", seed=1)
+        start = time.perf_counter()
+        erode_block(heights, erosion_type=erosion_type, iterations=iterations)
+        seconds = time.perf_counter() - start
+        results.append({
+            "size": size,
+            "seconds": seconds,
+            "cells_per_second": size * size * iterations / seconds,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    # python -m core.erosion : 침식 처리량 측정 결과 출력
+    for erosion_type in EROSION_TYPES:
+        for result in benchmark_erosion(erosion_type=erosion_type):
+            print(f"{erosion_type:>9} {result['size']:>5}x{result['size']:<5} "
+                  f"{result['seconds']:7.3f}s  {result['cells_per_second'] / 1e6:7.2f} M셀/s")
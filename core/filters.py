@@ -0,0 +1,131 @@
+# core/filters.py
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 지형 필터 종류
+FILTER_TYPES = ("gaussian", "box", "median")
+
+# 이 크기(탭 수)를 넘는 가우시안 커널은 FFT 로 합성곱
+FFT_KERNEL_SIZE = 17
+
+# 미디언 필터가 한 번에 펼치는 창 원소 수 상한 (메모리 제한)
+MEDIAN_CHUNK_CELLS = 1 << 22
+
+
+def gaussian_kernel(radius, sigma=None):
+    """
+    정규화된 1차원 가우시안 커널
+
+    Args:
+        radius (int): 커널 반경 (탭 수 = 2 * radius + 1)
+        sigma (float): 표준편차 (셀, None이면 radius / 3)
+
+    Returns:
+        ndarray: 합이 1인 커널
+    """
+    if sigma is None:
+        sigma = max(radius / 3.0, 1e-6)
+    offsets = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    return kernel / kernel.sum()
+
+
+def _pad_axis(values, radius, axis):
+    """한 축의 양 끝을 가장자리 값으로 radius 칸 확장"""
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius, radius)
+    return np.pad(values, pad, mode="edge")
+
+
+def _convolve_axis(values, kernel, axis):
+    """
+    한 축 방향 1차원 합성곱 (대칭 커널, 가장자리 복제)
+
+    탭마다 배열 전체를 한 번 더하므로 비용은 탭 수에 비례한다.
+    """
+    radius = len(kernel) // 2
+    padded = _pad_axis(values, radius, axis)
+    size = values.shape[axis]
+    result = np.zeros(values.shape)
+    for tap, weight in enumerate(kernel):
+        result += weight * np.take(padded, np.arange(tap, tap + size), axis=axis)
+    return result
+
+
+def _convolve_axis_fft(values, kernel, axis):
+    """한 축 방향 1차원 합성곱 (FFT, 큰 커널용, 결과는 _convolve_axis 와 같음)"""
+    radius = len(kernel) // 2
+    padded = _pad_axis(values, radius, axis)
+    size = values.shape[axis]
+    n_fft = padded.shape[axis] + 2 * radius
+    shape = [1] * values.ndim
+    shape[axis] = -1
+    spectrum = np.fft.rfft(padded, n=n_fft, axis=axis) * np.fft.rfft(kernel, n=n_fft).reshape(shape)
+    full = np.fft.irfft(spectrum, n=n_fft, axis=axis)
+    return np.take(full, np.arange(2 * radius, 2 * radius + size), axis=axis)
+
+
+def _box_axis(values, radius, axis):
+    """한 축 방향 이동 평균 (누적합, 반경과 무관하게 셀당 상수 비용)"""
+    padded = _pad_axis(values, radius, axis)
+    cumulative = np.cumsum(padded, axis=axis)
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (1, 0)
+    cumulative = np.pad(cumulative, pad)
+    size = values.shape[axis]
+    width = 2 * radius + 1
+    upper = np.take(cumulative, np.arange(width, width + size), axis=axis)
+    lower = np.take(cumulative, np.arange(size), axis=axis)
+    return (upper - lower) / width
+
+
+def _median(values, radius):
+    """(2r+1) x (2r+1) 창의 미디언 (행 묶음 단위로 창을 펼침)"""
+    width = 2 * radius + 1
+    padded = np.pad(values, radius, mode="edge")
+    result = np.empty(values.shape)
+    rows = max(1, MEDIAN_CHUNK_CELLS // (values.shape[1] * width * width))
+    for row in range(0, values.shape[0], rows):
+        stop = min(row + rows, values.shape[0])
+        windows = sliding_window_view(padded[row:stop + 2 * radius], (width, width))
+        result[row:stop] = np.median(windows, axis=(-2, -1))
+    return result
+
+
+def filter_block(block, origin=(0, 0), filter_type="gaussian", radius=2, sigma=None, strength=1.0):
+    """
+    높이 블록 필터링 (core.parallel.run_tiles 커널 형식)
+
+    블록 가장자리 밖은 가장자리 값으로 채우므로, 블록에 radius 칸의 halo 를
+    포함해 넘기면 halo 안쪽 결과는 격자 전체를 필터링한 것과 같다.
+    가우시안과 박스는 축별로 나눠(분리 가능) 계산한다.
+
+    Args:
+        block (ndarray): 높이 블록 (수정하지 않음)
+        origin (tuple): block[0, 0] 의 높이맵 인덱스 (사용하지 않음)
+        filter_type (str): "gaussian", "box", "median"
+        radius (int): 필터 반경 (셀)
+        sigma (float): 가우시안 표준편차 (셀, None이면 radius / 3)
+        strength (float): 원래 높이와 필터 결과의 혼합 비율 (0.0 ~ 1.0)
+
+    Returns:
+        ndarray: 필터링된 float64 높이 블록
+    """
+    if filter_type not in FILTER_TYPES:
+        raise ValueError(f"지원하지 않는 필터: {filter_type}")
+    heights = np.asarray(block, dtype=np.float64)
+    if radius <= 0:
+        return heights.copy()
+
+    if filter_type == "gaussian":
+        kernel = gaussian_kernel(radius, sigma)
+        convolve = _convolve_axis_fft if len(kernel) > FFT_KERNEL_SIZE else _convolve_axis
+        filtered = convolve(convolve(heights, kernel, 0), kernel, 1)
+    elif filter_type == "box":
+        filtered = _box_axis(_box_axis(heights, radius, 0), radius, 1)
+    else:
+        filtered = _median(heights, radius)
+
+    if strength < 1.0:
+        filtered = heights + (filtered - heights) * strength
+    return filtered
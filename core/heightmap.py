@@ -0,0 +1,561 @@
+# core/heightmap.py
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# 높이맵 저장 방식 ("memmap" = 프로젝트 폴더의 .npy 파일에 메모리 매핑,
+#                  "shared" = 병렬 처리용 공유 메모리)
+HEIGHTMAP_STORAGES = ("dense", "tiled", "memmap", "shared")
+
+# 메모리 매핑 파일 복사 시 한 번에 옮길 행 수
+COPY_ROWS = 256
+
+# 높이맵 저장 정밀도 (uint16 은 0 ~ height_scale 을 0 ~ 65535 로 정규화)
+HEIGHTMAP_PRECISIONS = ("float64", "float32", "float16", "uint16")
+PRECISION_DTYPES = {
+    "float64": np.float64,
+    "float32": np.float32,
+    "float16": np.float16,
+    "uint16": np.uint16,
+}
+UINT16_MAX = 65535
+
+
+def encode_heights(values, precision, height_scale):
+    """
+    높이값(미터)을 저장 정밀도의 값으로 변환
+
+    uint16 은 0 ~ height_scale 범위로 잘라 65535 단계로 반올림한다.
+    """
+    if precision == "uint16":
+        scaled = np.clip(values, 0, height_scale) * (UINT16_MAX / height_scale)
+        return np.rint(scaled).astype(np.uint16)
+    return np.asarray(values, dtype=PRECISION_DTYPES[precision])
+
+
+def decode_heights(values, precision, height_scale):
+    """저장 정밀도의 값을 높이값(미터)으로 변환"""
+    if precision == "uint16":
+        return np.asarray(values, dtype=np.float32) * np.float32(height_scale / UINT16_MAX)
+    return values
+
+
+def quantization_report(heights, height_scale):
+    """
+    저장 정밀도별 양자화 오차 보고서
+
+    Args:
+        heights (ndarray): 기준 높이맵 (미터)
+        height_scale (float): 높이 스케일
+
+    Returns:
+        dict: 정밀도별 {"bytes_per_cell", "megabytes", "max_error", "rms_error", "step_at_max"}
+              step_at_max 는 height_scale 높이에서 표현 가능한 최소 간격 (미터)
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    report = {}
+    for precision in HEIGHTMAP_PRECISIONS:
+        decoded = decode_heights(encode_heights(heights, precision, height_scale), precision, height_scale)
+        error = np.abs(np.asarray(decoded, dtype=np.float64) - heights)
+        if precision == "uint16":
+            step = height_scale / UINT16_MAX
+        else:
+            step = float(np.spacing(PRECISION_DTYPES[precision](height_scale)))
+        itemsize = np.dtype(PRECISION_DTYPES[precision]).itemsize
+        report[precision] = {
+            "bytes_per_cell": itemsize,
+            "megabytes": heights.size * itemsize / 1e6,
+            "max_error": float(error.max()) if error.size else 0.0,
+            "rms_error": float(np.sqrt(np.mean(error ** 2))) if error.size else 0.0,
+            "step_at_max": step,
+        }
+    return report
+
+
+def open_heightmap_file(path, shape, dtype):
+    """
+    높이맵 파일(.npy)을 메모리 매핑으로 열기 (없으면 생성)
+
+    파일 전체를 읽지 않으므로 큰 지형도 즉시 열리고, 브러시 편집은 건드린
+    페이지에만 기록된다. 메모리에 남길 페이지는 OS 페이지 캐시가 결정한다.
+
+    Args:
+        path (str): .npy 파일 경로
+        shape (tuple): 높이맵 형태
+        dtype: 저장 자료형
+
+    Returns:
+        np.memmap: 읽기/쓰기 가능한 메모리 매핑 배열
+    """
+    shape = tuple(int(n) for n in shape)
+    dtype = np.dtype(dtype)
+    if not os.path.exists(path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    mapped = np.lib.format.open_memmap(path, mode="r+")
+    if mapped.shape != shape or mapped.dtype != dtype:
+        raise ValueError(f"높이맵 파일 형식 불일치: {path} ({mapped.shape}, {mapped.dtype}), "
+                         f"필요: ({shape}, {dtype})")
+    return mapped
+
+
+def create_shared_array(shape, dtype=np.float64):
+    """
+    공유 메모리(multiprocessing.shared_memory)에 놓인 배열 생성
+
+    작업 프로세스는 공유 메모리 이름으로 같은 버퍼에 연결하므로 배열을 피클하지 않는다.
+    사용이 끝나면 생성한 쪽에서 close() 와 unlink() 로 해제해야 한다.
+
+    Args:
+        shape (tuple): 배열 형태
+        dtype: 자료형
+
+    Returns:
+        tuple: (0으로 채워진 ndarray, SharedMemory)
+    """
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array.fill(0)
+    return array, shm
+
+
+def save_heightmap_file(heightmap, path):
+    """
+    높이맵 저장값을 .npy 파일로 저장
+
+    QuantizedHeightmap 은 복원값이 아닌 uint16 저장값을 그대로 기록한다.
+    이미 같은 파일에 매핑된 높이맵이면 변경된 페이지만 디스크에 반영한다.
+
+    Args:
+        heightmap: ndarray, memmap, TiledHeightmap 또는 QuantizedHeightmap
+        path (str): 저장할 .npy 파일 경로
+    """
+    data = heightmap.codes if isinstance(heightmap, QuantizedHeightmap) else heightmap
+    filename = getattr(data, "filename", None)
+    if filename is not None and os.path.exists(path) and os.path.samefile(filename, path):
+        data.flush()
+        return
+
+    target = np.lib.format.open_memmap(path, mode="w+", dtype=data.dtype, shape=data.shape)
+    for row in range(0, data.shape[0], COPY_ROWS):
+        target[row:row + COPY_ROWS] = data[row:row + COPY_ROWS]
+    target.flush()
+    del target
+
+
+class TiledHeightmap:
+    """
+    타일 단위로 나눠 저장하는 높이맵
+
+    격자를 tile_size x tile_size 타일로 나누고, 타일은 처음 값이 기록될 때 할당한다.
+    한 번도 기록되지 않은 타일은 상수 하나(fill)로만 표현하므로, 큰 지형도 편집한
+    부분만큼만 메모리를 쓴다.
+
+    브러시, 미리보기, 내보내기에서 쓰는 NumPy 인덱싱을 그대로 지원한다.
+    정수/슬라이스 인덱싱은 항상 복사본을 반환하므로 수정 결과는 다시 대입해야 한다.
+        - hm[x, z]                  : 스칼라
+        - hm[x0:x1, z0:z1:step]     : 2차원 배열 (복사본)
+        - hm[xs, zs]                : 정수 배열 쌍 (점 단위 조회/대입)
+    """
+
+    ndim = 2
+
+    def __init__(self, shape, tile_size=256, dtype=np.float64, fill=0.0):
+        """
+        Args:
+            shape (tuple): 격자 크기 (axis0, axis1)
+            tile_size (int): 타일 한 변의 셀 수
+            dtype: 저장 자료형
+            fill (float): 할당되지 않은 타일의 값
+        """
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.tile_size = int(tile_size)
+        self.dtype = np.dtype(dtype)
+        self.fill = self.dtype.type(fill)
+        self.tile_grid = (-(-self.shape[0] // self.tile_size), -(-self.shape[1] // self.tile_size))
+        self._tiles = {}
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nbytes(self):
+        """할당된 타일이 실제로 차지하는 바이트 수"""
+        return sum(tile.nbytes for tile in self._tiles.values())
+
+    @property
+    def allocated_tiles(self):
+        """할당된 타일 수"""
+        return len(self._tiles)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return (f"TiledHeightmap(shape={self.shape}, tile_size={self.tile_size}, dtype={self.dtype}, "
+                f"tiles={len(self._tiles)}/{self.tile_grid[0] * self.tile_grid[1]})")
+
+    def _tile(self, ti, tj, create=False):
+        """타일 반환 (없으면 None, create=True 면 fill 값으로 할당)"""
+        tile = self._tiles.get((ti, tj))
+        if tile is None and create:
+            size = self.tile_size
+            tile = np.full((min(size, self.shape[0] - ti * size), min(size, self.shape[1] - tj * size)),
+                           self.fill, dtype=self.dtype)
+            self._tiles[(ti, tj)] = tile
+        return tile
+
+    def _axis_indices(self, key, axis):
+        """
+        정수/슬라이스 인덱스를 정수 배열로 변환
+
+        Returns:
+            tuple: (인덱스 배열, 스칼라 여부)
+        """
+        n = self.shape[axis]
+        if isinstance(key, slice):
+            return np.arange(*key.indices(n)), False
+        index = int(key)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"index {key} is out of bounds for axis {axis} with size {n}")
+        return np.array([index]), True
+
+    def _axis_groups(self, indices):
+        """
+        축 인덱스를 타일별로 묶음
+
+        Returns:
+            list: (타일 번호, 결과 내 위치, 타일 내 위치) - 연속 구간이면 슬라이스
+        """
+        if not len(indices):
+            return []
+        size = self.tile_size
+        tiles = indices // size
+        contiguous = indices[-1] - indices[0] == len(indices) - 1 and np.all(np.diff(indices) == 1)
+        groups = []
+        if contiguous:
+            bounds = np.flatnonzero(np.diff(tiles)) + 1
+            starts = np.concatenate([[0], bounds])
+            ends = np.concatenate([bounds, [len(indices)]])
+            for start, end in zip(starts, ends):
+                ti = int(tiles[start])
+                local = int(indices[start]) - ti * size
+                groups.append((ti, slice(start, end), slice(local, local + end - start)))
+        else:
+            for ti in np.unique(tiles):
+                position = np.flatnonzero(tiles == ti)
+                groups.append((int(ti), position, indices[position] - ti * size))
+        return groups
+
+    def _normalize_key(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        if len(key) != 2:
+            raise IndexError("TiledHeightmap 은 2차원 인덱스만 지원합니다")
+        basic = all(isinstance(k, (slice, int, np.integer)) for k in key)
+        return key, basic
+
+    def _point_groups(self, key):
+        """정수 배열 쌍 인덱스를 타일별로 묶음"""
+        index0, index1 = np.broadcast_arrays(np.asarray(key[0], dtype=np.int64),
+                                             np.asarray(key[1], dtype=np.int64))
+        shape = index0.shape
+        index0 = np.where(index0 < 0, index0 + self.shape[0], index0).ravel()
+        index1 = np.where(index1 < 0, index1 + self.shape[1], index1).ravel()
+        if index0.size and (index0.min() < 0 or index0.max() >= self.shape[0] or
+                            index1.min() < 0 or index1.max() >= self.shape[1]):
+            raise IndexError("index is out of bounds for TiledHeightmap")
+
+        size = self.tile_size
+        tile_ids = (index0 // size) * self.tile_grid[1] + index1 // size
+        order = np.argsort(tile_ids, kind="stable")
+        splits = np.flatnonzero(np.diff(tile_ids[order])) + 1
+        groups = []
+        for position in np.split(order, splits):
+            if not len(position):
+                continue
+            ti, tj = divmod(int(tile_ids[position[0]]), self.tile_grid[1])
+            groups.append((ti, tj, position, index0[position] - ti * size, index1[position] - tj * size))
+        return shape, groups
+
+    def __getitem__(self, key):
+        key, basic = self._normalize_key(key)
+
+        if not basic:
+            shape, groups = self._point_groups(key)
+            values = np.empty(int(np.prod(shape)), dtype=self.dtype)
+            for ti, tj, position, local0, local1 in groups:
+                tile = self._tile(ti, tj)
+                values[position] = self.fill if tile is None else tile[local0, local1]
+            return values.reshape(shape)
+
+        indices0, scalar0 = self._axis_indices(key[0], 0)
+        indices1, scalar1 = self._axis_indices(key[1], 1)
+        if scalar0 and scalar1:
+            tile = self._tile(indices0[0] // self.tile_size, indices1[0] // self.tile_size)
+            if tile is None:
+                return self.fill
+            return tile[indices0[0] % self.tile_size, indices1[0] % self.tile_size]
+
+        result = np.empty((len(indices0), len(indices1)), dtype=self.dtype)
+        groups1 = self._axis_groups(indices1)
+        for ti, position0, local0 in self._axis_groups(indices0):
+            for tj, position1, local1 in groups1:
+                target, source = self._block_index(position0, position1, local0, local1)
+                tile = self._tile(ti, tj)
+                result[target] = self.fill if tile is None else tile[source]
+
+        if scalar0:
+            return result[0]
+        if scalar1:
+            return result[:, 0]
+        return result
+
+    def __setitem__(self, key, value):
+        key, basic = self._normalize_key(key)
+
+        if not basic:
+            shape, groups = self._point_groups(key)
+            values = np.broadcast_to(np.asarray(value, dtype=self.dtype), shape).ravel()
+            for ti, tj, position, local0, local1 in groups:
+                block = values[position]
+                tile = self._tile(ti, tj)
+                if tile is None and np.all(block == self.fill):
+                    continue
+                self._tile(ti, tj, create=True)[local0, local1] = block
+            return
+
+        indices0, scalar0 = self._axis_indices(key[0], 0)
+        indices1, scalar1 = self._axis_indices(key[1], 1)
+        value = np.asarray(value, dtype=self.dtype)
+        if scalar1 and not scalar0 and value.ndim == 1:
+            value = value[:, None]
+        values = np.broadcast_to(value, (len(indices0), len(indices1)))
+
+        groups1 = self._axis_groups(indices1)
+        for ti, position0, local0 in self._axis_groups(indices0):
+            for tj, position1, local1 in groups1:
+                source, target = self._block_index(position0, position1, local0, local1)
+                block = values[source]
+
+                # 기록할 값이 모두 fill 이면 미할당 타일은 그대로 둠
+                if self._tile(ti, tj) is None and np.all(block == self.fill):
+                    continue
+                self._tile(ti, tj, create=True)[target] = block
+
+    def _block_index(self, position0, position1, local0, local1):
+        """
+        타일 한 개에 해당하는 (결과 배열 인덱스, 타일 인덱스) 생성
+
+        두 축 모두 연속 구간이면 슬라이스, 아니면 np.ix_ 인덱스를 사용한다.
+        """
+        if isinstance(position0, slice) and isinstance(position1, slice):
+            return (position0, position1), (local0, local1)
+        size = self.tile_size
+        position0 = np.arange(position0.stop)[position0] if isinstance(position0, slice) else position0
+        position1 = np.arange(position1.stop)[position1] if isinstance(position1, slice) else position1
+        local0 = np.arange(size)[local0] if isinstance(local0, slice) else local0
+        local1 = np.arange(size)[local1] if isinstance(local1, slice) else local1
+        return np.ix_(position0, position1), np.ix_(local0, local1)
+
+    def __array__(self, dtype=None, copy=None):
+        dense = np.full(self.shape, self.fill, dtype=self.dtype)
+        size = self.tile_size
+        for (ti, tj), tile in self._tiles.items():
+            dense[ti * size:ti * size + tile.shape[0], tj * size:tj * size + tile.shape[1]] = tile
+        return dense if dtype is None else dense.astype(dtype)
+
+    def _has_unallocated(self):
+        return len(self._tiles) < self.tile_grid[0] * self.tile_grid[1]
+
+    def min(self):
+        values = [tile.min() for tile in self._tiles.values()]
+        if self._has_unallocated():
+            values.append(self.fill)
+        return min(values)
+
+    def max(self):
+        values = [tile.max() for tile in self._tiles.values()]
+        if self._has_unallocated():
+            values.append(self.fill)
+        return max(values)
+
+    def copy(self):
+        """타일까지 복사한 새 높이맵"""
+        clone = TiledHeightmap(self.shape, self.tile_size, self.dtype, self.fill)
+        clone._tiles = {key: tile.copy() for key, tile in self._tiles.items()}
+        return clone
+
+    def tolist(self):
+        return np.asarray(self).tolist()
+
+    def compact(self):
+        """
+        모든 값이 fill 인 타일을 해제해 상수 표현으로 되돌림
+
+        Returns:
+            int: 해제한 타일 수
+        """
+        empty = [key for key, tile in self._tiles.items() if np.all(tile == self.fill)]
+        for key in empty:
+            del self._tiles[key]
+        return len(empty)
+
+
+class CopyOnWriteHeightmap(TiledHeightmap):
+    """
+    다른 높이맵 위에 겹쳐 쓰는 타일 단위 쓰기 시 복사(copy-on-write) 높이맵
+
+    처음 값을 기록하는 타일만 원본(base)에서 복사해 따로 보관하고, 복사하지 않은
+    타일은 원본을 그대로 읽는다. 원본은 수정하지 않으므로 백그라운드 편집 버퍼처럼
+    편집한 타일만큼만 메모리를 써야 할 때 사용한다. 원본이 같은 값을 갖게 된 타일은
+    release 로 해제해 다시 원본을 읽게 한다.
+    """
+
+    def __init__(self, base, tile_size=256):
+        """
+        Args:
+            base: 원본 높이맵 (ndarray, memmap, TiledHeightmap, uint16 저장소 등)
+            tile_size (int): 복사 단위 타일 한 변의 셀 수
+        """
+        super().__init__(base.shape, tile_size, base.dtype)
+        self.base = base
+
+    def __repr__(self):
+        return (f"CopyOnWriteHeightmap(shape={self.shape}, tile_size={self.tile_size}, dtype={self.dtype}, "
+                f"copied={len(self._tiles)}/{self.tile_grid[0] * self.tile_grid[1]})")
+
+    def _tile(self, ti, tj, create=False):
+        """복사한 타일, 없으면 원본의 타일 범위 (create=True 면 원본에서 복사해 보관)"""
+        tile = self._tiles.get((ti, tj))
+        if tile is None:
+            size = self.tile_size
+            tile = np.asarray(self.base[ti * size:(ti + 1) * size, tj * size:(tj + 1) * size])
+            if create:
+                tile = self._tiles[(ti, tj)] = np.array(tile, dtype=self.dtype)
+        return tile
+
+    def tile_keys(self, rect):
+        """
+        범위가 걸친 타일 번호 목록
+
+        Args:
+            rect (tuple): (axis0 시작, axis0 끝, axis1 시작, axis1 끝), 끝은 미포함
+        """
+        size = self.tile_size
+        return [(ti, tj) for ti in range(rect[0] // size, (rect[1] - 1) // size + 1)
+                for tj in range(rect[2] // size, (rect[3] - 1) // size + 1)]
+
+    def release(self, keys):
+        """
+        복사한 타일 해제 (이후 원본을 읽음, 원본이 같은 값을 가진 뒤에만 호출)
+
+        Args:
+            keys (iterable): 타일 번호 (ti, tj)
+        """
+        for key in keys:
+            self._tiles.pop(key, None)
+
+    def __array__(self, dtype=None, copy=None):
+        dense = np.array(self.base, dtype=self.dtype)
+        size = self.tile_size
+        for (ti, tj), tile in self._tiles.items():
+            dense[ti * size:ti * size + tile.shape[0], tj * size:tj * size + tile.shape[1]] = tile
+        return dense if dtype is None else dense.astype(dtype)
+
+    def min(self):
+        return np.asarray(self).min()
+
+    def max(self):
+        return np.asarray(self).max()
+
+    def copy(self):
+        """같은 원본을 보고 복사한 타일까지 복제한 높이맵"""
+        clone = CopyOnWriteHeightmap(self.base, self.tile_size)
+        clone._tiles = {key: tile.copy() for key, tile in self._tiles.items()}
+        return clone
+
+    def compact(self):
+        """원본과 같은 값인 복사 타일 해제"""
+        size = self.tile_size
+        same = [(ti, tj) for (ti, tj), tile in self._tiles.items()
+                if np.array_equal(tile, np.asarray(self.base[ti * size:ti * size + tile.shape[0],
+                                                             tj * size:tj * size + tile.shape[1]]))]
+        self.release(same)
+        return len(same)
+
+
+class QuantizedHeightmap:
+    """
+    uint16 으로 양자화해 저장하는 높이맵
+
+    0 ~ height_scale 범위를 0 ~ 65535 로 정규화해 저장하고, 인덱싱하면 float32
+    높이값(미터)으로 복원해 반환한다. 대입한 값은 범위로 잘린 뒤 반올림된다.
+    저장소(codes)로는 uint16 ndarray, TiledHeightmap, memmap 을 쓸 수 있다.
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float32)
+
+    def __init__(self, codes, height_scale):
+        """
+        Args:
+            codes: uint16 저장소
+            height_scale (float): 높이 스케일 (65535 에 해당하는 높이)
+        """
+        self.codes = codes
+        self.height_scale = height_scale
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def size(self):
+        return self.codes.size
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"QuantizedHeightmap(height_scale={self.height_scale}, codes={self.codes!r})"
+
+    def __getitem__(self, key):
+        return decode_heights(self.codes[key], "uint16", self.height_scale)
+
+    def __setitem__(self, key, value):
+        self.codes[key] = encode_heights(value, "uint16", self.height_scale)
+
+    def __array__(self, dtype=None, copy=None):
+        heights = decode_heights(np.asarray(self.codes), "uint16", self.height_scale)
+        return heights if dtype is None else heights.astype(dtype)
+
+    def min(self):
+        return decode_heights(self.codes.min(), "uint16", self.height_scale)
+
+    def max(self):
+        return decode_heights(self.codes.max(), "uint16", self.height_scale)
+
+    def copy(self):
+        return QuantizedHeightmap(self.codes.copy(), self.height_scale)
+
+    def tolist(self):
+        return np.asarray(self).tolist()
+
+    def flush(self):
+        """메모리 매핑 저장소의 변경 내용을 디스크에 반영"""
+        if hasattr(self.codes, "flush"):
+            self.codes.flush()
@@ -0,0 +1,243 @@
+# core/history.py
+import zlib
+from collections import deque
+
+import numpy as np
+
+from core.dirty import merge_rects
+
+# 되돌리기 기록의 기본 메모리 상한 (압축된 델타 기준, 바이트)
+DEFAULT_HISTORY_BUDGET = 64 * 1024 * 1024
+
+# 변경 전 높이를 보관하는 타일 한 변의 셀 수
+HISTORY_TILE_SIZE = 64
+
+
+def _bits(values):
+    """부동소수/정수 배열을 같은 크기의 부호 없는 정수 비트열로 보기"""
+    return values.view(np.dtype(f"u{values.dtype.itemsize}"))
+
+
+class HistoryEntry:
+    """
+    되돌리기 한 단계
+
+    변경된 타일마다 변경 전/후 높이의 XOR 델타를 zlib 으로 압축해 보관한다.
+    현재 높이에 델타를 XOR 하면 되돌리기와 다시 실행이 모두 된다.
+    """
+
+    def __init__(self, label, dtype, tiles, rect, nbytes):
+        """
+        Args:
+            label (str): 편집 이름
+            dtype: 델타를 만든 높이 자료형
+            tiles (list): (x0, x1, z0, z1, 압축 델타) 목록
+            rect (tuple): 변경 타일 전체의 경계 상자
+            nbytes (int): 압축 델타 크기 합계
+        """
+        self.label = label
+        self.dtype = np.dtype(dtype)
+        self.tiles = tiles
+        self.rect = rect
+        self.nbytes = nbytes
+
+
+class EditHistory:
+    """
+    지형 편집 되돌리기/다시 실행 기록
+
+    지형의 편집 메서드가 높이맵을 쓰기 전에 편집 범위를 알려 주면(touch),
+    그 범위가 걸친 타일의 변경 전 높이를 처음 한 번만 압축해 둔다.
+    commit 시점에 변경 후 높이와 XOR 한 델타를 압축해 한 단계로 저장하므로
+    한 단계의 크기와 되돌리기 시간은 높이맵 전체가 아닌 편집 면적에 비례한다.
+    압축 델타와 commit 전 스냅샷의 합계가 budget 을 넘으면 가장 오래된 단계부터
+    버리고, 스냅샷만으로 budget 을 넘는 편집은 기록하지 않는다 (이전 기록도 삭제).
+
+    높이맵만 기록하며 terrain_objects 목록은 되돌리지 않는다.
+    """
+
+    def __init__(self, terrain, budget=DEFAULT_HISTORY_BUDGET, tile_size=HISTORY_TILE_SIZE, level=1):
+        """
+        Args:
+            terrain (Terrain): 기록할 지형
+            budget (int): 압축 델타 메모리 상한 (바이트)
+            tile_size (int): 타일 한 변의 셀 수
+            level (int): zlib 압축 수준
+        """
+        self.terrain = terrain
+        self.budget = budget
+        self.tile_size = tile_size
+        self.level = level
+        self.enabled = True
+        self.nbytes = 0
+        self.pending_nbytes = 0
+        self._undo = deque()
+        self._redo = []
+        self._before = {}
+        self._overflow = False
+
+    def _tile_bounds(self, ti, tj):
+        """타일의 높이맵 범위 (x0, x1, z0, z1)"""
+        shape = self.terrain.heightmap.shape
+        ts = self.tile_size
+        return ti * ts, min((ti + 1) * ts, shape[0]), tj * ts, min((tj + 1) * ts, shape[1])
+
+    def touch(self, rect):
+        """
+        편집 직전에 호출: 범위가 걸친 타일의 변경 전 높이 보관
+
+        Args:
+            rect (tuple): (axis0 시작, axis0 끝, axis1 시작, axis1 끝), 끝은 미포함
+        """
+        if not self.enabled or self._overflow or rect[0] >= rect[1] or rect[2] >= rect[3]:
+            return
+        heightmap = self.terrain.heightmap
+        ts = self.tile_size
+        for ti in range(rect[0] // ts, (rect[1] - 1) // ts + 1):
+            for tj in range(rect[2] // ts, (rect[3] - 1) // ts + 1):
+                if (ti, tj) in self._before:
+                    continue
+                # 타일 단위로 바로 압축 (압축 전 복사본은 타일 하나 크기만 유지)
+                x0, x1, z0, z1 = self._tile_bounds(ti, tj)
+                before = np.ascontiguousarray(heightmap[x0:x1, z0:z1])
+                blob = zlib.compress(before.tobytes(), self.level)
+                self._before[(ti, tj)] = (before.dtype, blob)
+                self.pending_nbytes += len(blob)
+            self._evict()
+            if self._overflow:
+                return
+
+    def has_pending(self):
+        """commit 하지 않은 편집이 있는지 여부"""
+        return bool(self._before) or self._overflow
+
+    def commit(self, label=None):
+        """
+        마지막 commit 이후의 편집을 한 단계로 저장 (스트로크 종료 시 호출)
+
+        Args:
+            label (str): 편집 이름
+
+        Returns:
+            HistoryEntry: 저장된 단계, 변경이 없으면 None
+        """
+        if self._overflow:
+            # 기록하지 못한 편집 이전 단계의 델타는 더 이상 현재 높이에 맞지 않음
+            self.clear()
+            return None
+        if not self._before:
+            return None
+
+        heightmap = self.terrain.heightmap
+        tiles = []
+        rect = None
+        nbytes = 0
+        dtype = None
+        for (ti, tj), (before_dtype, before_blob) in self._before.items():
+            x0, x1, z0, z1 = self._tile_bounds(ti, tj)
+            before = np.frombuffer(zlib.decompress(before_blob), dtype=before_dtype).reshape(x1 - x0, z1 - z0)
+            after = np.asarray(heightmap[x0:x1, z0:z1], dtype=before.dtype)
+            delta = _bits(before) ^ _bits(np.ascontiguousarray(after))
+            if not delta.any():
+                continue
+            blob = zlib.compress(delta.tobytes(), self.level)
+            tiles.append((x0, x1, z0, z1, blob))
+            rect = merge_rects(rect, (x0, x1, z0, z1))
+            nbytes += len(blob)
+            dtype = before.dtype
+        self._before = {}
+        self.pending_nbytes = 0
+        if not tiles:
+            return None
+
+        entry = HistoryEntry(label, dtype, tiles, rect, nbytes)
+        self._undo.append(entry)
+        self.nbytes += nbytes
+        self.nbytes -= sum(e.nbytes for e in self._redo)
+        self._redo.clear()
+        self._evict()
+        return entry
+
+    def _evict(self):
+        """
+        메모리 상한을 넘으면 가장 오래된 단계부터 제거
+
+        commit 전 스냅샷만으로도 상한을 넘으면 스냅샷을 버리고 이번 편집을
+        기록하지 않는 상태로 전환한다 (commit 시 기록 전체 삭제).
+        """
+        while self.nbytes + self.pending_nbytes > self.budget and self._undo:
+            self.nbytes -= self._undo.popleft().nbytes
+        if self.nbytes + self.pending_nbytes > self.budget and self._before:
+            self._before = {}
+            self.pending_nbytes = 0
+            self._overflow = True
+
+    def _apply(self, entry):
+        """현재 높이에 단계의 델타를 XOR 해 변경 전/후 상태로 전환"""
+        heightmap = self.terrain.heightmap
+        for x0, x1, z0, z1, blob in entry.tiles:
+            current = np.array(heightmap[x0:x1, z0:z1], dtype=entry.dtype)
+            delta = np.frombuffer(zlib.decompress(blob), dtype=_bits(current).dtype)
+            heightmap[x0:x1, z0:z1] = (_bits(current) ^ delta.reshape(current.shape)).view(entry.dtype)
+        self.terrain.changes.publish(entry.rect)
+
+    def can_undo(self):
+        return bool(self._undo) or bool(self._before)
+
+    def can_redo(self):
+        return bool(self._redo) and not self._before
+
+    def undo(self):
+        """
+        마지막 단계 되돌리기 (commit 하지 않은 편집은 먼저 commit)
+
+        Returns:
+            HistoryEntry: 되돌린 단계, 없으면 None
+        """
+        self.commit()
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._apply(entry)
+        self._redo.append(entry)
+        return entry
+
+    def redo(self):
+        """
+        되돌린 단계 다시 실행
+
+        Returns:
+            HistoryEntry: 다시 실행한 단계, 없으면 None
+        """
+        self.commit()
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._apply(entry)
+        self._undo.append(entry)
+        return entry
+
+    def clear(self):
+        """기록 전체 삭제"""
+        self._undo.clear()
+        self._redo.clear()
+        self._before = {}
+        self._overflow = False
+        self.nbytes = 0
+        self.pending_nbytes = 0
+
+    def stats(self):
+        """
+        기록 사용 통계
+
+        Returns:
+            dict: undo, redo 단계 수, nbytes, budget, pending_tiles, pending_nbytes
+        """
+        return {
+            "undo": len(self._undo),
+            "redo": len(self._redo),
+            "nbytes": self.nbytes,
+            "budget": self.budget,
+            "pending_tiles": len(self._before),
+            "pending_nbytes": self.pending_nbytes,
+        }
@@ -0,0 +1,179 @@
+# core/noise.py
+import numpy as np
+
+# 절차적 지형 생성 방식
+NOISE_TYPES = ("fbm", "ridged", "warped")
+
+# 기본 생성 매개변수
+DEFAULT_NOISE_PARAMS = {
+    "frequency": 0.01,       # 첫 옥타브 주파수 (주기/m)
+    "octaves": 6,            # 옥타브 수
+    "lacunarity": 2.0,       # 옥타브마다 주파수 배율
+    "gain": 0.5,             # 옥타브마다 진폭 배율
+    "warp_strength": 40.0,   # 도메인 워프 이동 거리 (m, "warped" 에서만 사용)
+    "warp_frequency": 0.005, # 도메인 워프 노이즈 주파수 (주기/m)
+}
+
+# 격자점별 기울기 방향 (8방향 단위 벡터)
+_GRADIENTS = np.array([[np.cos(a), np.sin(a)] for a in np.arange(8) * np.pi / 4])
+
+
+def _hash(ix, iz, seed):
+    """
+    정수 격자 좌표와 시드의 32비트 해시
+
+    순열 표 대신 좌표를 직접 해시하므로 격자 범위 제한이나 반복이 없고,
+    어떤 타일에서 계산해도 같은 좌표는 같은 값을 가진다.
+    """
+    with np.errstate(over="ignore"):
+        h = (ix.astype(np.uint32) * np.uint32(0x8DA6B343)) ^ (iz.astype(np.uint32) * np.uint32(0xD8163841))
+        h ^= np.uint32((seed * 0x9E3779B9) & 0xFFFFFFFF)
+        h ^= h >> np.uint32(13)
+        h *= np.uint32(0x5BD1E995)
+        h ^= h >> np.uint32(15)
+    return h
+
+
+def gradient_noise(x, z, seed=0):
+    """
+    2차원 기울기(Perlin) 노이즈 (벡터화)
+
+    Args:
+        x (ndarray): X 좌표 (노이즈 격자 단위)
+        z (ndarray): Z 좌표
+        seed (int): 시드
+
+    Returns:
+        ndarray: 대략 -1 ~ 1 범위의 노이즈 값
+    """
+    x0 = np.floor(x)
+    z0 = np.floor(z)
+    fx = x - x0
+    fz = z - z0
+    ix = x0.astype(np.int64)
+    iz = z0.astype(np.int64)
+
+    def corner(dx, dz):
+        gradient = _GRADIENTS[_hash(ix + dx, iz + dz, seed) & np.uint32(7)]
+        return gradient[..., 0] * (fx - dx) + gradient[..., 1] * (fz - dz)
+
+    # 5차 페이드 곡선으로 보간
+    u = fx * fx * fx * (fx * (fx * 6 - 15) + 10)
+    v = fz * fz * fz * (fz * (fz * 6 - 15) + 10)
+    top = corner(0, 0) + (corner(1, 0) - corner(0, 0)) * u
+    bottom = corner(0, 1) + (corner(1, 1) - corner(0, 1)) * u
+    return (top + (bottom - top) * v) * np.sqrt(2)
+
+
+def fbm(x, z, seed=0, frequency=0.01, octaves=6, lacunarity=2.0, gain=0.5):
+    """
+    fBm (옥타브를 합친 기울기 노이즈)
+
+    Args:
+        x (ndarray): X 좌표 (m)
+        z (ndarray): Z 좌표 (m)
+        seed (int): 시드 (옥타브마다 다른 시드 사용)
+        frequency (float): 첫 옥타브 주파수
+        octaves (int): 옥타브 수
+        lacunarity (float): 주파수 배율
+        gain (float): 진폭 배율
+
+    Returns:
+        ndarray: 대략 -1 ~ 1 범위의 값
+    """
+    total = np.zeros(np.broadcast(x, z).shape)
+    amplitude = 1.0
+    amplitude_sum = 0.0
+    for octave in range(octaves):
+        total += amplitude * gradient_noise(x * frequency, z * frequency, seed + octave * 1013)
+        amplitude_sum += amplitude
+        frequency *= lacunarity
+        amplitude *= gain
+    return total / amplitude_sum
+
+
+def ridged(x, z, seed=0, frequency=0.01, octaves=6, lacunarity=2.0, gain=0.5):
+    """
+    릿지(능선) 멀티프랙탈 노이즈
+
+    각 옥타브의 1 - |노이즈| 를 제곱해 날카로운 능선을 만들고, 앞 옥타브 값으로
+    다음 옥타브를 가중해 능선 위에만 세부가 생기게 한다.
+
+    Returns:
+        ndarray: 대략 -1 ~ 1 범위의 값
+    """
+    total = np.zeros(np.broadcast(x, z).shape)
+    weight = np.ones_like(total)
+    amplitude = 1.0
+    amplitude_sum = 0.0
+    for octave in range(octaves):
+        signal = 1.0 - np.abs(gradient_noise(x * frequency, z * frequency, seed + octave * 1013))
+        signal = signal * signal * weight
+        weight = np.clip(signal * 2.0, 0.0, 1.0)
+        total += amplitude * signal
+        amplitude_sum += amplitude
+        frequency *= lacunarity
+        amplitude *= gain
+    return total / amplitude_sum * 2.0 - 1.0
+
+
+def warped(x, z, seed=0, frequency=0.01, octaves=6, lacunarity=2.0, gain=0.5,
+           warp_strength=40.0, warp_frequency=0.005):
+    """
+    도메인 워프 fBm (좌표를 저주파 노이즈만큼 이동시킨 뒤 fBm 계산)
+
+    Returns:
+        ndarray: 대략 -1 ~ 1 범위의 값
+    """
+    offset_x = fbm(x, z, seed + 7919, warp_frequency, 3)
+    offset_z = fbm(x, z, seed + 104729, warp_frequency, 3)
+    return fbm(x + warp_strength * offset_x, z + warp_strength * offset_z,
+               seed, frequency, octaves, lacunarity, gain)
+
+
+def noise_heights(x, z, height_scale, noise_type="fbm", seed=0, **params):
+    """
+    월드 좌표의 절차적 높이 (0 ~ height_scale)
+
+    값은 좌표, 시드, 매개변수만으로 정해지므로 타일 단위로 나눠 계산해도
+    타일 경계에서 이어지고, 같은 (seed, params) 로 항상 같은 지형이 생성된다.
+
+    Args:
+        x (ndarray): X 좌표 (m)
+        z (ndarray): Z 좌표 (m)
+        height_scale (float): 최대 높이
+        noise_type (str): "fbm", "ridged", "warped"
+        seed (int): 시드
+        **params: DEFAULT_NOISE_PARAMS 의 항목
+
+    Returns:
+        ndarray: 높이값
+    """
+    if noise_type not in NOISE_TYPES:
+        raise ValueError(f"지원하지 않는 노이즈 방식: {noise_type}")
+    settings = dict(DEFAULT_NOISE_PARAMS, **params)
+    if noise_type != "warped":
+        settings.pop("warp_strength")
+        settings.pop("warp_frequency")
+    value = {"fbm": fbm, "ridged": ridged, "warped": warped}[noise_type](x, z, seed, **settings)
+    return np.clip(value * 0.5 + 0.5, 0.0, 1.0) * height_scale
+
+
+def noise_tile(block, origin, width, length, resolution, height_scale, noise_type="fbm", seed=0, params=None):
+    """
+    높이맵 블록의 절차적 높이 (core.parallel.run_tiles 커널 형식)
+
+    Args:
+        block (ndarray): 블록 형태를 정하는 기존 높이 (값은 사용하지 않음)
+        origin (tuple): block[0, 0] 의 높이맵 인덱스
+        width, length, resolution, height_scale: 지형 설정
+        noise_type (str): 노이즈 방식
+        seed (int): 시드
+        params (dict): DEFAULT_NOISE_PARAMS 의 항목
+
+    Returns:
+        ndarray: 블록과 같은 형태의 높이값
+    """
+    xs = (origin[0] + np.arange(block.shape[0])) / resolution - width / 2
+    zs = (origin[1] + np.arange(block.shape[1])) / resolution - length / 2
+    return noise_heights(xs[:, None], zs[None, :], height_scale, noise_type, seed, **(params or {}))
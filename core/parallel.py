@@ -0,0 +1,131 @@
+# core/parallel.py
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.heightmap import create_shared_array, QuantizedHeightmap, COPY_ROWS
+
+# 병렬 처리 기본 타일 크기 (격자 셀)
+DEFAULT_PARALLEL_TILE = 1024
+
+
+def tile_rects(shape, tile_size, halo=0):
+    """
+    격자를 타일로 나누고 타일별 halo 포함 범위 계산
+
+    Args:
+        shape (tuple): 높이맵 형태
+        tile_size (int): 타일 한 변의 셀 수
+        halo (int): 타일 주변에 함께 읽을 셀 수
+
+    Returns:
+        list: ((x0, x1, z0, z1) 타일 범위, (hx0, hx1, hz0, hz1) halo 포함 범위) 목록
+    """
+    rects = []
+    for x0 in range(0, shape[0], tile_size):
+        x1 = min(x0 + tile_size, shape[0])
+        for z0 in range(0, shape[1], tile_size):
+            z1 = min(z0 + tile_size, shape[1])
+            halo_rect = (max(0, x0 - halo), min(shape[0], x1 + halo),
+                         max(0, z0 - halo), min(shape[1], z1 + halo))
+            rects.append(((x0, x1, z0, z1), halo_rect))
+    return rects
+
+
+def _attach(name):
+    """작업 프로세스에서 공유 메모리에 연결 (해제 책임은 생성한 프로세스에 있음)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.12 이하: 작업 프로세스는 부모의 자원 추적기를 함께 쓰므로
+        # 생성한 프로세스의 unlink() 가 등록도 함께 해제한다
+        return shared_memory.SharedMemory(name=name)
+
+
+def _run_tile(task):
+    """
+    작업 프로세스: 타일 하나 처리
+
+    원본 공유 버퍼에서 halo 포함 범위를 읽어 커널을 실행하고, 결과의 타일 범위만
+    대상 공유 버퍼에 기록한다. 배열은 공유 메모리 이름으로만 주고받는다.
+    """
+    source_name, target_name, shape, dtype, rect, halo_rect, kernel, kwargs = task
+    source_shm = _attach(source_name)
+    target_shm = source_shm if target_name == source_name else _attach(target_name)
+    try:
+        source = np.ndarray(shape, dtype=dtype, buffer=source_shm.buf)
+        target = np.ndarray(shape, dtype=dtype, buffer=target_shm.buf)
+        x0, x1, z0, z1 = rect
+        hx0, hx1, hz0, hz1 = halo_rect
+        result = kernel(source[hx0:hx1, hz0:hz1], (hx0, hz0), **kwargs)
+        target[x0:x1, z0:z1] = result[x0 - hx0:x1 - hx0, z0 - hz0:z1 - hz0]
+        del source, target, result
+    finally:
+        source_shm.close()
+        if target_shm is not source_shm:
+            target_shm.close()
+
+
+def run_tiles(terrain, kernel, halo=0, tile_size=DEFAULT_PARALLEL_TILE, max_workers=None, progress=None,
+              **kwargs):
+    """
+    높이맵 전체를 타일 단위로 여러 프로세스에서 처리
+
+    커널은 작업 프로세스에서 kernel(block, origin, **kwargs) 로 호출된다.
+    block 은 halo 를 포함한 타일 범위의 높이 배열(공유 메모리 뷰, 읽기 전용으로 사용),
+    origin 은 block[0, 0] 의 높이맵 인덱스이며, block 과 같은 형태의 결과를 반환한다.
+    커널은 피클 가능하도록 모듈 최상위 함수여야 한다.
+
+    halo 가 0 이면 각 타일이 자기 범위만 읽고 쓰므로 높이맵 버퍼에 바로 기록하고,
+    halo 가 있으면 이웃 타일이 읽는 값이 바뀌지 않도록 별도 공유 버퍼에 기록한 뒤
+    복사한다. 높이맵이 공유 메모리 배열이 아니면 (다른 저장 방식, uint16 양자화)
+    임시 공유 버퍼를 쓴다. 임시 버퍼는 float32 저장소만 float32, 나머지는 float64
+    이므로 커널 결과는 저장 자료형으로 한 번만 반올림되어 순차 계산과 같아진다.
+
+    Args:
+        terrain (Terrain): 대상 지형
+        kernel (callable): 타일 커널
+        halo (int): 타일 주변에 함께 읽을 셀 수
+        tile_size (int): 타일 한 변의 셀 수
+        max_workers (int): 작업 프로세스 수 (None이면 CPU 수)
+        progress (callable): progress(완료 타일 수, 전체 타일 수) 진행 콜백
+        **kwargs: 커널에 전달할 인자 (작은 값만, 배열은 전달하지 않음)
+    """
+    heightmap = terrain.heightmap
+    shape = heightmap.shape
+    created = []
+    try:
+        quantized = isinstance(heightmap, QuantizedHeightmap)
+        if terrain.shared_memory is not None and not quantized:
+            source, source_shm = heightmap, terrain.shared_memory
+        else:
+            dtype = np.float32 if heightmap.dtype == np.float32 and not quantized else np.float64
+            source, source_shm = create_shared_array(shape, dtype)
+            created.append(source_shm)
+            for row in range(0, shape[0], COPY_ROWS):
+                source[row:row + COPY_ROWS] = heightmap[row:row + COPY_ROWS]
+
+        if halo > 0:
+            target, target_shm = create_shared_array(shape, source.dtype)
+            created.append(target_shm)
+        else:
+            target, target_shm = source, source_shm
+
+        tasks = [(source_shm.name, target_shm.name, shape, source.dtype.str, rect, halo_rect, kernel, kwargs)
+                 for rect, halo_rect in tile_rects(shape, tile_size, halo)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # 예외가 있으면 여기서 다시 발생
+            for done, _ in enumerate(executor.map(_run_tile, tasks), start=1):
+                if progress is not None:
+                    progress(done, len(tasks))
+
+        if target is not heightmap:
+            for row in range(0, shape[0], COPY_ROWS):
+                heightmap[row:row + COPY_ROWS] = target[row:row + COPY_ROWS]
+        terrain.changes.publish_all(shape)
+    finally:
+        source = target = None
+        for shm in created:
+            shm.close()
+            shm.unlink()
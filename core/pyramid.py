@@ -0,0 +1,161 @@
+# core/pyramid.py
+import numpy as np
+
+from core.heightmap import COPY_ROWS
+
+
+def level_counts(size, level, start, stop):
+    """
+    레벨 셀이 덮는 원본 격자 셀 수 (한 축)
+
+    Args:
+        size (int): 원본 격자 크기 (해당 축)
+        level (int): 피라미드 레벨 (셀 하나 = 원본 2^level 칸)
+        start (int): 레벨 셀 시작 인덱스
+        stop (int): 레벨 셀 끝 인덱스 (미포함)
+
+    Returns:
+        ndarray: 셀별 원본 셀 수
+    """
+    span = 1 << level
+    offsets = np.arange(start, stop, dtype=np.int64) * span
+    return np.minimum(span, size - offsets)
+
+
+def _reduce_2x2(child_min, child_max, child_mean, weights, parent_weights):
+    """2x2 블록 단위로 최소/최대/가중 평균 축소 (홀수 끝 행/열은 가장자리 복제)"""
+    a, b = child_min.shape
+    pad = ((0, a % 2), (0, b % 2))
+    if a % 2 or b % 2:
+        child_min = np.pad(child_min, pad, mode="edge")
+        child_max = np.pad(child_max, pad, mode="edge")
+    weighted = np.pad(child_mean * weights, pad)
+
+    # 네 개의 부분 격자(짝/홀 행 x 짝/홀 열)를 원소별로 합침
+    parent_min = np.minimum(np.minimum(child_min[0::2, 0::2], child_min[0::2, 1::2]),
+                            np.minimum(child_min[1::2, 0::2], child_min[1::2, 1::2]))
+    parent_max = np.maximum(np.maximum(child_max[0::2, 0::2], child_max[0::2, 1::2]),
+                            np.maximum(child_max[1::2, 0::2], child_max[1::2, 1::2]))
+    parent_mean = (weighted[0::2, 0::2] + weighted[0::2, 1::2] +
+                   weighted[1::2, 0::2] + weighted[1::2, 1::2]) / parent_weights
+    return parent_min, parent_max, parent_mean
+
+
+class HeightPyramid:
+    """
+    높이맵 밉맵(LOD) 피라미드
+
+    레벨 n 의 셀 하나는 원본 격자의 2^n x 2^n 칸을 덮고, 그 범위의 최소/최대/평균
+    높이를 보관한다 (레벨 0 은 높이맵 자체). 최소/최대는 원본 높이를 그대로 담을 수
+    있는 자료형(float64 높이맵이면 float64), 평균은 float32 이다. 변경 알림 버스의
+    "pyramid" 구독자로 편집 범위를 받아, 조회 시점에 그 위쪽 셀만 다시 계산한다.
+    """
+
+    def __init__(self, terrain):
+        """
+        Args:
+            terrain (Terrain): 대상 지형
+        """
+        self.terrain = terrain
+        self._changes = terrain.changes.subscribe("pyramid")
+        self._source = None
+        self.levels = []
+
+    @property
+    def num_levels(self):
+        """레벨 수 (레벨 0 포함, 마지막 레벨은 1x1)"""
+        return (max(self.terrain.heightmap.shape) - 1).bit_length() + 1
+
+    def _build(self):
+        """전체 피라미드 생성"""
+        shape = self.terrain.heightmap.shape
+        extreme_dtype = np.float64 if self.terrain.heightmap.dtype == np.float64 else np.float32
+        self.levels = []
+        for level in range(1, self.num_levels):
+            span = 1 << level
+            level_shape = (-(-shape[0] // span), -(-shape[1] // span))
+            self.levels.append({
+                "min": np.empty(level_shape, dtype=extreme_dtype),
+                "max": np.empty(level_shape, dtype=extreme_dtype),
+                "mean": np.empty(level_shape, dtype=np.float32),
+            })
+        self._source = self.terrain.heightmap
+        self._changes.pull()
+        self._update_rect((0, shape[0], 0, shape[1]))
+
+    def _update_rect(self, rect):
+        """
+        레벨 0 범위 위쪽의 모든 레벨 셀 다시 계산
+
+        레벨마다 자식 행 COPY_ROWS 개 분량의 띠 단위로 계산하므로, 처음 전체를 만들 때도
+        높이맵을 한 번에 읽지 않고 임시 메모리는 띠 크기에 비례한다. 한 레벨을 모두
+        계산한 뒤 다음 레벨로 올라가므로 띠 경계의 부모 셀도 갱신된 자식으로 계산된다.
+        """
+        x0, x1, z0, z1 = rect
+        band = COPY_ROWS // 2
+        for level in range(1, len(self.levels) + 1):
+            # 이 레벨에서 다시 계산할 셀 범위
+            px0, px1 = x0 >> level, ((x1 - 1) >> level) + 1
+            pz0, pz1 = z0 >> level, ((z1 - 1) >> level) + 1
+            for bx0 in range(px0, px1, band):
+                self._update_cells(level, (bx0, min(bx0 + band, px1), pz0, pz1))
+
+    def _update_cells(self, level, cells_rect):
+        """레벨 셀 범위를 바로 아래 레벨(레벨 1 이면 높이맵)에서 다시 계산"""
+        shape = self.terrain.heightmap.shape
+        px0, px1, pz0, pz1 = cells_rect
+        child_shape = (-(-shape[0] // (1 << (level - 1))), -(-shape[1] // (1 << (level - 1))))
+        cx0, cx1 = 2 * px0, min(2 * px1, child_shape[0])
+        cz0, cz1 = 2 * pz0, min(2 * pz1, child_shape[1])
+
+        if level == 1:
+            child_min = np.asarray(self.terrain.heightmap[cx0:cx1, cz0:cz1], dtype=np.float64)
+            child_max = child_mean = child_min
+        else:
+            child = self.levels[level - 2]
+            child_min = child["min"][cx0:cx1, cz0:cz1]
+            child_max = child["max"][cx0:cx1, cz0:cz1]
+            child_mean = child["mean"][cx0:cx1, cz0:cz1].astype(np.float64)
+
+        weights = (level_counts(shape[0], level - 1, cx0, cx1)[:, None] *
+                   level_counts(shape[1], level - 1, cz0, cz1)[None, :])
+        parent_weights = (level_counts(shape[0], level, px0, px1)[:, None] *
+                          level_counts(shape[1], level, pz0, pz1)[None, :])
+        parent_min, parent_max, parent_mean = _reduce_2x2(
+            child_min, child_max, child_mean, weights, parent_weights)
+
+        cells = self.levels[level - 1]
+        cells["min"][px0:px1, pz0:pz1] = parent_min
+        cells["max"][px0:px1, pz0:pz1] = parent_max
+        cells["mean"][px0:px1, pz0:pz1] = parent_mean
+
+    def refresh(self):
+        """쌓인 편집 범위 위쪽의 셀만 갱신 (높이맵이 교체되었으면 전체 재생성)"""
+        if self._source is not self.terrain.heightmap:
+            self._build()
+            return
+        for rect in self._changes.pull():
+            self._update_rect(rect)
+
+    def get_level(self, n, window=None):
+        """
+        피라미드 레벨 반환
+
+        Args:
+            n (int): 레벨 (0 = 원본 해상도, 1 = 1/2, 2 = 1/4 ...)
+            window (tuple): (i0, i1, j0, j1) 레벨 셀 범위 (끝 미포함, None이면 전체).
+                            레벨 0 은 높이맵에서 이 범위만 읽는다.
+
+        Returns:
+            dict: "min", "max", "mean" 배열 (셀 [i, j] = 원본 [i*2^n:(i+1)*2^n, j*2^n:(j+1)*2^n],
+                  window 를 주면 그 범위의 부분 배열). 레벨 1 이상의 배열은 갱신 시
+                  제자리에서 바뀌므로 읽기 전용으로 사용한다.
+        """
+        if not 0 <= n < self.num_levels:
+            raise ValueError(f"피라미드 레벨 범위 초과: {n} (0 ~ {self.num_levels - 1})")
+        cells = slice(None) if window is None else (slice(window[0], window[1]), slice(window[2], window[3]))
+        if n == 0:
+            heights = np.asarray(self.terrain.heightmap[cells])
+            return {"min": heights, "max": heights, "mean": heights}
+        self.refresh()
+        return {key: values[cells] for key, values in self.levels[n - 1].items()}
@@ -0,0 +1,192 @@
+# core/quadtree.py
+import numpy as np
+
+
+def _slab(origin, direction, low, high):
+    """
+    광선과 한 축 구간 [low, high] 의 교차 매개변수 범위
+
+    Returns:
+        tuple: (진입 t, 이탈 t) 배열, 교차하지 않으면 진입 > 이탈
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t1 = (low - origin) / direction
+        t2 = (high - origin) / direction
+    t_min = np.minimum(t1, t2)
+    t_max = np.maximum(t1, t2)
+
+    # 축과 평행한 광선은 구간 안에 있으면 항상, 밖이면 전혀 교차하지 않음
+    parallel = direction == 0
+    if parallel.any():
+        inside = (origin >= low) & (origin <= high)
+        t_min = np.where(parallel, np.where(inside, -np.inf, np.inf), t_min)
+        t_max = np.where(parallel, np.where(inside, np.inf, -np.inf), t_max)
+    return t_min, t_max
+
+
+class MinMaxQuadtree:
+    """
+    최소/최대 높이 쿼드트리 (영역 질의, 광선 피킹)
+
+    높이맵 피라미드(HeightPyramid)의 min/max 레벨을 쿼드트리 노드로 사용하므로
+    편집 범위는 피라미드와 함께 갱신된다. 레벨 n 의 노드 (i, j) 는 격자 셀
+    [i*2^n, (i+1)*2^n) x [j*2^n, (j+1)*2^n) 을 덮는다.
+
+    광선 피킹에서 격자 셀 (i, j) 는 get_height_at_point 와 같이 월드 좌표
+    [i/해상도, (i+1)/해상도) 범위의 높이 heightmap[i, j] 기둥으로 취급한다.
+    """
+
+    def __init__(self, terrain):
+        """
+        Args:
+            terrain (Terrain): 대상 지형 (terrain.pyramid 사용)
+        """
+        self.terrain = terrain
+
+    def _level_arrays(self, level, key):
+        """레벨의 min 또는 max 배열 (레벨 0 은 높이맵)"""
+        if level == 0:
+            return self.terrain.heightmap
+        return self.terrain.pyramid.levels[level - 1][key]
+
+    def region_min_max(self, x0, x1, z0, z1):
+        """
+        격자 범위의 최소/최대 높이
+
+        범위 가장자리의 정렬되지 않은 행/열만 해당 레벨에서 직접 읽고, 안쪽은
+        한 단계 위 레벨로 올라가며 처리하므로 읽는 셀 수가 범위 둘레에 비례한다.
+
+        Args:
+            x0, x1 (int): axis0 범위 (끝 미포함)
+            z0, z1 (int): axis1 범위 (끝 미포함)
+
+        Returns:
+            tuple: (최소 높이, 최대 높이), 범위가 비어 있으면 None
+        """
+        shape = self.terrain.heightmap.shape
+        x0, x1 = max(0, x0), min(shape[0], x1)
+        z0, z1 = max(0, z0), min(shape[1], z1)
+        if x0 >= x1 or z0 >= z1:
+            return None
+
+        self.terrain.pyramid.refresh()
+        low, high = np.inf, -np.inf
+        level = 0
+        while x0 < x1 and z0 < z1:
+            mins = self._level_arrays(level, "min")
+            maxs = self._level_arrays(level, "max")
+            strips = []
+            if x0 % 2:
+                strips.append((x0, x0 + 1, z0, z1))
+                x0 += 1
+            if x1 % 2 and x0 < x1:
+                strips.append((x1 - 1, x1, z0, z1))
+                x1 -= 1
+            if z0 % 2 and x0 < x1:
+                strips.append((x0, x1, z0, z0 + 1))
+                z0 += 1
+            if z1 % 2 and x0 < x1 and z0 < z1:
+                strips.append((x0, x1, z1 - 1, z1))
+                z1 -= 1
+            for sx0, sx1, sz0, sz1 in strips:
+                low = min(low, float(np.min(mins[sx0:sx1, sz0:sz1])))
+                high = max(high, float(np.max(maxs[sx0:sx1, sz0:sz1])))
+
+            if level + 1 >= self.terrain.pyramid.num_levels:
+                # 최상위 레벨 (1x1) 에 도달하면 남은 범위를 그대로 읽음
+                if x0 < x1 and z0 < z1:
+                    low = min(low, float(np.min(mins[x0:x1, z0:z1])))
+                    high = max(high, float(np.max(maxs[x0:x1, z0:z1])))
+                break
+            x0, x1, z0, z1 = x0 // 2, x1 // 2, z0 // 2, z1 // 2
+            level += 1
+        return low, high
+
+    def raycast_batch(self, origins, directions):
+        """
+        여러 광선과 지형의 첫 교차점 (벡터화)
+
+        최상위 노드에서 시작해 레벨마다 광선이 지나는 노드의 네 자식 중 광선이
+        최대 높이 아래로 들어가는 것만 남긴다. 광선이 노드의 최소 높이 아래로
+        들어가는 지점은 교차점의 상한이 되므로, 그보다 먼 노드는 버린다.
+
+        Args:
+            origins (array-like): (n, 3) 광선 시작점 (x, y, z) 월드 좌표
+            directions (array-like): (n, 3) 광선 방향
+
+        Returns:
+            tuple: (교차 여부 bool 배열, 광선 매개변수 t 배열, (n, 3) 교차점 배열)
+                   교차하지 않은 광선의 t 와 교차점은 inf / nan
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype=np.float64))
+        directions = np.atleast_2d(np.asarray(directions, dtype=np.float64))
+        n_rays = len(origins)
+        terrain = self.terrain
+        pyramid = terrain.pyramid
+        pyramid.refresh()
+        shape = terrain.heightmap.shape
+
+        best_t = np.full(n_rays, np.inf)
+        level = pyramid.num_levels - 1
+        ray = np.arange(n_rays)
+        node_i = np.zeros(n_rays, dtype=np.int64)
+        node_j = np.zeros(n_rays, dtype=np.int64)
+
+        while len(ray):
+            span = 1 << level
+            top = np.asarray(self._level_arrays(level, "max")[node_i, node_j], dtype=np.float64)
+            bottom = np.asarray(self._level_arrays(level, "min")[node_i, node_j], dtype=np.float64)
+
+            # 노드 기둥 (월드 좌표 상자, 아래쪽은 무한) 과 광선의 교차
+            x_low = node_i * span / terrain.resolution - terrain.width / 2
+            x_high = np.minimum((node_i + 1) * span, shape[0]) / terrain.resolution - terrain.width / 2
+            z_low = node_j * span / terrain.resolution - terrain.length / 2
+            z_high = np.minimum((node_j + 1) * span, shape[1]) / terrain.resolution - terrain.length / 2
+            o, d = origins[ray], directions[ray]
+            tx0, tx1 = _slab(o[:, 0], d[:, 0], x_low, x_high)
+            ty0, ty1 = _slab(o[:, 1], d[:, 1], -np.inf, top)
+            tz0, tz1 = _slab(o[:, 2], d[:, 2], z_low, z_high)
+            t_enter_xz = np.maximum(np.maximum(tx0, tz0), 0.0)
+            t_exit_xz = np.minimum(tx1, tz1)
+            t_enter = np.maximum(t_enter_xz, ty0)
+            hit = t_enter <= np.minimum(t_exit_xz, ty1)
+
+            if level == 0:
+                np.minimum.at(best_t, ray[hit], t_enter[hit])
+                break
+
+            # 노드 최소 높이 아래로 들어가는 지점까지는 반드시 교차 (상한 갱신)
+            by0, by1 = _slab(o[:, 1], d[:, 1], -np.inf, bottom)
+            t_below = np.maximum(t_enter_xz, by0)
+            sure = t_below <= np.minimum(t_exit_xz, by1)
+            np.minimum.at(best_t, ray[sure], t_below[sure])
+            hit &= t_enter <= best_t[ray]
+
+            # 교차한 노드의 자식 노드로 확장 (격자 밖 자식 제외)
+            ray, node_i, node_j = ray[hit], node_i[hit], node_j[hit]
+            child_shape = (-(-shape[0] // (span // 2)), -(-shape[1] // (span // 2)))
+            ray = np.repeat(ray, 4)
+            node_i = np.repeat(node_i * 2, 4) + np.tile([0, 0, 1, 1], len(node_i))
+            node_j = np.repeat(node_j * 2, 4) + np.tile([0, 1, 0, 1], len(node_j))
+            inside = (node_i < child_shape[0]) & (node_j < child_shape[1])
+            ray, node_i, node_j = ray[inside], node_i[inside], node_j[inside]
+            level -= 1
+
+        hits = np.isfinite(best_t)
+        points = np.full((n_rays, 3), np.nan)
+        points[hits] = origins[hits] + directions[hits] * best_t[hits, None]
+        return hits, best_t, points
+
+    def raycast(self, origin, direction):
+        """
+        광선과 지형의 첫 교차점
+
+        Args:
+            origin (tuple): 광선 시작점 (x, y, z)
+            direction (tuple): 광선 방향 (x, y, z)
+
+        Returns:
+            tuple: 교차점 (x, y, z), 교차하지 않으면 None
+        """
+        hits, _, points = self.raycast_batch([origin], [direction])
+        return tuple(points[0]) if hits[0] else None
@@ -0,0 +1,92 @@
+# core/resample.py
+import numpy as np
+
+from core.sampling import sample_grid, SAMPLE_MODES
+
+# 높이맵 재샘플링 방식 ("area" = 대상 격자점이 덮는 원본 면적의 가중 평균, 축소용)
+RESAMPLE_MODES = SAMPLE_MODES + ("area",)
+
+# 한 번에 계산할 대상 격자 타일 크기
+RESAMPLE_TILE = 512
+
+# Unity 높이맵 해상도 범위 (2^n + 1)
+UNITY_MIN_RESOLUTION = 33
+UNITY_MAX_RESOLUTION = 4097
+
+
+def unity_size(size):
+    """
+    가장 가까운 Unity 높이맵 해상도 (2^n + 1)
+
+    Args:
+        size (int): 현재 격자점 수
+
+    Returns:
+        int: 33 ~ 4097 범위의 2^n + 1
+    """
+    exponent = int(np.round(np.log2(max(size - 1, 1))))
+    return int(np.clip((1 << exponent) + 1, UNITY_MIN_RESOLUTION, UNITY_MAX_RESOLUTION))
+
+
+def _area_weights(start, stop, scale, window_start, window_stop, size):
+    """
+    대상 격자점 [start, stop) 과 원본 격자점 [window_start, window_stop) 의 겹친 길이 (한 축)
+
+    대상 격자점 i 는 원본 좌표 [(i - 0.5) * scale, (i + 0.5) * scale], 원본 격자점 j 는
+    [j - 0.5, j + 0.5] 를 덮고, 둘 다 격자 범위 [-0.5, size - 0.5] 로 제한한다.
+
+    Returns:
+        ndarray: (stop - start, window_stop - window_start) 행 합이 1인 가중치
+    """
+    centers = np.arange(start, stop, dtype=np.float64) * scale
+    half = max(scale, 1.0) / 2
+    low = np.clip(centers - half, -0.5, size - 0.5)[:, None]
+    high = np.clip(centers + half, -0.5, size - 0.5)[:, None]
+    source = np.arange(window_start, window_stop, dtype=np.float64)[None, :]
+    weights = np.clip(np.minimum(high, source + 0.5) - np.maximum(low, source - 0.5), 0.0, None)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def resample_heightmap(source, target, scale, mode="bilinear", chunk_size=RESAMPLE_TILE):
+    """
+    높이맵을 다른 크기의 높이맵으로 재샘플링 (타일 단위)
+
+    대상 격자점 (i, j) 는 원본 격자 좌표 (i * scale[0], j * scale[1]) 의 높이를 받는다.
+    대상 타일마다 그 타일에 필요한 원본 범위(+ 보간 여유 칸)만 읽으므로, 원본과 대상이
+    메모리 매핑/타일 저장소여도 임시 메모리는 타일 크기에 비례한다.
+
+    Args:
+        source: 원본 높이맵 (ndarray, TiledHeightmap 등)
+        target: 결과를 기록할 높이맵 (원본과 같은 인터페이스)
+        scale (tuple): 축별 (대상 격자 1칸 = 원본 격자 scale 칸)
+        mode (str): "nearest", "bilinear", "bicubic", "area"
+        chunk_size (int): 대상 타일 한 변의 격자 수
+    """
+    if mode not in RESAMPLE_MODES:
+        raise ValueError(f"지원하지 않는 재샘플링 방식: {mode}")
+
+    source_shape = source.shape
+    for x0 in range(0, target.shape[0], chunk_size):
+        x1 = min(x0 + chunk_size, target.shape[0])
+        for z0 in range(0, target.shape[1], chunk_size):
+            z1 = min(z0 + chunk_size, target.shape[1])
+
+            # 타일이 참조하는 원본 범위 (bicubic 이웃, area 면적까지 포함)
+            windows = []
+            for axis, (start, stop) in enumerate(((x0, x1), (z0, z1))):
+                reach = max(scale[axis], 1.0) / 2
+                low = int(np.floor(start * scale[axis] - reach)) - 1
+                high = int(np.ceil((stop - 1) * scale[axis] + reach)) + 3
+                windows.append((max(0, low), min(source_shape[axis], high)))
+            (wx0, wx1), (wz0, wz1) = windows
+            block = np.asarray(source[wx0:wx1, wz0:wz1], dtype=np.float64)
+
+            if mode == "area":
+                weights_x = _area_weights(x0, x1, scale[0], wx0, wx1, source_shape[0])
+                weights_z = _area_weights(z0, z1, scale[1], wz0, wz1, source_shape[1])
+                tile = weights_x @ block @ weights_z.T
+            else:
+                gx = np.arange(x0, x1) * scale[0] - wx0
+                gz = np.arange(z0, z1) * scale[1] - wz0
+                tile = sample_grid(block, gx[:, None], gz[None, :], mode)
+            target[x0:x1, z0:z1] = tile
@@ -0,0 +1,272 @@
+# core/rtin.py
+import time
+
+import numpy as np
+
+from core.heightmap import COPY_ROWS
+
+
+def rtin_shape(shape):
+    """
+    격자를 덮는 가장 작은 RTIN 격자 형태 (축마다 2^n + 1)
+
+    Args:
+        shape (tuple): 높이맵 형태
+
+    Returns:
+        tuple: 축별 RTIN 격자점 수 (짧은 축 - 1 크기의 정사각형들로 나뉨)
+    """
+    return tuple((1 << max(1, (size - 2).bit_length())) + 1 for size in shape)
+
+
+def _gather(errors, xs, zs, dx, dz):
+    """격자점 (xs + dx, zs + dz) 의 오차 (격자 밖은 0)"""
+    size_x, size_z = errors.shape
+    gx = xs + dx
+    gz = zs + dz
+    valid_x = (gx >= 0) & (gx < size_x)
+    valid_z = (gz >= 0) & (gz < size_z)
+    values = errors[np.ix_(np.clip(gx, 0, size_x - 1), np.clip(gz, 0, size_z - 1))]
+    return np.where(valid_x[:, None] & valid_z[None, :], values, 0)
+
+
+def _crossing(xs, zs, half, limits):
+    """지지 범위 [m - half, m + half] 가 실제 격자 경계선을 가로지르는 격자점"""
+    cross_x = (xs - half < limits[0]) & (limits[0] < xs + half)
+    cross_z = (zs - half < limits[1]) & (limits[1] < zs + half)
+    return cross_x[:, None] | cross_z[None, :]
+
+
+def _read_lattice(heights, start, stop, step, size_z):
+    """
+    격자점 행 start:stop:step x 열 0:size_z:step 의 float64 높이
+
+    실제 격자 밖 행/열은 마지막 행/열 값으로 채운다 (가장자리 확장).
+    행 묶음만 읽으므로 임시 메모리는 (읽은 행 수 x 열 수) 에 비례한다.
+    """
+    shape = heights.shape
+    rows = np.arange(start, stop, step)
+    inside = rows[rows < shape[0]]
+    if len(inside):
+        block = np.asarray(heights[int(inside[0]):int(inside[-1]) + 1:step], dtype=np.float64)
+    else:
+        block = np.empty((0, shape[1]))
+    if len(inside) < len(rows):
+        last = np.asarray(heights[shape[0] - 1:shape[0]], dtype=np.float64)
+        block = np.concatenate([block, np.repeat(last, len(rows) - len(inside), axis=0)])
+    cols = np.minimum(np.arange(0, size_z, step), shape[1] - 1)
+    return block[:, cols]
+
+
+def rtin_errors(heights, band_rows=COPY_ROWS):
+    """
+    RTIN(직각 삼각형 불규칙 망) 격자점별 근사 오차 계산 (벡터화)
+
+    각 격자점은 어떤 삼각형 빗변의 중점이며, 그 삼각형을 나누지 않았을 때의 높이
+    오차 상한을 보관한다. 부모 평면과 자식 평면의 차이는 자식 안에서 중점 오차를
+    넘지 않으므로 (중점 오차 + 자식 오차 상한 중 최댓값) 은 삼각형 안 모든 격자점의
+    실제 오차 상한이 된다. 상한은 자식보다 항상 크므로 "오차 > 허용치" 인 삼각형만
+    나누면 빗변을 공유하는 이웃 삼각형도 함께 나뉘어 균열이 생기지 않는다.
+
+    크기 2^n 정사각형 단위로 레벨을 올라가며, 한 레벨은 정사각형 변의 중점(빗변 =
+    변)과 정사각형 중심(빗변 = 대각선)을 배열 슬라이스로 계산한다. 격자는 축마다
+    따로 2^n + 1 로 확장하고 (가장자리 값), 맨 위 레벨은 짧은 축 크기의 정사각형
+    여러 개로 나뉜다. 실제 격자 경계를 가로지르는 삼각형은 오차를 무한대로 두어
+    경계에서 항상 나뉘게 한다. 레벨마다 그 레벨 간격의 격자점 행을 band_rows 개씩
+    읽으므로 높이맵 전체를 float64 로 복사하지 않는다.
+
+    Args:
+        heights: 높이맵 (ndarray, TiledHeightmap 등)
+        band_rows (int): 한 번에 읽을 격자점 행 수
+
+    Returns:
+        ndarray: rtin_shape(heights.shape) 형태의 float32 오차
+    """
+    shape = heights.shape
+    size_x, size_z = rtin_shape(shape)
+    tile = min(size_x, size_z) - 1
+    limits = (shape[0] - 1, shape[1] - 1)
+    errors = np.zeros((size_x, size_z), dtype=np.float32)
+    band = max(2, band_rows - band_rows % 2)
+
+    step = 2
+    while step <= tile:
+        half = step // 2
+        quarter = half // 2
+        edges_z = np.arange(0, size_z, step)
+        mids_z = np.arange(half, size_z - 1, step)
+
+        # 변 중점을 모두 계산한 뒤 중심을 계산 (중심의 자식 = 같은 레벨의 변 중점)
+        for kind in ("edges", "centers"):
+            # 띠 = 간격 half 격자점 행 [g0, g1), 이웃 참조를 위해 앞뒤 1행 더 읽음
+            lattice_rows = (size_x - 1) // half + 1
+            for g0 in range(0, lattice_rows, band):
+                g1 = min(g0 + band, lattice_rows)
+                lo, hi = max(0, g0 - 1), min(lattice_rows, g1 + 1)
+                block = _read_lattice(heights, lo * half, hi * half, half, size_z)
+
+                def values(xs, zs, dx=0, dz=0):
+                    """띠 블록에서 격자점 (xs + dx, zs + dz) 의 높이"""
+                    return block[np.ix_((xs + dx) // half - lo, (zs + dz) // half)]
+
+                band_x = np.arange(g0 * half, g1 * half)
+                edges_x = band_x[band_x % step == 0]
+                mids_x = band_x[(band_x % step == half) & (band_x < size_x - 1)]
+
+                if kind == "edges":
+                    # 변 중점: axis0 방향 변 (mids, edges) 과 axis1 방향 변 (edges, mids)
+                    for xs, zs, dx, dz in ((mids_x, edges_z, half, 0), (edges_x, mids_z, 0, half)):
+                        if not len(xs) or not len(zs):
+                            continue
+                        interpolated = (values(xs, zs, -dx, -dz) + values(xs, zs, dx, dz)) / 2
+                        error = np.abs(interpolated - values(xs, zs))
+                        child = np.zeros_like(error)
+                        if quarter:
+                            # 자식 = 변 양쪽 절반 크기 정사각형의 중심
+                            for cx in (-quarter, quarter):
+                                for cz in (-quarter, quarter):
+                                    child = np.maximum(child, _gather(errors, xs, zs, cx, cz))
+                        error = error + child
+                        error[_crossing(xs, zs, half, limits)] = np.inf
+                        errors[np.ix_(xs, zs)] = error
+                    continue
+
+                if not len(mids_x) or not len(mids_z):
+                    continue
+                # 정사각형 중심: (i + j) 가 짝수면 주대각선, 홀수면 반대 대각선이 빗변
+                # (맨 위 레벨은 rtin_triangles 의 뿌리 삼각형과 같이 모두 주대각선)
+                main = (values(mids_x, mids_z, -half, -half) + values(mids_x, mids_z, half, half)) / 2
+                anti = (values(mids_x, mids_z, half, -half) + values(mids_x, mids_z, -half, half)) / 2
+                parity = ((mids_x // step)[:, None] + (mids_z // step)[None, :]) % 2
+                if step == tile:
+                    parity = np.zeros_like(parity)
+                error = np.abs(np.where(parity == 0, main, anti) - values(mids_x, mids_z))
+                # 자식 = 정사각형 네 변의 중점
+                child = np.zeros_like(error)
+                for cx, cz in ((-half, 0), (half, 0), (0, -half), (0, half)):
+                    child = np.maximum(child, _gather(errors, mids_x, mids_z, cx, cz))
+                error = error + child
+                error[_crossing(mids_x, mids_z, half, limits)] = np.inf
+                errors[np.ix_(mids_x, mids_z)] = error
+
+        step *= 2
+    return errors
+
+
+def rtin_triangles(errors, shape, max_error):
+    """
+    허용 오차 안에서 가장 적은 RTIN 삼각형 추출 (레벨 단위 벡터화)
+
+    Args:
+        errors (ndarray): rtin_errors 결과
+        shape (tuple): 실제 높이맵 형태
+        max_error (float): 허용 높이 오차 (높이맵 단위)
+
+    Returns:
+        ndarray: (n, 3, 2) 삼각형 꼭짓점 격자 인덱스 (axis0, axis1)
+    """
+    size_x, size_z = errors.shape
+    tile = min(size_x, size_z) - 1
+    # 맨 위 정사각형마다 주대각선을 빗변으로 하는 뿌리 삼각형 두 개
+    ox, oz = np.meshgrid(np.arange(0, size_x - 1, tile, dtype=np.int32),
+                         np.arange(0, size_z - 1, tile, dtype=np.int32), indexing="ij")
+    ox, oz = ox.ravel(), oz.ravel()
+    # 꼭짓점 a, b (빗변 양 끝), c (직각) 의 좌표를 축별 1차원 배열로 관리
+    ax, az = np.concatenate([ox, ox + tile]), np.concatenate([oz, oz + tile])
+    bx, bz = np.concatenate([ox + tile, ox]), np.concatenate([oz + tile, oz])
+    cx, cz = np.concatenate([ox + tile, ox]), np.concatenate([oz, oz + tile])
+    leaves = []
+    while len(ax):
+        mx = (ax + bx) // 2
+        mz = (az + bz) // 2
+        split = (np.abs(ax - cx) + np.abs(az - cz) > 1) & (errors[mx, mz] > max_error)
+        keep = ~split
+        leaves.append(np.stack([ax[keep], az[keep], bx[keep], bz[keep], cx[keep], cz[keep]], axis=1))
+        ax, az, bx, bz, cx, cz, mx, mz = (v[split] for v in (ax, az, bx, bz, cx, cz, mx, mz))
+        # 자식: (c, a, m), (b, c, m)
+        ax, az, bx, bz, cx, cz = (np.concatenate([cx, bx]), np.concatenate([cz, bz]),
+                                  np.concatenate([ax, cx]), np.concatenate([az, cz]),
+                                  np.concatenate([mx, mx]), np.concatenate([mz, mz]))
+
+    triangles = np.concatenate(leaves).reshape(-1, 3, 2)
+    # 확장 영역(실제 격자 밖)의 삼각형 제외
+    inside = ((triangles[:, :, 0] < shape[0]) & (triangles[:, :, 1] < shape[1])).all(axis=1)
+    return triangles[inside]
+
+
+def rtin_mesh(heights, max_error, errors=None):
+    """
+    높이맵의 적응형 삼각형 메시 (인덱스 버퍼용 정점 번호 부여)
+
+    Args:
+        heights: 높이맵 (ndarray, TiledHeightmap 등, 형태만 사용하고 오차 계산 시 행 묶음으로 읽음)
+        max_error (float): 허용 높이 오차 (높이맵 단위)
+        errors (ndarray): 미리 계산한 rtin_errors 결과 (None이면 계산)
+
+    Returns:
+        tuple: (정점 격자 인덱스 (k, 2) int64, 면 (n, 3) uint32) — 면은 격자 메시
+               (grid_faces) 와 같은 감기 방향
+    """
+    if errors is None:
+        errors = rtin_errors(heights)
+    shape = heights.shape
+    triangles = rtin_triangles(errors, shape, max_error)
+
+    # 격자 메시와 같은 방향으로 감기 (axis0/axis1 평면의 외적이 음수)
+    edge1 = triangles[:, 1] - triangles[:, 0]
+    edge2 = triangles[:, 2] - triangles[:, 0]
+    flip = edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0] > 0
+    triangles[flip] = triangles[flip][:, [0, 2, 1]]
+
+    # 사용된 격자점에만 순서대로 정점 번호 부여 (정렬 없이 격자 크기 표시 배열 사용)
+    keys = triangles[:, :, 0].astype(np.int64) * shape[1] + triangles[:, :, 1]
+    used = np.zeros(shape[0] * shape[1], dtype=bool)
+    used[keys.ravel()] = True
+    numbers = np.cumsum(used, dtype=np.int64) - 1
+    used_keys = np.flatnonzero(used)
+    grid_points = np.stack([used_keys // shape[1], used_keys % shape[1]], axis=1)
+    return grid_points, numbers[keys].astype(np.uint32)
+
+
+def benchmark_rtin(heights, max_errors=(0.01, 0.05, 0.1, 0.5, 1.0)):
+    """
+    허용 오차별 삼각형 감소율과 생성 시간 측정
+
+    Args:
+        heights (ndarray): 높이맵
+        max_errors (tuple): 측정할 허용 오차 (높이맵 단위, 메시 높이 오차는 x height_scale)
+
+    Returns:
+        dict: "error_seconds" (오차 계산 시간), "full_triangles" (격자 메시 삼각형 수),
+              "results" ({"max_error", "triangles", "reduction", "seconds"} 목록)
+    """
+    start = time.perf_counter()
+    errors = rtin_errors(heights)
+    error_seconds = time.perf_counter() - start
+    full = 2 * (heights.shape[0] - 1) * (heights.shape[1] - 1)
+
+    results = []
+    for max_error in max_errors:
+        start = time.perf_counter()
+        _, faces = rtin_mesh(heights, max_error, errors)
+        results.append({
+            "max_error": max_error,
+            "triangles": len(faces),
+            "reduction": 1.0 - len(faces) / full,
+            "seconds": time.perf_counter() - start,
+        })
+    return {"error_seconds": error_seconds, "full_triangles": full, "results": results}
+
+
+if __name__ == "__main__":
+    # python -m core.rtin : 노이즈 지형의 허용 오차별 삼각형 수 출력
+    from core.noise import noise_heights
+
+    for size in (513, 1025, 2049):
+        coords = np.arange(size, dtype=np.float64)
+        heights = noise_heights(coords[:, None], coords[None, :], 50.0, "fbm", seed=1)
+        report = benchmark_rtin(heights)
+        print(f"{size}x{size}: 격자 메시 {report['full_triangles']}개, 오차 계산 {report['error_seconds']:.3f}s")
+        for result in report["results"]:
+            print(f"  허용 오차 {result['max_error']:5.2f} (높이맵 단위): {result['triangles']:>9}개 "
+                  f"({result['reduction'] * 100:5.1f}% 감소), 추출 {result['seconds']:.3f}s")
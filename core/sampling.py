@@ -0,0 +1,89 @@
+# core/sampling.py
+import numpy as np
+
+# 높이 샘플링 보간 방식
+SAMPLE_MODES = ("nearest", "bilinear", "bicubic")
+
+
+def _gather(heightmap, ix, iz):
+    """정수 인덱스 배열 쌍의 높이를 한 번의 점 단위 인덱싱으로 읽기"""
+    ix, iz = np.broadcast_arrays(ix, iz)
+    values = heightmap[ix.ravel(), iz.ravel()]
+    return np.asarray(values, dtype=np.float64).reshape(ix.shape)
+
+
+def catmull_rom_weights(t):
+    """
+    Catmull-Rom 3차 보간 가중치
+
+    Args:
+        t (ndarray): 셀 안의 소수 위치 (0 ~ 1)
+
+    Returns:
+        ndarray: (..., 4) 이웃 -1, 0, +1, +2 의 가중치 (합 = 1)
+    """
+    t2 = t * t
+    t3 = t2 * t
+    return np.stack([
+        -0.5 * t3 + t2 - 0.5 * t,
+        1.5 * t3 - 2.5 * t2 + 1.0,
+        -1.5 * t3 + 2.0 * t2 + 0.5 * t,
+        0.5 * t3 - 0.5 * t2,
+    ], axis=-1)
+
+
+def sample_grid(heightmap, gx, gz, mode="bilinear", fill=None):
+    """
+    격자 좌표의 높이 샘플링 (벡터화)
+
+    격자점 (i, j) 는 좌표 (i, j) 에 있고, 격자 밖 좌표는 fill 이 없으면 가장자리로
+    제한한다.
+
+    Args:
+        heightmap: 높이맵 (ndarray, TiledHeightmap 등 점 단위 인덱싱 지원)
+        gx (ndarray): axis0 격자 좌표
+        gz (ndarray): axis1 격자 좌표
+        mode (str): "nearest" (좌표가 속한 셀), "bilinear", "bicubic" (Catmull-Rom)
+        fill (float): 격자 밖 (0 ~ 크기-1 범위 밖) 좌표의 값 (None이면 가장자리 높이)
+
+    Returns:
+        ndarray: float64 높이 (gx, gz 를 브로드캐스트한 형태)
+    """
+    if mode not in SAMPLE_MODES:
+        raise ValueError(f"지원하지 않는 샘플링 방식: {mode}")
+
+    size_x, size_z = heightmap.shape
+    gx, gz = np.broadcast_arrays(np.asarray(gx, dtype=np.float64), np.asarray(gz, dtype=np.float64))
+    if fill is not None:
+        outside = (gx < 0) | (gx > size_x - 1) | (gz < 0) | (gz > size_z - 1)
+        return np.where(outside, fill, sample_grid(heightmap, gx, gz, mode))
+    gx = np.clip(gx, 0, size_x - 1)
+    gz = np.clip(gz, 0, size_z - 1)
+
+    if mode == "nearest":
+        return _gather(heightmap, gx.astype(np.int64), gz.astype(np.int64))
+
+    # 좌표가 속한 셀의 시작 격자점과 셀 안의 소수 위치
+    ix = np.minimum(np.floor(gx).astype(np.int64), max(size_x - 2, 0))
+    iz = np.minimum(np.floor(gz).astype(np.int64), max(size_z - 2, 0))
+    fx = gx - ix
+    fz = gz - iz
+
+    if mode == "bilinear":
+        ix1 = np.minimum(ix + 1, size_x - 1)
+        iz1 = np.minimum(iz + 1, size_z - 1)
+        corners = _gather(heightmap,
+                          np.stack([ix, ix, ix1, ix1], axis=-1),
+                          np.stack([iz, iz1, iz, iz1], axis=-1))
+        top = corners[..., 0] * (1 - fz) + corners[..., 1] * fz
+        bottom = corners[..., 2] * (1 - fz) + corners[..., 3] * fz
+        return top * (1 - fx) + bottom * fx
+
+    # 4x4 이웃 (가장자리 밖 이웃은 가장자리 격자점으로 제한)
+    offsets = np.arange(-1, 3)
+    nx = np.clip(ix[..., None] + offsets, 0, size_x - 1)
+    nz = np.clip(iz[..., None] + offsets, 0, size_z - 1)
+    values = _gather(heightmap, nx[..., :, None], nz[..., None, :])
+    wx = catmull_rom_weights(fx)
+    wz = catmull_rom_weights(fz)
+    return np.einsum("...i,...ij,...j->...", wx, values, wz)
@@ -1,10 +1,66 @@
 # core/terrain.py
+import copy
+from functools import lru_cache
+
 import numpy as np
 import trimesh
-import math
+from core.dirty import DirtyRegionBus
+from core.history import EditHistory, DEFAULT_HISTORY_BUDGET
+from core.pyramid import HeightPyramid
+from core.quadtree import MinMaxQuadtree
+from core.derived import DerivedMaps
+from core.rtin import rtin_mesh
+from core.collider import (write_heightfield_collider, write_mesh_collider,
+                           heightfield_scale, heightfield_transform, encode_heightfield)
+from core.sampling import sample_grid
+from core.noise import noise_tile
+from core.erosion import erode_block
+from core.filters import filter_block
+from core.resample import resample_heightmap, unity_size, RESAMPLE_TILE
+from core.parallel import run_tiles, DEFAULT_PARALLEL_TILE
+from core.heightmap import (TiledHeightmap, QuantizedHeightmap, quantization_report,
+                            open_heightmap_file, save_heightmap_file, create_shared_array,
+                            COPY_ROWS, HEIGHTMAP_STORAGES, HEIGHTMAP_PRECISIONS, PRECISION_DTYPES)
+from core.brush import (stamp_cache, split_batches, stamp_waves, STAMP_OPS,
+                        FALLOFF_LINEAR, FALLOFF_QUADRATIC)
+
+# 플랫폼 형태 종류
+PLATFORM_SHAPES = ("box", "circle")
+
+
+@lru_cache(maxsize=4)
+def grid_faces(n_rows, n_cols):
+    """
+    격자 메시의 면(삼각형) 인덱스 생성
+
+    각 그리드 셀은 두 개의 삼각형 [v0, v1, v3], [v0, v3, v2] 로 구성된다.
+    결과는 격자 크기별로 캐시되므로 읽기 전용으로 반환한다.
+
+    Args:
+        n_rows (int): 정점 행 수
+        n_cols (int): 정점 열 수
+
+    Returns:
+        ndarray: (2 * (n_rows-1) * (n_cols-1), 3) uint32 배열
+    """
+    v0 = (np.arange(n_rows - 1, dtype=np.uint32)[:, None] * np.uint32(n_cols) +
+          np.arange(n_cols - 1, dtype=np.uint32)[None, :])
+    v1 = v0 + 1
+    v2 = v0 + np.uint32(n_cols)
+    v3 = v2 + 1
+
+    faces = np.empty((n_rows - 1, n_cols - 1, 2, 3), dtype=np.uint32)
+    faces[:, :, 0] = np.stack([v0, v1, v3], axis=-1)
+    faces[:, :, 1] = np.stack([v0, v3, v2], axis=-1)
+    faces = faces.reshape(-1, 3)
+    faces.flags.writeable = False
+    return faces
+
 
 class Terrain:
-    def __init__(self, width=100, length=100, resolution=1.0, height_scale=10.0):
+    def __init__(self, width=100, length=100, resolution=1.0, height_scale=10.0,
+                 storage="dense", tile_size=256, precision="float64", heightmap_path=None,
+                 history_budget=DEFAULT_HISTORY_BUDGET):
         """
         지형 생성 및 편집 클래스
         
@@ -13,7 +69,22 @@ class Terrain:
             length (float): 지형의 길이 (Z축)
             resolution (float): 지형 격자의 해상도 (1.0 = 1미터당 1격자)
             height_scale (float): 높이 스케일 (10.0 = 최대 10미터 높이)
+            storage (str): 높이맵 저장 방식 ("dense" = 단일 배열, "tiled" = 필요한 타일만 할당,
+                           "memmap" = heightmap_path 파일에 메모리 매핑,
+                           "shared" = 병렬 처리 작업 프로세스와 공유하는 메모리)
+            tile_size (int): "tiled" 저장 시 타일 한 변의 셀 수
+            precision (str): 높이 저장 정밀도 ("float64", "float32", "float16",
+                             "uint16" = 0 ~ height_scale 을 65535 단계로 양자화)
+            heightmap_path (str): "memmap" 저장 시 높이맵 .npy 파일 경로 (있으면 그대로 연다)
+            history_budget (int): 되돌리기 기록의 메모리 상한 (바이트)
         """
+        if storage not in HEIGHTMAP_STORAGES:
+            raise ValueError(f"지원하지 않는 높이맵 저장 방식: {storage}")
+        if precision not in HEIGHTMAP_PRECISIONS:
+            raise ValueError(f"지원하지 않는 높이 정밀도: {precision}")
+        if storage == "memmap" and not heightmap_path:
+            raise ValueError("memmap 저장 방식에는 heightmap_path 가 필요합니다")
+
         self.width = width
         self.length = length
         self.resolution = resolution
@@ -24,10 +95,50 @@ class Terrain:
         self.grid_length = int(length * resolution) + 1
         
         # 높이맵 초기화 (모든 값 0)
-        self.heightmap = np.zeros((self.grid_width, self.grid_length))
+        self.storage = storage
+        self.precision = precision
+        self.tile_size = tile_size
+        dtype = PRECISION_DTYPES[precision]
+        self.heightmap_path = heightmap_path if storage == "memmap" else None
+        self.shared_memory = None
+        if storage == "tiled":
+            self.heightmap = TiledHeightmap((self.grid_width, self.grid_length), tile_size, dtype)
+        elif storage == "memmap":
+            self.heightmap = open_heightmap_file(heightmap_path, (self.grid_width, self.grid_length), dtype)
+        elif storage == "shared":
+            self.heightmap, self.shared_memory = create_shared_array((self.grid_width, self.grid_length), dtype)
+        else:
+            self.heightmap = np.zeros((self.grid_width, self.grid_length), dtype=dtype)
+        if precision == "uint16":
+            self.heightmap = QuantizedHeightmap(self.heightmap, height_scale)
         
         # 지형 오브젝트 (플랫폼, 경사로 등) 저장 리스트
         self.terrain_objects = []
+
+        # 브러시 스탬프(감쇠 커널) 캐시
+        self.stamp_cache = stamp_cache
+
+        # 변경 알림 버스 (편집 범위를 미리보기, 메시 등 구독자에게 전달)
+        self.changes = DirtyRegionBus()
+
+        # 되돌리기/다시 실행 기록 (편집 타일의 압축 델타)
+        self.history = EditHistory(self, history_budget)
+
+        # 최소/최대/평균 밉맵 피라미드 (처음 조회할 때 생성, 이후 편집 범위만 갱신)
+        self.pyramid = HeightPyramid(self)
+
+        # 최소/최대 쿼드트리 (피라미드 레벨을 노드로 사용하는 영역 질의, 광선 피킹)
+        self.quadtree = MinMaxQuadtree(self)
+
+        # 법선/경사/곡률 파생 래스터 (처음 조회할 때 계산, 이후 편집 범위만 갱신)
+        self.derived_maps = DerivedMaps(self)
+
+        # 메시 데이터 (update_mesh 에서 생성)
+        self.vertices = None
+        self.faces = None
+        self.normals = None
+        self._mesh_source = None
+        self._mesh_changes = self.changes.subscribe("mesh")
         
         print(f"지형 생성됨: {width}x{length}, 해상도: {resolution}, 그리드 크기: {self.grid_width}x{self.grid_length}")
         print(f"높이맵 형태: {self.heightmap.shape}")
@@ -50,50 +161,520 @@ class Terrain:
         Returns:
         --------
         vertices : ndarray
-            정점 배열
+            정점 배열 (float32, 행 우선 순서)
         faces : ndarray
-            면 배열
-        """
-        # 정점 생성
-        vertices = []
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = col * self.resolution - self.width / 2
-                z = row * self.resolution - self.length / 2
-                y = self.heights[row, col] * self.height_scale
-                vertices.append([x, y, z])
-        vertices = np.array(vertices)
+            면 배열 (uint32, 격자 크기별로 캐시된 읽기 전용 배열)
+        """
+        n_rows, n_cols = self.heightmap.shape
+
+        # 정점 생성 (격자 좌표를 브로드캐스트해 float32 배열에 바로 기록)
+        vertices = np.empty((n_rows, n_cols, 3), dtype=np.float32)
+        vertices[:, :, 0] = (np.arange(n_cols) * self.resolution - self.width / 2)[None, :]
+        vertices[:, :, 1] = np.asarray(self.heights) * self.height_scale
+        vertices[:, :, 2] = (np.arange(n_rows) * self.resolution - self.length / 2)[:, None]
         
-        # 면 생성
-        faces = []
-        for row in range(self.rows - 1):
-            for col in range(self.cols - 1):
-                # 각 그리드 셀은 두 개의 삼각형으로 구성
-                v0 = row * self.cols + col
-                v1 = row * self.cols + col + 1
-                v2 = (row + 1) * self.cols + col
-                v3 = (row + 1) * self.cols + col + 1
-                
-                # 첫 번째 삼각형
-                faces.append([v0, v1, v3])
-                # 두 번째 삼각형
-                faces.append([v0, v3, v2])
-        faces = np.array(faces)
+        # 면 생성 (높이와 무관하므로 격자 크기별로 한 번만 생성)
+        faces = grid_faces(n_rows, n_cols)
         
-        return vertices, faces
+        return vertices.reshape(-1, 3), faces
     
-    def update_mesh(self):
+    def adaptive_mesh(self, max_error):
+        """
+        허용 높이 오차 안에서 삼각형 수를 줄인 적응형 메시 (RTIN, 내보내기용)
+
+        평탄한 영역은 큰 삼각형 몇 개로 합쳐지고, 모든 격자점의 메시 높이(높이 x
+        height_scale) 오차가 max_error 이하로 보장된다. 정점 좌표와 감기 방향은
+        _generate_mesh 와 같다. 높이맵은 행 묶음과 사용된 정점 단위로만 읽는다.
+
+        Args:
+            max_error (float): 허용 높이 오차 (m, 0이면 평면 영역만 합침)
+
+        Returns:
+            tuple: (정점 (k, 3) float32, 면 (n, 3) uint32)
+        """
+        # RTIN 은 높이맵 단위로 계산하므로 허용 오차도 메시 배율만큼 나눔
+        grid_points, faces = rtin_mesh(self.heightmap, max_error / self.height_scale)
+        rows, cols = grid_points[:, 0], grid_points[:, 1]
+
+        vertices = np.empty((len(grid_points), 3), dtype=np.float32)
+        vertices[:, 0] = cols * self.resolution - self.width / 2
+        vertices[:, 1] = np.asarray(self.heightmap[rows, cols], dtype=np.float64) * self.height_scale
+        vertices[:, 2] = rows * self.resolution - self.length / 2
+        return vertices, faces
+
+    def update_mesh(self, full=False):
         """
         높이맵이 변경된 후 메시 업데이트
+
+        이전 메시가 있으면 변경 알림 버스로 받은 범위의 정점 높이만 기존 버퍼에 다시 쓰고,
+        법선은 그 범위와 1셀 테두리만 다시 계산한다.
+
+        Args:
+            full (bool): True면 전체 메시를 다시 생성
         """
-        vertices, faces = self._generate_mesh()
-        self.vertices = vertices
-        self.faces = faces
-        
-        # 메시 속성 업데이트
-        self._cache.clear()
-        self.process()
+        rect = self._mesh_changes.pull_merged()
+
+        # 메시가 없거나 높이맵 배열 자체가 바뀌었으면 전체 재생성
+        if (full or self.vertices is None or self._mesh_source is not self.heightmap or
+                len(self.vertices) != self.heightmap.size):
+            self.vertices, self.faces = self._generate_mesh()
+            self.normals = self._grid_normals(0, self.heightmap.shape[0], 0, self.heightmap.shape[1])
+            self._mesh_source = self.heightmap
+            return
+
+        if rect is None:
+            return
+
+        n_rows, n_cols = self.heightmap.shape
+        row0, row1, col0, col1 = rect
+
+        # 편집 범위의 정점 Y 값만 갱신
+        vertices = self.vertices.reshape(n_rows, n_cols, 3)
+        vertices[row0:row1, col0:col1, 1] = np.asarray(self.heights[row0:row1, col0:col1]) * self.height_scale
+
+        # 중앙 차분은 이웃 셀을 참조하므로 1셀 테두리까지 법선 갱신
+        row0, row1 = max(0, row0 - 1), min(n_rows, row1 + 1)
+        col0, col1 = max(0, col0 - 1), min(n_cols, col1 + 1)
+        normals = self.normals.reshape(n_rows, n_cols, 3)
+        normals[row0:row1, col0:col1] = self._grid_normals(row0, row1, col0, col1).reshape(row1 - row0, col1 - col0, 3)
+
+    def _grid_normals(self, row0, row1, col0, col1):
+        """
+        격자 범위의 정점 법선 계산 (중앙 차분, 격자 가장자리는 단방향 차분)
+
+        Returns:
+            ndarray: ((row1-row0) * (col1-col0), 3) float32 위쪽(+Y) 방향 단위 법선
+        """
+        n_rows, n_cols = self.heightmap.shape
+
+        # 차분에 필요한 1셀 테두리 포함
+        pad_row0, pad_row1 = max(0, row0 - 1), min(n_rows, row1 + 1)
+        pad_col0, pad_col1 = max(0, col0 - 1), min(n_cols, col1 + 1)
+        y = np.asarray(self.heights[pad_row0:pad_row1, pad_col0:pad_col1], dtype=np.float32) * self.height_scale
+
+        # 정점 간격은 메시 좌표와 같은 resolution
+        slope_z = np.gradient(y, self.resolution, axis=0) if y.shape[0] > 1 else np.zeros_like(y)
+        slope_x = np.gradient(y, self.resolution, axis=1) if y.shape[1] > 1 else np.zeros_like(y)
+
+        rows = slice(row0 - pad_row0, row1 - pad_row0)
+        cols = slice(col0 - pad_col0, col1 - pad_col0)
+        normals = np.empty((row1 - row0, col1 - col0, 3), dtype=np.float32)
+        normals[:, :, 0] = -slope_x[rows, cols]
+        normals[:, :, 1] = 1.0
+        normals[:, :, 2] = -slope_z[rows, cols]
+        normals /= np.linalg.norm(normals, axis=2, keepdims=True)
+        return normals.reshape(-1, 3)
+
+    def get_level(self, n, window=None):
+        """
+        높이맵 피라미드 레벨 (미리보기, 썸네일, 저해상도 내보내기용)
+
+        Args:
+            n (int): 레벨 (0 = 원본, n = 2^n 배 축소)
+            window (tuple): (i0, i1, j0, j1) 레벨 셀 범위 (끝 미포함, None이면 전체)
+
+        Returns:
+            dict: "min", "max", "mean" 배열
+        """
+        return self.pyramid.get_level(n, window)
+
+    def derived(self, name):
+        """
+        높이맵 파생 래스터 (경사 기반 텍스처링, 보행 가능 판정 등)
+
+        Args:
+            name (str): "normal" (int16 옥타헤드럴 인코딩, core.derived.decode_octahedral 로 복원),
+                        "slope" (경사각, 도), "curvature" (라플라시안, 1/m)
+
+        Returns:
+            ndarray: 격자와 같은 크기의 래스터 (법선은 (..., 2)), 읽기 전용으로 사용
+        """
+        return self.derived_maps.get(name)
+
+    def region_min_max(self, min_x, max_x, min_z, max_z):
+        """
+        월드 좌표 사각형 영역의 최소/최대 높이
+
+        Args:
+            min_x, max_x (float): X 범위
+            min_z, max_z (float): Z 범위
+
+        Returns:
+            tuple: (최소 높이, 최대 높이), 영역이 격자 밖이면 None
+        """
+        x0 = int(np.floor((min_x + self.width / 2) * self.resolution))
+        x1 = int(np.floor((max_x + self.width / 2) * self.resolution)) + 1
+        z0 = int(np.floor((min_z + self.length / 2) * self.resolution))
+        z1 = int(np.floor((max_z + self.length / 2) * self.resolution)) + 1
+        return self.quadtree.region_min_max(x0, x1, z0, z1)
+
+    def raycast(self, origin, direction):
+        """
+        광선과 지형의 첫 교차점 (피킹용)
+
+        Args:
+            origin (tuple): 광선 시작점 (x, y, z)
+            direction (tuple): 광선 방향 (x, y, z)
+
+        Returns:
+            tuple: 교차점 (x, y, z), 교차하지 않으면 None
+        """
+        return self.quadtree.raycast(origin, direction)
+
+    def raycast_batch(self, origins, directions):
+        """
+        여러 광선의 지형 교차점
+
+        Returns:
+            tuple: (교차 여부, 광선 매개변수 t, (n, 3) 교차점) 배열
+        """
+        return self.quadtree.raycast_batch(origins, directions)
+
+    def _read_region(self, x0, x1, z0, z1):
+        """
+        편집할 높이맵 영역 반환
+
+        float64/float32 dense 저장소면 복사 없는 뷰, 그 밖에는 float32 작업 버퍼
+        (타일 저장소의 복사본, float16/uint16 의 복원값)를 반환하므로 수정 후에는
+        항상 _write_region 으로 저장 자료형에 반영한다.
+        """
+        region = self.heightmap[x0:x1, z0:z1]
+        if region.dtype != np.float64 and region.dtype != np.float32:
+            region = region.astype(np.float32)
+        return region
+
+    def _write_region(self, x0, z0, region):
+        """_read_region 으로 가져와 수정한 영역을 저장소에 반영 (뷰면 생략)"""
+        if isinstance(self.heightmap, np.ndarray) and np.may_share_memory(region, self.heightmap):
+            return
+        self.heightmap[x0:x0 + region.shape[0], z0:z0 + region.shape[1]] = region
+
+    def precision_report(self):
+        """
+        현재 높이맵을 각 저장 정밀도로 저장했을 때의 메모리와 양자화 오차
+
+        Returns:
+            dict: 정밀도별 보고서 (core.heightmap.quantization_report 참고)
+        """
+        return quantization_report(np.asarray(self.heightmap, dtype=np.float64), self.height_scale)
+
+    def close(self):
+        """공유 메모리 저장소 해제 (다른 저장 방식은 무시, 이후 높이맵 사용 불가)"""
+        if self.shared_memory is not None:
+            self.heightmap = None
+            self._mesh_source = None
+            self.shared_memory.close()
+            self.shared_memory.unlink()
+            self.shared_memory = None
+
+    def flush(self):
+        """메모리 매핑 높이맵의 변경 내용을 디스크에 반영 (다른 저장 방식은 무시)"""
+        if hasattr(self.heightmap, "flush"):
+            self.heightmap.flush()
+
+    def get_heightmap_data(self, heightmap_path=None):
+        """
+        프로젝트 저장용 지형 데이터
+
+        Args:
+            heightmap_path (str): 높이맵을 .npy 파일로 따로 저장할 경로.
+                                  None이면 높이맵을 리스트로 포함한다.
+
+        Returns:
+            dict: JSON 저장용 지형 데이터
+        """
+        data = {
+            "width": self.width,
+            "length": self.length,
+            "resolution": self.resolution,
+            "height_scale": self.height_scale,
+            "precision": self.precision,
+            "storage": self.storage,
+            "terrain_objects": self.terrain_objects,
+        }
+        if self.storage == "tiled":
+            data["tile_size"] = self.tile_size
+        if heightmap_path is None:
+            data["heightmap"] = np.asarray(self.heightmap, dtype=np.float64).tolist()
+        else:
+            save_heightmap_file(self.heightmap, heightmap_path)
+            data["heightmap_file"] = heightmap_path
+        return data
+
+    @classmethod
+    def from_heightmap_data(cls, data, heightmap_path=None):
+        """
+        get_heightmap_data 로 저장한 데이터에서 지형 복원
+
+        저장할 때의 정밀도와 저장 방식을 다시 적용한다. 높이맵은 COPY_ROWS 행씩
+        기록하므로 float64 전체 복사본을 만들지 않는다.
+
+        Args:
+            data (dict): get_heightmap_data 결과 (JSON 에서 읽은 값)
+            heightmap_path (str): "heightmap_file" 로 저장된 높이맵 .npy 파일 경로.
+                                  memmap 지형은 이 파일에 그대로 매핑하고, 다른 저장
+                                  방식은 읽기 전용 매핑에서 행 묶음 단위로 복사한다.
+
+        Returns:
+            Terrain: 복원된 지형
+        """
+        settings = {
+            "width": data["width"], "length": data["length"],
+            "resolution": data["resolution"], "height_scale": data["height_scale"],
+            "precision": data.get("precision", "float64"),
+        }
+        storage = data.get("storage", "dense")
+        if heightmap_path is not None and storage == "memmap":
+            terrain = cls(storage="memmap", heightmap_path=heightmap_path, **settings)
+        elif heightmap_path is not None:
+            # 저장값(uint16 은 양자화 코드)을 그대로 복사
+            terrain = cls(storage=storage, tile_size=data.get("tile_size", 256), **settings)
+            target = terrain.heightmap
+            if isinstance(target, QuantizedHeightmap):
+                target = target.codes
+            source = np.load(heightmap_path, mmap_mode="r")
+            if source.shape != target.shape or source.dtype != target.dtype:
+                raise ValueError(f"높이맵 파일 형식 불일치: {heightmap_path} ({source.shape}, {source.dtype}), "
+                                 f"예상 ({target.shape}, {target.dtype})")
+            for row in range(0, source.shape[0], COPY_ROWS):
+                target[row:row + COPY_ROWS] = source[row:row + COPY_ROWS]
+            del source
+        else:
+            # 높이맵 파일 없이 저장된 memmap 지형은 일반 배열로 복원
+            terrain = cls(storage="dense" if storage == "memmap" else storage,
+                          tile_size=data.get("tile_size", 256), **settings)
+            heights = data["heightmap"]
+            for row in range(0, len(heights), COPY_ROWS):
+                terrain.heightmap[row:row + COPY_ROWS] = np.asarray(heights[row:row + COPY_ROWS], dtype=np.float64)
+        terrain.terrain_objects = data.get("terrain_objects", [])
+        return terrain
+
+    def _mark_dirty(self, rect):
+        """
+        편집된 그리드 범위를 변경 알림 버스에 발행
+
+        높이맵을 쓰기 전에 호출해야 되돌리기 기록이 변경 전 높이를 보관할 수 있다.
+
+        Args:
+            rect (tuple): (axis0 시작, axis0 끝, axis1 시작, axis1 끝) 높이맵 인덱스, 끝은 미포함
+        """
+        self.history.touch(rect)
+        self.changes.publish(rect)
     
+    def generate(self, noise_type="fbm", seed=0, chunk_size=512, workers=None, **params):
+        """
+        절차적 노이즈로 높이맵 전체 생성
+
+        chunk_size x chunk_size 격자 단위로 계산해 기록하므로 임시 메모리는 청크
+        크기에만 비례한다. 높이맵 전체를 바꾸므로 되돌리기 기록은 초기화한다.
+        기록한 청크 범위는 변경 알림 버스에 발행만 하고, 메시는 필요할 때
+        (update_mesh, generate_mesh) 그 범위로 갱신된다.
+
+        Args:
+            noise_type (str): "fbm", "ridged", "warped" (도메인 워프)
+            seed (int): 시드 (같은 시드와 매개변수면 항상 같은 지형)
+            chunk_size (int): 한 번에 계산할 격자 청크 크기
+            workers (int): 작업 프로세스 수 (None이면 현재 프로세스에서 순서대로 계산)
+            **params: core.noise.DEFAULT_NOISE_PARAMS 의 항목 (frequency, octaves 등)
+        """
+        self.history.clear()
+        settings = {
+            "width": self.width, "length": self.length, "resolution": self.resolution,
+            "height_scale": self.height_scale, "noise_type": noise_type, "seed": seed, "params": params,
+        }
+        if workers:
+            run_tiles(self, noise_tile, tile_size=chunk_size, max_workers=workers, **settings)
+        else:
+            for x0 in range(0, self.grid_width, chunk_size):
+                x1 = min(x0 + chunk_size, self.grid_width)
+                for z0 in range(0, self.grid_length, chunk_size):
+                    z1 = min(z0 + chunk_size, self.grid_length)
+                    block = np.empty((x1 - x0, z1 - z0))
+                    self.heightmap[x0:x1, z0:z1] = noise_tile(block, (x0, z0), **settings)
+                    self.changes.publish((x0, x1, z0, z1))
+
+    def _region_rect(self, region):
+        """
+        월드 좌표 범위를 격자 범위로 변환 (격자 안으로 제한)
+
+        Args:
+            region (tuple): (min_x, max_x, min_z, max_z), None이면 격자 전체
+
+        Returns:
+            tuple: (x0, x1, z0, z1) 높이맵 인덱스 (끝 미포함), 격자 밖이면 None
+        """
+        if region is None:
+            return 0, self.grid_width, 0, self.grid_length
+        min_x, max_x, min_z, max_z = region
+        x0 = max(0, int(np.floor((min_x + self.width / 2) * self.resolution)))
+        x1 = min(self.grid_width, int(np.floor((max_x + self.width / 2) * self.resolution)) + 1)
+        z0 = max(0, int(np.floor((min_z + self.length / 2) * self.resolution)))
+        z1 = min(self.grid_length, int(np.floor((max_z + self.length / 2) * self.resolution)) + 1)
+        if x0 >= x1 or z0 >= z1:
+            return None
+        return x0, x1, z0, z1
+
+    def erode(self, erosion_type="hydraulic", iterations=50, region=None, workers=None,
+              tile_size=DEFAULT_PARALLEL_TILE, progress=None, **params):
+        """
+        수력/열 침식 적용
+
+        대상 범위 전체를 한 번에 벡터화해 계산한다. workers 를 주면 높이맵 전체를
+        타일로 나눠 여러 프로세스에서 계산하며, 타일마다 2 x iterations 칸의 halo 를
+        함께 읽으므로 결과는 한 번에 계산한 것과 같다. 메시는 발행한 변경 범위로
+        필요할 때 갱신된다.
+
+        Args:
+            erosion_type (str): "hydraulic" (물, 퇴적물, 증발) 또는 "thermal" (안식각 붕괴)
+            iterations (int): 반복 횟수
+            region (tuple): (min_x, max_x, min_z, max_z) 월드 좌표 범위 (None이면 전체,
+                            범위 가장자리는 닫힌 경계로 취급)
+            workers (int): 작업 프로세스 수 (None이면 현재 프로세스, region 이 있으면 무시)
+            tile_size (int): 병렬 처리 타일 크기
+            progress (callable): progress(완료 수, 전체 수) 진행 콜백
+                                 (현재 프로세스면 반복 단위, 병렬이면 타일 단위)
+            **params: core.erosion.DEFAULT_EROSION_PARAMS 의 항목
+        """
+        settings = {"erosion_type": erosion_type, "iterations": iterations,
+                    "cell_size": 1.0 / self.resolution, "params": params}
+        rect = self._region_rect(region)
+        if rect is None:
+            return
+        x0, x1, z0, z1 = rect
+
+        self._mark_dirty(rect)
+        if workers and region is None:
+            run_tiles(self, erode_block, halo=2 * iterations, tile_size=tile_size,
+                      max_workers=workers, progress=progress, **settings)
+        else:
+            # 침식 결과(float64)를 저장 자료형으로 바로 기록 (병렬 계산과 같은 반올림)
+            eroded = erode_block(self.heightmap[x0:x1, z0:z1], (x0, z0), progress=progress, **settings)
+            self.heightmap[x0:x1, z0:z1] = eroded
+
+    def apply_filter(self, filter_type="gaussian", radius=2, region=None, sigma=None, strength=1.0,
+                     workers=None, tile_size=DEFAULT_PARALLEL_TILE):
+        """
+        가우시안/박스/미디언 필터 적용 (지형 전체 스무딩 등)
+
+        대상 범위 주변 radius 칸(halo)까지만 읽으므로 임시 메모리는 범위 + halo 크기에
+        비례하고, 범위 밖 이웃 높이도 반영된다. 큰 가우시안 커널은 FFT 로 계산한다.
+        메시는 발행한 변경 범위로 필요할 때 갱신된다.
+
+        Args:
+            filter_type (str): "gaussian", "box", "median"
+            radius (int): 필터 반경 (셀)
+            region (tuple): (min_x, max_x, min_z, max_z) 월드 좌표 범위 (None이면 전체)
+            sigma (float): 가우시안 표준편차 (셀, None이면 radius / 3)
+            strength (float): 필터 결과의 혼합 비율 (0.0 ~ 1.0)
+            workers (int): 작업 프로세스 수 (None이면 현재 프로세스, region 이 있으면 무시)
+            tile_size (int): 병렬 처리 타일 크기
+        """
+        rect = self._region_rect(region)
+        if rect is None:
+            return
+        x0, x1, z0, z1 = rect
+        settings = {"filter_type": filter_type, "radius": radius, "sigma": sigma, "strength": strength}
+
+        self._mark_dirty(rect)
+        if workers and region is None:
+            run_tiles(self, filter_block, halo=radius, tile_size=tile_size, max_workers=workers, **settings)
+        else:
+            hx0, hx1 = max(0, x0 - radius), min(self.grid_width, x1 + radius)
+            hz0, hz1 = max(0, z0 - radius), min(self.grid_length, z1 + radius)
+            filtered = filter_block(self.heightmap[hx0:hx1, hz0:hz1], (hx0, hz0), **settings)
+            self.heightmap[x0:x1, z0:z1] = filtered[x0 - hx0:x1 - hx0, z0 - hz0:z1 - hz0]
+
+    def resample(self, resolution=None, mode="bilinear", power_of_two=False,
+                 chunk_size=RESAMPLE_TILE, **terrain_kwargs):
+        """
+        다른 해상도로 다시 만든 지형 반환 (현재 지형은 그대로 유지)
+
+        높이맵은 대상 타일 단위로 재샘플링하므로, 대상 저장 방식을 "memmap" 등으로 주면
+        큰 지형(예: 8k -> 4k)도 타일 크기에 비례하는 메모리만 사용한다. 메시는 만들지
+        않으며 필요할 때 (update_mesh, generate_mesh) 생성된다.
+
+        Args:
+            resolution (float): 새 해상도 (격자/m)
+            mode (str): "nearest", "bilinear", "bicubic", "area" (축소 시 면적 평균)
+            power_of_two (bool): True면 resolution 대신 두 축의 격자점 수가 모두 가장 가까운
+                                 2^n + 1 (Unity 높이맵 해상도) 이 되는 해상도 사용. 해상도는
+                                 두 축에 공통이므로 가로/세로 비율이 2의 거듭제곱일 때만
+                                 가능하며, 정사각 Unity 격자는 unity_heightmap 으로 얻는다.
+            chunk_size (int): 재샘플링 타일 크기
+            **terrain_kwargs: 새 Terrain 생성 인자 (storage, precision, heightmap_path 등,
+                              기본값은 현재 지형과 같은 정밀도와 저장 방식)
+
+        Returns:
+            Terrain: 재샘플링된 지형
+        """
+        if power_of_two:
+            sizes = (unity_size(self.grid_width), unity_size(self.grid_length))
+            extents = (self.width, self.length)
+            long_axis = 0 if self.width >= self.length else 1
+            resolution = (sizes[long_axis] - 1) / extents[long_axis]
+            # int(extent * resolution) 가 반올림 오차로 한 칸 작아지지 않도록 보정
+            while int(extents[long_axis] * resolution) + 1 < sizes[long_axis]:
+                resolution = np.nextafter(resolution, np.inf)
+            snapped = tuple(int(extent * resolution) + 1 for extent in extents)
+            if snapped != sizes:
+                raise ValueError(f"두 축을 모두 2^n + 1 로 맞출 수 있는 해상도가 없습니다: "
+                                 f"{self.grid_width}x{self.grid_length} -> {snapped[0]}x{snapped[1]} "
+                                 f"(정사각 Unity 격자는 unity_heightmap 사용)")
+        elif resolution is None:
+            raise ValueError("resolution 또는 power_of_two 가 필요합니다")
+
+        terrain_kwargs.setdefault("precision", self.precision)
+        terrain_kwargs.setdefault("storage", self.storage if self.storage != "memmap" else "dense")
+        terrain = Terrain(self.width, self.length, resolution, self.height_scale, **terrain_kwargs)
+        scale = (self.resolution / resolution, self.resolution / resolution)
+        resample_heightmap(self.heightmap, terrain.heightmap, scale, mode, chunk_size)
+        terrain.terrain_objects = copy.deepcopy(self.terrain_objects)
+        terrain.changes.publish_all(terrain.heightmap.shape)
+        return terrain
+
+    def unity_heightmap(self, size=None, chunk_size=RESAMPLE_TILE):
+        """
+        Unity 높이맵 해상도의 정사각 격자 (size x size, 2^n + 1)
+
+        Unity 지형은 격자 크기와 무관하게 정사각 높이맵을 지형 크기(width x length)에
+        늘려 쓰므로, 축마다 다른 배율로 재샘플링한다 (축소는 면적 평균, 확대는 bilinear).
+        이미 그 크기면 높이맵을 그대로 float64 배열로 반환한다.
+
+        Args:
+            size (int): 한 변의 격자점 수 (None이면 긴 축에 가장 가까운 2^n + 1)
+            chunk_size (int): 재샘플링 타일 크기
+
+        Returns:
+            ndarray: (size, size) float64 높이
+        """
+        shape = self.heightmap.shape
+        if size is None:
+            size = unity_size(max(shape))
+        if shape == (size, size):
+            return np.asarray(self.heightmap, dtype=np.float64)
+        heights = np.empty((size, size))
+        scale = ((shape[0] - 1) / (size - 1), (shape[1] - 1) / (size - 1))
+        mode = "area" if max(scale) > 1 else "bilinear"
+        resample_heightmap(self.heightmap, heights, scale, mode, chunk_size)
+        return heights
+
+    def sample_heights(self, xs, zs, mode="bilinear", fill=None):
+        """
+        여러 위치의 높이값 샘플링 (벡터화)
+
+        Args:
+            xs (array-like): X 좌표 (스칼라 또는 배열)
+            zs (array-like): Z 좌표 (xs 와 브로드캐스트 가능한 형태)
+            mode (str): "nearest" (위치가 속한 격자 셀), "bilinear", "bicubic"
+            fill (float): 격자 밖 위치의 값 (None이면 가장자리 높이)
+
+        Returns:
+            ndarray: 높이값 (xs, zs 를 브로드캐스트한 형태)
+        """
+        gx = (np.asarray(xs, dtype=np.float64) + self.width / 2) * self.resolution
+        gz = (np.asarray(zs, dtype=np.float64) + self.length / 2) * self.resolution
+        return sample_grid(self.heightmap, gx, gz, mode, fill)
+
     def get_height_at_point(self, x, z):
         """
         특정 위치(x, z)의 높이값 반환
@@ -103,67 +684,112 @@ class Terrain:
             z (float): Z 좌표
             
         Returns:
-            float: 해당 위치의 높이값
+            float: 해당 위치의 높이값 (격자 밖이면 0)
         """
-        # 좌표를 그리드 인덱스로 변환
+        # 그리드 범위 내에 있는지 확인 (rows/cols 대신 grid_width/grid_length 사용)
+        # sample_heights(fill=0.0) 는 격자 좌표 0 ~ 크기-1 밖을 0 으로 보지만, 여기서는
+        # 기존대로 int 절삭으로 판정한다 (격자 좌표 -1 ~ 0, 크기-1 ~ 크기 구간도 격자 안)
         grid_x = int((x + self.width / 2) * self.resolution)
         grid_z = int((z + self.length / 2) * self.resolution)
-        
-        # 그리드 범위 내에 있는지 확인 (rows/cols 대신 grid_width/grid_length 사용)
         if 0 <= grid_x < self.grid_width and 0 <= grid_z < self.grid_length:
-            return self.heightmap[grid_x, grid_z]
+            return float(self.sample_heights(x, z, mode="nearest"))
         else:
             return 0
 
-    def modify_height(self, x, z, brush_size, strength, add=True):
+    def _brush_window(self, x, z, brush_size, border=0):
         """
-        특정 위치 주변의 높이를 수정
-        
+        브러시가 영향을 주는 그리드 범위 계산
+
         Args:
             x (float): 중심 X 좌표
             z (float): 중심 Z 좌표
             brush_size (float): 브러시 크기 (반경)
-            strength (float): 높이 변경 강도 (0.0 ~ 1.0)
-            add (bool): True면 높이기, False면 낮추기
+            border (int): 격자 가장자리에서 제외할 셀 수 (스무딩은 1)
+
+        Returns:
+            tuple: (center_x, center_z, grid_radius, min_x, max_x, min_z, max_z)
+                   범위가 비어 있으면 min > max
         """
         # 중심점 그리드 좌표 계산
         center_x = int((x + self.width / 2) * self.resolution)
         center_z = int((z + self.length / 2) * self.resolution)
-        
+
         # 브러시 크기(반경)를 그리드 단위로 변환
         grid_radius = int(brush_size * self.resolution)
-        
+
         # 영향을 받는 그리드 범위 계산
-        min_x = max(0, center_x - grid_radius)
-        max_x = min(self.grid_width - 1, center_x + grid_radius)
-        min_z = max(0, center_z - grid_radius)
-        max_z = min(self.grid_length - 1, center_z + grid_radius)
+        min_x = max(border, center_x - grid_radius)
+        max_x = min(self.grid_width - 1 - border, center_x + grid_radius)
+        min_z = max(border, center_z - grid_radius)
+        max_z = min(self.grid_length - 1 - border, center_z + grid_radius)
+
+        return center_x, center_z, grid_radius, min_x, max_x, min_z, max_z
+
+    def _brush_mask(self, brush_size, window, falloff):
+        """
+        캐시된 브러시 스탬프를 영향 범위에 맞게 잘라 반환
+
+        Args:
+            brush_size (float): 브러시 크기 (반경)
+            window (tuple): _brush_window 반환값
+            falloff (str): 감쇠 곡선
+
+        Returns:
+            tuple: (float32 감쇠값 배열, 반경 내부 여부 배열) - 범위와 같은 형태
+        """
+        center_x, center_z, grid_radius, min_x, max_x, min_z, max_z = window
+
+        # 스탬프 좌표계로 변환 (스탬프의 [0, 0]은 중심 - 반경)
+        kx0 = min_x - (center_x - grid_radius)
+        kz0 = min_z - (center_z - grid_radius)
+        kx1 = kx0 + (max_x - min_x) + 1
+        kz1 = kz0 + (max_z - min_z) + 1
+
+        # 격자 안에 온전히 들어가면 전체 커널, 아니면 잘린 커널
+        clip = (kx0, kx1, kz0, kz1)
+        if clip == (0, 2 * grid_radius + 1, 0, 2 * grid_radius + 1):
+            clip = None
+        return self.stamp_cache.get(brush_size, self.resolution, falloff, clip)
+
+    def modify_height(self, x, z, brush_size, strength, add=True):
+        """
+        특정 위치 주변의 높이를 수정
         
+        Args:
+            x (float): 중심 X 좌표
+            z (float): 중심 Z 좌표
+            brush_size (float): 브러시 크기 (반경)
+            strength (float): 높이 변경 강도 (0.0 ~ 1.0)
+            add (bool): True면 높이기, False면 낮추기
+        """
+        window = self._brush_window(x, z, brush_size)
+        self._modify_window(window, brush_size, strength, add)
+
+    def _modify_window(self, window, brush_size, strength, add):
+        """높이기/낮추기 브러시를 영향 범위에 적용"""
+        center_x, center_z, grid_radius, min_x, max_x, min_z, max_z = window
+        if min_x > max_x or min_z > max_z:
+            return
+        self._mark_dirty((min_x, max_x + 1, min_z, max_z + 1))
+
+        # 거리에 따른 강도 (중심에서 멀어질수록 강도 감소)
+        falloff, inside = self._brush_mask(brush_size, window, FALLOFF_LINEAR)
+
         # 브러시 강도 조정 (0.01 ~ 0.5 범위로)
-        adjusted_strength = strength * 0.1
-        
-        # 해당 영역 내의 모든 그리드 포인트에 대해
-        for grid_x in range(min_x, max_x + 1):
-            for grid_z in range(min_z, max_z + 1):
-                # 중심점과의 거리 계산
-                distance = math.sqrt((grid_x - center_x)**2 + (grid_z - center_z)**2)
-                
-                # 브러시 범위 내에 있는 경우
-                if distance <= grid_radius:
-                    # 거리에 따른 강도 계산 (중심에서 멀어질수록 강도 감소)
-                    falloff = 1.0 - (distance / grid_radius)
-                    effect = adjusted_strength * falloff
-                    
-                    # 높이값 수정
-                    if add:
-                        self.heightmap[grid_x, grid_z] += effect
-                    else:
-                        self.heightmap[grid_x, grid_z] -= effect
-                    
-                    # 높이값 범위 제한 (0 ~ height_scale)
-                    self.heightmap[grid_x, grid_z] = max(0, min(self.height_scale, self.heightmap[grid_x, grid_z]))
+        effect = falloff * (strength * 0.1)
+
+        # 영향 범위의 높이맵 뷰 (복사 없이 제자리 수정)
+        region = self._read_region(min_x, max_x + 1, min_z, max_z + 1)
+        if add:
+            region += effect
+        else:
+            region -= effect
+
+        # 높이값 범위 제한 (0 ~ height_scale), 브러시 반경 내부만
+        np.minimum(region, self.height_scale, out=region, where=inside)
+        np.maximum(region, 0, out=region, where=inside)
+        self._write_region(min_x, min_z, region)
 
-        
     def flatten_area(self, x, z, brush_size):
         """
         특정 영역을 평탄화 (선택된 높이로 설정)
@@ -173,38 +799,28 @@ class Terrain:
             z (float): 중심 Z 좌표
             brush_size (float): 브러시 크기 (반경)
         """
-        # 중심점 그리드 좌표 계산
-        center_x = int((x + self.width / 2) * self.resolution)
-        center_z = int((z + self.length / 2) * self.resolution)
-        
+        window = self._brush_window(x, z, brush_size)
+        center_x, center_z = window[:2]
+
         # 중심점의 현재 높이를 기준으로 함
         target_height = self.heightmap[center_x, center_z]
-        
-        # 브러시 크기(반경)를 그리드 단위로 변환
-        grid_radius = int(brush_size * self.resolution)
-        
-        # 영향을 받는 그리드 범위 계산
-        min_x = max(0, center_x - grid_radius)
-        max_x = min(self.grid_width - 1, center_x + grid_radius)
-        min_z = max(0, center_z - grid_radius)
-        max_z = min(self.grid_length - 1, center_z + grid_radius)
-        
-        # 해당 영역 내의 모든 그리드 포인트에 대해
-        for grid_x in range(min_x, max_x + 1):
-            for grid_z in range(min_z, max_z + 1):
-                # 중심점과의 거리 계산
-                distance = math.sqrt((grid_x - center_x)**2 + (grid_z - center_z)**2)
-                
-                # 브러시 범위 내에 있는 경우
-                if distance <= grid_radius:
-                    # 거리에 따른 가중치 계산 (중심에서 멀어질수록 영향 감소)
-                    falloff = 1.0 - (distance / grid_radius)**2
-                    
-                    # 현재 높이와 타겟 높이 간 보간
-                    self.heightmap[grid_x, grid_z] = (
-                        self.heightmap[grid_x, grid_z] * (1 - falloff) + 
-                        target_height * falloff
-                    )
+        self._flatten_window(window, brush_size, target_height)
+
+    def _flatten_window(self, window, brush_size, target_height):
+        """평탄화 브러시를 영향 범위에 적용"""
+        center_x, center_z, grid_radius, min_x, max_x, min_z, max_z = window
+        if min_x > max_x or min_z > max_z:
+            return
+        self._mark_dirty((min_x, max_x + 1, min_z, max_z + 1))
+
+        # 거리에 따른 가중치 (중심에서 멀어질수록 영향 감소)
+        falloff, _ = self._brush_mask(brush_size, window, FALLOFF_QUADRATIC)
+
+        # 현재 높이와 타겟 높이 간 보간
+        region = self._read_region(min_x, max_x + 1, min_z, max_z + 1)
+        region *= 1 - falloff
+        region += target_height * falloff
+        self._write_region(min_x, min_z, region)
     
     def add_ramp(self, start_x, start_z, end_x, end_z, width, start_height, end_height):
         """
@@ -221,73 +837,140 @@ class Terrain:
         start_height, end_height : float
             시작과 끝의 높이
         """
-        # 방향 벡터 계산
-        dx = end_x - start_x
-        dz = end_z - start_z
-        length = math.sqrt(dx ** 2 + dz ** 2)
-        
-        if length == 0:
+        self.add_ramp_path([(start_x, start_z), (end_x, end_z)], width, [start_height, end_height])
+
+    def add_ramp_path(self, points, width, heights):
+        """
+        꺾은선(여러 구간) 경사로 / 도로 추가
+
+        각 격자점은 가장 가까운 구간 하나에만 반영되므로, 구간이 꺾이는 지점에서도
+        높이가 두 번 보간되지 않는다. 안쪽 정점에서는 투영점을 구간 끝으로 잘라
+        정점까지의 거리를 쓰므로(둥근 이음), 꺾인 바깥쪽에도 빈 곳이 생기지 않는다.
+
+        Parameters:
+        -----------
+        points : array-like
+            꺾은선 정점 좌표 [(x, z), ...]
+        width : float
+            경사로 너비
+        heights : array-like
+            정점별 높이 (points 와 같은 길이) 또는 (시작 높이, 끝 높이).
+            두 값만 주면 경로 길이에 비례해 보간
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        heights = np.asarray(heights, dtype=np.float64).ravel()
+        if len(points) < 2:
             return
-            
-        # 단위 방향 벡터
-        dx /= length
-        dz /= length
-        
-        # 수직 벡터 (경사로 너비 방향)
-        nx = -dz
-        nz = dx
-        
+
+        # 구간별 방향 벡터 및 길이
+        seg_dx = np.diff(points[:, 0])
+        seg_dz = np.diff(points[:, 1])
+        seg_length = np.sqrt(seg_dx ** 2 + seg_dz ** 2)
+
+        if len(heights) != len(points):
+            if len(heights) != 2:
+                raise ValueError("heights 는 정점 수와 같거나 (시작, 끝) 두 값이어야 합니다")
+            # 경로 길이에 비례한 정점 높이
+            distance = np.concatenate([[0.0], np.cumsum(seg_length)])
+            ratio = distance / distance[-1] if distance[-1] > 0 else np.zeros(len(points))
+            heights = heights[0] * (1 - ratio) + heights[1] * ratio
+
+        segments = [k for k in range(len(seg_length)) if seg_length[k] != 0]
+        if not segments:
+            return
+
         # 경사로 경계
         half_width = width / 2
-        
-        # 영향을 받는 그리드 범위 계산
-        min_x = min(start_x - half_width, end_x - half_width)
-        max_x = max(start_x + half_width, end_x + half_width)
-        min_z = min(start_z - half_width, end_z - half_width)
-        max_z = max(start_z + half_width, end_z + half_width)
-        
-        min_col = max(0, int((min_x + self.width / 2) / self.resolution))
-        max_col = min(self.cols - 1, int((max_x + self.width / 2) / self.resolution))
-        min_row = max(0, int((min_z + self.length / 2) / self.resolution))
-        max_row = min(self.rows - 1, int((max_z + self.length / 2) / self.resolution))
-        
-        # 각 그리드 포인트에 대해 높이 수정
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                # 그리드 포인트의 월드 좌표
-                x = col * self.resolution - self.width / 2
-                z = row * self.resolution - self.length / 2
-                
-                # 선에 대한 투영 계산
-                t = ((x - start_x) * dx + (z - start_z) * dz) / length
-                
-                # 선분 외부는 무시
-                if t < 0 or t > 1:
-                    continue
-                    
-                # 투영점 계산
-                proj_x = start_x + t * (end_x - start_x)
-                proj_z = start_z + t * (end_z - start_z)
-                
-                # 투영점과의 거리 계산
-                dist = math.sqrt((x - proj_x) ** 2 + (z - proj_z) ** 2)
-                
-                # 경사로 너비 내에 있는 경우에만 수정
-                if dist <= half_width:
-                    # 가중치 계산 (가장자리에 가까울수록 원래 높이에 가깝게)
-                    weight = 1.0 - (dist / half_width) ** 2
-                    
-                    # t값에 따른 높이 보간
-                    ramp_height = start_height * (1 - t) + end_height * t
-                    
-                    # 원래 높이와 보간
-                    original_height = self.heights[row, col]
-                    self.heights[row, col] = original_height * (1 - weight) + ramp_height * weight
-        
+
+        # 구간별 영향 그리드 범위 (행: Z, 열: X)
+        max_rows = min(self.rows, self.heightmap.shape[0])
+        max_cols = min(self.cols, self.heightmap.shape[1])
+        windows = {}
+        for k in segments:
+            (start_x, start_z), (end_x, end_z) = points[k], points[k + 1]
+            min_col = max(0, int((min(start_x, end_x) - half_width + self.width / 2) / self.resolution))
+            max_col = min(max_cols - 1, int((max(start_x, end_x) + half_width + self.width / 2) / self.resolution))
+            min_row = max(0, int((min(start_z, end_z) - half_width + self.length / 2) / self.resolution))
+            max_row = min(max_rows - 1, int((max(start_z, end_z) + half_width + self.length / 2) / self.resolution))
+            if min_col <= max_col and min_row <= max_row:
+                windows[k] = (min_row, max_row + 1, min_col, max_col + 1)
+        if not windows:
+            self.update_mesh()
+            return
+
+        # 모든 구간을 포함하는 범위
+        row0 = min(w[0] for w in windows.values())
+        row1 = max(w[1] for w in windows.values())
+        col0 = min(w[2] for w in windows.values())
+        col1 = max(w[3] for w in windows.values())
+
+        self._mark_dirty((row0, row1, col0, col1))
+
+        # 격자점별 가장 가까운 구간의 거리, 투영 매개변수, 구간 번호
+        best_dist = np.full((row1 - row0, col1 - col0), np.inf)
+        best_t = np.zeros_like(best_dist)
+        best_segment = np.zeros(best_dist.shape, dtype=np.int64)
+
+        for k, (min_row, max_row, min_col, max_col) in windows.items():
+            start_x, start_z = points[k]
+            end_x, end_z = points[k + 1]
+            length = seg_length[k]
+
+            # 단위 방향 벡터
+            dx = seg_dx[k] / length
+            dz = seg_dz[k] / length
+
+            # 그리드 포인트의 월드 좌표
+            x = np.arange(min_col, max_col) * self.resolution - self.width / 2
+            z = np.arange(min_row, max_row) * self.resolution - self.length / 2
+            x = x[None, :]
+            z = z[:, None]
+
+            # 선에 대한 투영 계산
+            t = ((x - start_x) * dx + (z - start_z) * dz) / length
+
+            # 경로 양 끝을 벗어난 점은 제외하고, 안쪽 정점 쪽은 정점까지의 거리 사용
+            on_path = np.ones(t.shape, dtype=bool)
+            if k == segments[0]:
+                on_path &= t >= 0
+            if k == segments[-1]:
+                on_path &= t <= 1
+            t = np.clip(t, 0.0, 1.0)
+
+            # 투영점과의 거리 계산
+            proj_x = start_x + t * (end_x - start_x)
+            proj_z = start_z + t * (end_z - start_z)
+            dist = np.sqrt((x - proj_x) ** 2 + (z - proj_z) ** 2)
+
+            # 경로 위이고 경사로 너비 안이며 지금까지 가장 가까운 구간인 경우
+            rows = slice(min_row - row0, max_row - row0)
+            cols = slice(min_col - col0, max_col - col0)
+            closer = on_path & (dist <= half_width) & (dist < best_dist[rows, cols])
+            best_dist[rows, cols][closer] = dist[closer]
+            best_t[rows, cols][closer] = t[closer]
+            best_segment[rows, cols][closer] = k
+
+        inside = np.isfinite(best_dist)
+        dist = best_dist[inside]
+        t = best_t[inside]
+        segment = best_segment[inside]
+
+        # 가중치 계산 (가장자리에 가까울수록 원래 높이에 가깝게)
+        weight = 1.0 - (dist / half_width) ** 2
+
+        # t값에 따른 높이 보간
+        ramp_height = heights[segment] * (1 - t) + heights[segment + 1] * t
+
+        # 원래 높이와 보간
+        region = self._read_region(row0, row1, col0, col1)
+        original_height = region[inside]
+        region[inside] = original_height * (1 - weight) + ramp_height * weight
+        self._write_region(row0, col0, region)
+
         # 메시 업데이트
         self.update_mesh()
     
-    def add_platform(self, center_x, center_z, width, length, height):
+    def add_platform(self, center_x, center_z, width, length, height, rotation=0.0, shape="box"):
         """
         평평한 플랫폼 추가
         
@@ -297,57 +980,118 @@ class Terrain:
             width (float): 플랫폼 너비 (X축)
             length (float): 플랫폼 길이 (Z축)
             height (float): 플랫폼 높이
+            rotation (float): Y축 기준 회전 각도 (도)
+            shape (str): "box" (사각형) 또는 "circle" (원/타원, width/length 가 지름)
         """
-        # 플랫폼의 모서리 좌표 계산
-        half_width = width / 2
-        half_length = length / 2
-        
-        min_x = center_x - half_width
-        max_x = center_x + half_width
-        min_z = center_z - half_length
-        max_z = center_z + half_length
-        
-        # 그리드 좌표로 변환
-        min_col = max(0, int((min_x + self.width / 2) * self.resolution))
-        max_col = min(self.cols - 1, int((max_x + self.width / 2) * self.resolution))
-        min_row = max(0, int((min_z + self.length / 2) * self.resolution))
-        max_row = min(self.rows - 1, int((max_z + self.length / 2) * self.resolution))
-        
+        self.add_platforms([center_x], [center_z], [width], [length], [height],
+                           rotations=rotation, shapes=shape)
+
+    def add_platforms(self, centers_x, centers_z, widths, lengths, heights, rotations=0.0, shapes="box"):
+        """
+        여러 플랫폼을 한 번의 호출로 추가
+
+        add_platform 을 같은 순서로 반복 호출한 것과 같은 결과를 낸다. 서로 겹치지
+        않는 플랫폼끼리 묶어 한 번에 적용하므로 플랫폼 수백 개도 묶음 몇 번으로 처리된다.
+
+        Args:
+            centers_x, centers_z (array-like): 중심 좌표
+            widths, lengths (array-like): 플랫폼 너비(X축) / 길이(Z축)
+            heights (array-like): 플랫폼 높이
+            rotations (array-like or float): Y축 기준 회전 각도 (도)
+            shapes (array-like or str): "box" 또는 "circle"
+        """
+        centers_x = np.atleast_1d(np.asarray(centers_x, dtype=np.float64))
+        count = len(centers_x)
+        centers_z = np.broadcast_to(np.asarray(centers_z, dtype=np.float64), (count,))
+        widths = np.broadcast_to(np.asarray(widths, dtype=np.float64), (count,))
+        lengths = np.broadcast_to(np.asarray(lengths, dtype=np.float64), (count,))
+        heights = np.broadcast_to(np.asarray(heights, dtype=np.float64), (count,))
+        rotations = np.broadcast_to(np.asarray(rotations, dtype=np.float64), (count,))
+        shapes = np.broadcast_to(np.asarray(shapes), (count,))
+        for shape in np.unique(shapes):
+            if shape not in PLATFORM_SHAPES:
+                raise ValueError(f"지원하지 않는 플랫폼 형태: {shape}")
+
         # 플랫폼 정보 저장
-        platform_object = {
-            "type": "platform",
-            "center": (center_x, height, center_z),
-            "width": width,
-            "length": length
-        }
-        self.terrain_objects.append(platform_object)
-        
-        # 플랫폼 영역을 높이맵에 적용
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                # 그리드 포인트의 실제 월드 좌표
-                x = (col / self.resolution) - (self.width / 2)
-                z = (row / self.resolution) - (self.length / 2)
-                
+        for k in range(count):
+            self.terrain_objects.append({
+                "type": "platform",
+                "center": (float(centers_x[k]), float(heights[k]), float(centers_z[k])),
+                "width": float(widths[k]),
+                "length": float(lengths[k]),
+                "rotation": float(rotations[k]),
+                "shape": str(shapes[k]),
+            })
+
+        # 회전된 플랫폼의 경계 상자 (반 크기)
+        half_width = widths / 2
+        half_length = lengths / 2
+        angle = np.radians(rotations)
+        cos_a = np.cos(angle)
+        sin_a = np.sin(angle)
+        extent_x = np.abs(half_width * cos_a) + np.abs(half_length * sin_a)
+        extent_z = np.abs(half_width * sin_a) + np.abs(half_length * cos_a)
+
+        # 그리드 좌표로 변환
+        min_col = np.maximum(0, np.trunc((centers_x - extent_x + self.width / 2) * self.resolution).astype(np.int64))
+        max_col = np.minimum(self.cols - 1, np.trunc((centers_x + extent_x + self.width / 2) * self.resolution).astype(np.int64))
+        min_row = np.maximum(0, np.trunc((centers_z - extent_z + self.length / 2) * self.resolution).astype(np.int64))
+        max_row = np.minimum(self.rows - 1, np.trunc((centers_z + extent_z + self.length / 2) * self.resolution).astype(np.int64))
+
+        keep = np.flatnonzero((min_col <= max_col) & (min_row <= max_row) &
+                              (half_width > 0) & (half_length > 0))
+        if not len(keep):
+            return
+
+        self._mark_dirty((min_col[keep].min(), max_col[keep].max() + 1,
+                          min_row[keep].min(), max_row[keep].max() + 1))
+
+        # 겹치지 않는 플랫폼끼리 웨이브로 묶어 순서대로 적용
+        boxes = np.stack([min_col[keep], max_col[keep], min_row[keep], max_row[keep]], axis=1)
+        waves = stamp_waves(boxes)
+        order = keep[np.argsort(waves, kind="stable")]
+        splits = np.flatnonzero(np.diff(np.sort(waves, kind="stable"))) + 1
+        for wave in np.split(order, splits):
+            box_cells = (max_col[wave] - min_col[wave] + 1) * (max_row[wave] - min_row[wave] + 1)
+            for start, end in split_batches(box_cells):
+                sel = wave[start:end]
+
+                # 플랫폼별 경계 상자 안의 모든 그리드 포인트
+                nz = max_row[sel] - min_row[sel] + 1
+                cells = (max_col[sel] - min_col[sel] + 1) * nz
+                platform = np.repeat(sel, cells)
+                offset = np.arange(cells.sum()) - np.repeat(np.cumsum(cells) - cells, cells)
+                col = np.repeat(min_col[sel], cells) + offset // np.repeat(nz, cells)
+                row = np.repeat(min_row[sel], cells) + offset % np.repeat(nz, cells)
+
+                # 그리드 포인트의 실제 월드 좌표를 플랫폼 기준 좌표로 변환
+                x = (col / self.resolution) - (self.width / 2) - centers_x[platform]
+                z = (row / self.resolution) - (self.length / 2) - centers_z[platform]
+                local_x = x * cos_a[platform] + z * sin_a[platform]
+                local_z = z * cos_a[platform] - x * sin_a[platform]
+
                 # 가장자리에서 페이드 효과
-                dx = abs(x - center_x) / half_width
-                dz = abs(z - center_z) / half_length
-                
-                # 플랫폼 내부에 있는 경우
-                if dx <= 1.0 and dz <= 1.0:
-                    # 가장자리 부드럽게 처리
-                    edge_factor = min(1.0, (1.0 - dx) * 5) * min(1.0, (1.0 - dz) * 5)
-                    
-                    # 현재 높이와 플랫폼 높이 합성
-                    # 수정: heights -> heightmap
-                    current_height = self.heightmap[col, row]
-                    
-                    # 플랫폼 높이가 현재 높이보다 높은 경우만 적용
-                    if height > current_height:
-                        self.heightmap[col, row] = max(
-                            current_height,
-                            current_height * (1 - edge_factor) + height * edge_factor
-                        )
+                dx = np.abs(local_x) / half_width[platform]
+                dz = np.abs(local_z) / half_length[platform]
+                circle = shapes[platform] == "circle"
+                dr = np.sqrt(dx ** 2 + dz ** 2)
+
+                # 플랫폼 내부에 있는 경우만, 가장자리 부드럽게 처리
+                inside = np.where(circle, dr <= 1.0, (dx <= 1.0) & (dz <= 1.0))
+                edge_factor = np.where(
+                    circle,
+                    np.minimum(1.0, (1.0 - dr) * 5),
+                    np.minimum(1.0, (1.0 - dx) * 5) * np.minimum(1.0, (1.0 - dz) * 5),
+                )
+
+                col, row = col[inside], row[inside]
+                edge_factor = edge_factor[inside]
+                height = heights[platform[inside]]
+
+                # 플랫폼 높이가 현재 높이보다 높은 경우만 적용
+                current_height = self.heightmap[col, row]
+                blended = np.maximum(current_height, current_height * (1 - edge_factor) + height * edge_factor)
+                self.heightmap[col, row] = np.where(height > current_height, blended, current_height)
     
     def smooth_area(self, x, z, brush_size, strength):
         """
@@ -359,70 +1103,336 @@ class Terrain:
             brush_size (float): 브러시 크기 (반경)
             strength (float): 스무딩 강도 (0.0 ~ 1.0)
         """
-        # 중심점 그리드 좌표 계산
-        center_x = int((x + self.width / 2) * self.resolution)
-        center_z = int((z + self.length / 2) * self.resolution)
-        
-        # 브러시 크기(반경)를 그리드 단위로 변환
-        grid_radius = int(brush_size * self.resolution)
-        
-        # 영향을 받는 그리드 범위 계산
-        min_x = max(1, center_x - grid_radius)
-        max_x = min(self.grid_width - 2, center_x + grid_radius)
-        min_z = max(1, center_z - grid_radius)
-        max_z = min(self.grid_length - 2, center_z + grid_radius)
-        
-        # 현재 높이맵 복사 (원본 유지)
-        heightmap_copy = self.heightmap.copy()
-        
-        # 해당 영역 내의 모든 그리드 포인트에 대해
-        for grid_x in range(min_x, max_x + 1):
-            for grid_z in range(min_z, max_z + 1):
-                # 중심점과의 거리 계산
-                distance = math.sqrt((grid_x - center_x)**2 + (grid_z - center_z)**2)
-                
-                # 브러시 범위 내에 있는 경우
-                if distance <= grid_radius:
-                    # 주변 8개 점의 평균 높이 계산
-                    neighbors = [
-                        heightmap_copy[grid_x-1, grid_z-1],
-                        heightmap_copy[grid_x-1, grid_z],
-                        heightmap_copy[grid_x-1, grid_z+1],
-                        heightmap_copy[grid_x, grid_z-1],
-                        heightmap_copy[grid_x, grid_z+1],
-                        heightmap_copy[grid_x+1, grid_z-1],
-                        heightmap_copy[grid_x+1, grid_z],
-                        heightmap_copy[grid_x+1, grid_z+1]
-                    ]
-                    avg_height = sum(neighbors) / len(neighbors)
-                    
-                    # 거리에 따른 강도 계산 (중심에서 멀어질수록 강도 감소)
-                    falloff = 1.0 - (distance / grid_radius)
-                    effect = strength * falloff
-                    
-                    # 현재 높이와 평균 높이 간 보간
-                    self.heightmap[grid_x, grid_z] = (
-                        self.heightmap[grid_x, grid_z] * (1 - effect) + 
-                        avg_height * effect
-                    )
+        # 가장자리 한 칸은 이웃이 없으므로 제외
+        window = self._brush_window(x, z, brush_size, border=1)
+        self._smooth_window(window, brush_size, strength)
+
+    def _smooth_window(self, window, brush_size, strength):
+        """스무딩 브러시를 영향 범위에 적용"""
+        center_x, center_z, grid_radius, min_x, max_x, min_z, max_z = window
+        if min_x > max_x or min_z > max_z:
+            return
+        self._mark_dirty((min_x, max_x + 1, min_z, max_z + 1))
+
+        # 영향 범위 + 1셀 테두리만 복사 (원본 유지)
+        halo = self.heightmap[min_x - 1:max_x + 2, min_z - 1:max_z + 2].copy()
+        size_x = max_x - min_x + 1
+        size_z = max_z - min_z + 1
+
+        # 주변 8개 점의 평균 높이 계산
+        neighbor_sum = np.zeros((size_x, size_z))
+        for dx in (0, 1, 2):
+            for dz in (0, 1, 2):
+                if dx == 1 and dz == 1:
+                    continue
+                neighbor_sum += halo[dx:dx + size_x, dz:dz + size_z]
+        avg_height = neighbor_sum / 8
+
+        # 거리에 따른 강도 계산 (중심에서 멀어질수록 강도 감소)
+        falloff, _ = self._brush_mask(brush_size, window, FALLOFF_LINEAR)
+        effect = strength * falloff
+
+        # 현재 높이와 평균 높이 간 보간
+        region = self._read_region(min_x, max_x + 1, min_z, max_z + 1)
+        region *= 1 - effect
+        region += avg_height * effect
+        self._write_region(min_x, min_z, region)
+    
+    def apply_stamps(self, xs, zs, radii, strengths, op):
+        """
+        여러 브러시 스탬프를 한 번의 호출로 적용 (스크립트 생성, 스트로크 재생용)
+
+        같은 순서로 modify_height / flatten_area / smooth_area 를 반복 호출한 것과
+        같은 결과를 낸다. 높이기/낮추기는 겹치는 스탬프의 효과를 셀별로 누적해
+        한 번에 반영하고, 평탄화/스무딩은 서로 겹치지 않는 스탬프끼리 묶어
+        묶음(웨이브) 단위로 적용한다.
+
+        Args:
+            xs (array-like): 스탬프 중심 X 좌표 배열
+            zs (array-like): 스탬프 중심 Z 좌표 배열
+            radii (array-like or float): 브러시 크기 (반경)
+            strengths (array-like or float): 강도 (평탄화에서는 사용하지 않음)
+            op (str): "raise", "lower", "flatten", "smooth" 중 하나
+        """
+        if op not in STAMP_OPS:
+            raise ValueError(f"지원하지 않는 스탬프 연산: {op}")
+
+        xs = np.atleast_1d(np.asarray(xs, dtype=np.float64))
+        zs = np.atleast_1d(np.asarray(zs, dtype=np.float64))
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), xs.shape)
+        strengths = np.broadcast_to(np.asarray(strengths, dtype=np.float64), xs.shape)
+        if xs.size == 0:
+            return
+
+        # 중심점 그리드 좌표 및 그리드 단위 반경 (단일 브러시 메서드와 같은 변환)
+        center_x = ((xs + self.width / 2) * self.resolution).astype(np.int64)
+        center_z = ((zs + self.length / 2) * self.resolution).astype(np.int64)
+        grid_radius = (radii * self.resolution).astype(np.int64)
+
+        # 스탬프별 영향 범위 (스무딩은 가장자리 한 칸 제외)
+        border = 1 if op == "smooth" else 0
+        min_x = np.maximum(border, center_x - grid_radius)
+        max_x = np.minimum(self.grid_width - 1 - border, center_x + grid_radius)
+        min_z = np.maximum(border, center_z - grid_radius)
+        max_z = np.minimum(self.grid_length - 1 - border, center_z + grid_radius)
+
+        keep = (min_x <= max_x) & (min_z <= max_z)
+        if op == "flatten":
+            # 중심이 격자 밖이면 기준 높이가 없으므로 제외
+            keep &= (center_x >= 0) & (center_x < self.grid_width)
+            keep &= (center_z >= 0) & (center_z < self.grid_length)
+        if not keep.any():
+            return
+
+        self._mark_dirty((min_x[keep].min(), max_x[keep].max() + 1,
+                          min_z[keep].min(), max_z[keep].max() + 1))
+
+        stamps = {
+            "center_x": center_x[keep], "center_z": center_z[keep],
+            "radii": radii[keep], "strengths": strengths[keep],
+            "bounds": (border, self.grid_width - 1 - border, border, self.grid_length - 1 - border),
+        }
+
+        if op in ("raise", "lower"):
+            # 순서대로 구간을 나눠 누적 (구간별 결과 = 순차 적용 결과)
+            counts = self._stamp_cell_counts(stamps["radii"], FALLOFF_LINEAR)
+            for start, end in split_batches(counts):
+                self._accumulate_stamps(stamps, np.arange(start, end), op == "raise")
+            return
+
+        # 평탄화/스무딩: 서로 겹치지 않는 스탬프끼리 웨이브로 묶어 적용
+        boxes = np.stack([min_x[keep] - border, max_x[keep] + border,
+                          min_z[keep] - border, max_z[keep] + border], axis=1)
+        waves = stamp_waves(boxes)
+        order = np.argsort(waves, kind="stable")
+        splits = np.flatnonzero(np.diff(waves[order])) + 1
+        falloff = FALLOFF_QUADRATIC if op == "flatten" else FALLOFF_LINEAR
+        counts = self._stamp_cell_counts(stamps["radii"], falloff)
+        for wave in np.split(order, splits):
+            if len(wave) == 1:
+                # 단독 스탬프는 영향 범위 단위 연산이 더 빠름
+                k = wave[0]
+                size = float(stamps["radii"][k])
+                window = (stamps["center_x"][k], stamps["center_z"][k], grid_radius[keep][k],
+                          min_x[keep][k], max_x[keep][k], min_z[keep][k], max_z[keep][k])
+                if op == "flatten":
+                    target_height = self.heightmap[window[0], window[1]]
+                    self._flatten_window(window, size, target_height)
+                else:
+                    self._smooth_window(window, size, stamps["strengths"][k])
+                continue
+            for start, end in split_batches(counts[wave]):
+                self._blend_stamps(stamps, wave[start:end], falloff, op == "flatten")
+
+    def _stamp_cell_counts(self, radii, falloff):
+        """스탬프별 반경 내부 셀 수"""
+        counts = np.empty(len(radii), dtype=np.int64)
+        for size in np.unique(radii):
+            _, inside = self.stamp_cache.get(float(size), self.resolution, falloff)
+            counts[radii == size] = np.count_nonzero(inside)
+        return counts
+
+    def _stamp_cells(self, stamps, sel, falloff):
+        """
+        선택된 스탬프들이 덮는 셀 목록 생성
+
+        Args:
+            stamps (dict): apply_stamps 에서 정리한 스탬프 배열
+            sel (ndarray): 처리할 스탬프 번호
+            falloff (str): 감쇠 곡선
+
+        Returns:
+            tuple: (셀 x, 셀 z, 감쇠값, 스탬프 번호) 1차원 배열
+        """
+        min_x, max_x, min_z, max_z = stamps["bounds"]
+        radii = stamps["radii"][sel]
+        parts = []
+        for size in np.unique(radii):
+            group = sel[radii == size]
+            weights, inside = self.stamp_cache.get(float(size), self.resolution, falloff)
+            grid_radius = weights.shape[0] // 2
+            kx, kz = np.nonzero(inside)
+
+            center_x = stamps["center_x"][group]
+            center_z = stamps["center_z"][group]
+            cell_x = center_x[:, None] + (kx - grid_radius)
+            cell_z = center_z[:, None] + (kz - grid_radius)
+            cell_weights = np.broadcast_to(weights[kx, kz], cell_x.shape)
+            cell_stamps = np.broadcast_to(group[:, None], cell_x.shape)
+
+            # 격자 가장자리에 걸친 스탬프가 있을 때만 범위 밖 셀 제거
+            if (center_x.min() - grid_radius < min_x or center_x.max() + grid_radius > max_x or
+                    center_z.min() - grid_radius < min_z or center_z.max() + grid_radius > max_z):
+                valid = (cell_x >= min_x) & (cell_x <= max_x) & (cell_z >= min_z) & (cell_z <= max_z)
+                parts.append((cell_x[valid], cell_z[valid], cell_weights[valid], cell_stamps[valid]))
+            else:
+                parts.append((cell_x.ravel(), cell_z.ravel(), cell_weights.ravel(), cell_stamps.ravel()))
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def _accumulate_stamps(self, stamps, sel, add):
+        """
+        높이기/낮추기 스탬프를 셀별로 누적해 한 번에 적용
+
+        순차 적용 시 범위 제한(0 ~ height_scale)은 각 셀에 처음 닿는 스탬프에서만
+        양쪽으로 작용하고 이후에는 진행 방향 한쪽으로만 작용하므로, 첫 스탬프의
+        효과와 나머지 효과의 합으로 순차 적용 결과를 정확히 계산할 수 있다.
+        """
+        cell_x, cell_z, weights, stamp = self._stamp_cells(stamps, sel, FALLOFF_LINEAR)
+        if not len(cell_x):
+            return
+        effect = weights * (stamps["strengths"][stamp] * 0.1)
+
+        # 이번 묶음이 닿는 범위
+        x0, z0 = cell_x.min(), cell_z.min()
+        shape = (cell_x.max() - x0 + 1, cell_z.max() - z0 + 1)
+        flat = (cell_x - x0) * shape[1] + (cell_z - z0)
+        size = shape[0] * shape[1]
+
+        # 셀별 효과 합계
+        total = np.bincount(flat, effect, minlength=size).reshape(shape)
+        region = self._read_region(x0, x0 + shape[0], z0, z0 + shape[1])
+
+        if region.min() >= 0 and region.max() <= self.height_scale:
+            # 모든 높이가 범위 안이면 범위 제한은 합계에 한 번만 적용해도 같음
+            if add:
+                np.minimum(region + total, self.height_scale, out=region)
+            else:
+                np.maximum(region - total, 0, out=region)
+            self._write_region(x0, z0, region)
+            return
+
+        # 범위 밖 높이가 있으면 처음 닿은 스탬프의 효과를 따로 계산
+        first_stamp = np.full(size, len(stamps["radii"]), dtype=np.int64)
+        np.minimum.at(first_stamp, flat, stamp)
+        is_first = stamp == first_stamp[flat]
+        first_effect = np.bincount(flat[is_first], effect[is_first], minlength=size)
+
+        touched = (first_stamp < len(stamps["radii"])).reshape(shape)
+        first_effect = first_effect.reshape(shape)
+        rest = total - first_effect
+
+        if add:
+            first = np.clip(region + first_effect, 0, self.height_scale)
+            result = np.minimum(first + rest, self.height_scale)
+        else:
+            first = np.clip(region - first_effect, 0, self.height_scale)
+            result = np.maximum(first - rest, 0)
+        np.copyto(region, result, where=touched)
+        self._write_region(x0, z0, region)
+
+    def _blend_stamps(self, stamps, sel, falloff, flatten):
+        """
+        서로 겹치지 않는 평탄화/스무딩 스탬프를 한 번에 적용
+
+        Args:
+            stamps (dict): apply_stamps 에서 정리한 스탬프 배열
+            sel (ndarray): 처리할 스탬프 번호 (같은 웨이브)
+            falloff (str): 감쇠 곡선
+            flatten (bool): True면 평탄화, False면 스무딩
+        """
+        cell_x, cell_z, weights, stamp = self._stamp_cells(stamps, sel, falloff)
+        if not len(cell_x):
+            return
+
+        # 이번 묶음이 닿는 범위 (스무딩은 이웃 참조용 1셀 테두리 포함)
+        margin = 0 if flatten else 1
+        x0, z0 = cell_x.min() - margin, cell_z.min() - margin
+        region = self._read_region(x0, cell_x.max() + 1 + margin, z0, cell_z.max() + 1 + margin)
+        cell_x = cell_x - x0
+        cell_z = cell_z - z0
+        current = region[cell_x, cell_z]
+
+        if flatten:
+            # 중심점의 현재 높이를 기준으로 보간
+            targets = self.heightmap[stamps["center_x"], stamps["center_z"]]
+            region[cell_x, cell_z] = current * (1 - weights) + targets[stamp] * weights
+            self._write_region(x0, z0, region)
+            return
+
+        # 주변 8개 점의 평균 높이
+        neighbor_sum = np.zeros(len(cell_x))
+        for dx in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                if dx == 0 and dz == 0:
+                    continue
+                neighbor_sum += region[cell_x + dx, cell_z + dz]
+        effect = weights * stamps["strengths"][stamp]
+        region[cell_x, cell_z] = current * (1 - effect) + (neighbor_sum / 8) * effect
+        self._write_region(x0, z0, region)
     
-    def export_to_obj(self, filepath):
+    def generate_mesh(self, max_error=None):
+        """
+        trimesh 메시 생성
+
+        Args:
+            max_error (float): 적응형 메시 허용 높이 오차 (m, None이면 격자 메시 그대로)
+
+        Returns:
+            trimesh.Trimesh: 지형 메시
+        """
+        if max_error is None:
+            self.update_mesh()
+            vertices, faces = self.vertices, self.faces
+        else:
+            vertices, faces = self.adaptive_mesh(max_error)
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+    def export_to_obj(self, filepath, max_error=None):
         """
         OBJ 파일로 내보내기
+
+        Args:
+            filepath (str): 저장 경로
+            max_error (float): 적응형 메시 허용 높이 오차 (m, None이면 격자 메시 그대로)
         """
-        self.export(filepath)
+        self.generate_mesh(max_error).export(filepath)
     
-    def generate_collider(self):
+    def generate_collider(self, path=None, collider_type="mesh", max_error=None):
         """
         콜라이더 데이터 생성
+
+        배열은 파이썬 리스트로 바꾸지 않고 바이너리 파일(core.collider 형식)에 바로
+        기록하므로, 메모리 사용량은 저장할 배열 크기 수준으로 유지된다.
+
+        Args:
+            path (str): 콜라이더 바이너리 파일 경로 (None이면 임시 파일 없이 배열 반환)
+            collider_type (str): "mesh" (float32 정점 / uint32 면) 또는
+                                 "heightfield" (uint16 높이 샘플 + 배율)
+            max_error (float): 메시 콜라이더를 적응형 메시로 단순화할 허용 높이 오차 (m)
+
+        Returns:
+            dict: "type" ("MeshCollider" / "TerrainCollider") 와 path 가 있으면 JSON 저장용
+                  메타데이터 ("file", 크기 정보), 없으면 배열 ("vertices", "faces" 또는
+                  "heights", "scale", "offset" — core.collider.read_collider 와 같은 구성)
         """
-        # 지형에는 메시 콜라이더 사용
-        return {
-            "type": "MeshCollider",
-            "convex": False,
-            "vertices": self.vertices.tolist(),
-            "faces": self.faces.tolist()
-        }
+        if collider_type == "heightfield":
+            # _generate_mesh 와 같은 변환: 격자점 (i, j) -> (j, 높이, i) x resolution 간격,
+            # 높이 x height_scale, 원점 (-width / 2, -length / 2)
+            height_range = self.quadtree.region_min_max(0, self.grid_width, 0, self.grid_length)
+            origin = (-self.width / 2, -self.length / 2)
+            if path is None:
+                low, scale_y = heightfield_scale(height_range)
+                scale, offset = heightfield_transform(height_range, self.resolution, origin, self.height_scale)
+                return {"type": "TerrainCollider",
+                        "heights": encode_heightfield(self.heightmap, low, scale_y),
+                        "scale": scale, "offset": offset}
+            write_heightfield_collider(path, self.heightmap, height_range, self.resolution, origin,
+                                       self.height_scale)
+            return {"type": "TerrainCollider", "file": path,
+                    "rows": self.grid_width, "cols": self.grid_length}
+
+        if collider_type != "mesh":
+            raise ValueError(f"지원하지 않는 콜라이더 종류: {collider_type}")
+        if max_error is None:
+            self.update_mesh()
+            vertices, faces = self.vertices, self.faces
+        else:
+            vertices, faces = self.adaptive_mesh(max_error)
+        if path is None:
+            return {"type": "MeshCollider", "convex": False, "vertices": vertices, "faces": faces}
+        write_mesh_collider(path, vertices, faces)
+        return {"type": "MeshCollider", "convex": False, "file": path,
+                "vertex_count": len(vertices), "face_count": len(faces)}
     
     def export_heightmap(self, filepath):
         """
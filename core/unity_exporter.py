@@ -16,23 +16,21 @@ class UnityExporter:
             # 디버깅 코드 추가
             print(f"UnityExporter.export called with terrain: {terrain}, filepath: {filepath}")
             
-            # 지형 데이터 가져오기 (명시적으로 인자 없이 호출)
-            terrain_data = terrain.export_heightmap()
-            
-            # 디버깅 코드 추가
-            print(f"Terrain data obtained: {terrain_data.keys() if terrain_data else 'None'}")
+            # Unity 높이맵은 (2^n + 1) 정사각형이므로, 먼저 그 크기로 재샘플링한 격자만
+            # 리스트로 변환해 내보냄 (임포터가 크기를 맞추며 잘라내지 않도록)
+            heightmap = terrain.unity_heightmap()
             
             # Unity용 데이터 구조 생성
             unity_data = {
                 "version": "1.0",
                 "terrain": {
-                    "width": terrain_data["width"],
-                    "length": terrain_data["length"],
-                    "height_scale": terrain_data["height_scale"],
-                    "resolution": terrain_data["resolution"],
-                    "heightmap": terrain_data["heightmap"]
+                    "width": terrain.width,
+                    "length": terrain.length,
+                    "height_scale": terrain.height_scale,
+                    "resolution": terrain.resolution,
+                    "heightmap": heightmap.tolist()
                 },
-                "objects": terrain_data["terrain_objects"]
+                "objects": terrain.terrain_objects
             }
             
             # JSON 파일로 저장
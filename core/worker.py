@@ -0,0 +1,185 @@
+# core/worker.py
+import copy
+import queue
+import threading
+import traceback
+from collections import deque
+
+import numpy as np
+
+from core.dirty import DirtyRegionBus
+from core.history import EditHistory
+from core.heightmap import CopyOnWriteHeightmap, QuantizedHeightmap
+
+
+class BrushWorker:
+    """
+    지형 편집 백그라운드 작업자 (이중 버퍼)
+
+    편집 요청은 작업 스레드 하나가 요청 순서대로 백 버퍼에 적용한다. 백 버퍼는
+    프런트 버퍼(terrain.heightmap) 위에 겹친 쓰기 시 복사 높이맵이라 편집한 타일만
+    복사해 보관한다. 편집이 끝날 때마다 바뀐 범위의 높이를 복사해 두고, 메인 스레드가
+    swap 을 호출하면 그 범위만 프런트 버퍼에 반영한다. 프런트 버퍼에 반영된 타일은
+    다음 요청을 처리할 때 해제하므로, 백 버퍼의 메모리는 반영을 기다리는 편집 범위에
+    비례한다. 미리보기, 메시, 되돌리기 기록은 모두 프런트 버퍼만 보므로 메인
+    스레드에서만 갱신된다.
+
+    NumPy 연산은 GIL 을 놓으므로 큰 브러시를 적용하는 동안에도 화면을 그릴 수 있고,
+    요청이 한 스레드에서 순서대로 처리되므로 최종 결과는 동기 호출과 같다.
+    """
+
+    def __init__(self, terrain):
+        """
+        Args:
+            terrain (Terrain): 프런트 버퍼를 가진 지형
+        """
+        self.terrain = terrain
+        self.back = self._make_back(terrain)
+        self._back_changes = self.back.changes.subscribe("swap", max_regions=1)
+        self._ready = deque()
+        # 반영 대기 중인 복사 타일별 마지막 교체 번호, 프런트 버퍼에 반영된 마지막 번호
+        self._staged = {}
+        self._sequence = 0
+        self._swapped = 0
+        self._queue = queue.Queue()
+        self.errors = []
+        self._thread = threading.Thread(target=self._run, name="BrushWorker", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _storage(heightmap):
+        """높이맵의 저장값 배열 (uint16 양자화 높이맵은 코드 배열)"""
+        return heightmap.codes if isinstance(heightmap, QuantizedHeightmap) else heightmap
+
+    @staticmethod
+    def _make_back(terrain):
+        """
+        백 버퍼에 편집을 적용할 지형 복사본 생성 (설정과 오브젝트 목록은 공유)
+
+        높이맵은 프런트 버퍼의 저장값 위에 겹친 쓰기 시 복사 높이맵이므로 생성 비용과
+        메모리가 지형 크기와 무관하다 (메모리 매핑 높이맵도 읽어 들이지 않음).
+        """
+        back = copy.copy(terrain)
+        front = terrain.heightmap
+        if isinstance(front, QuantizedHeightmap):
+            back.heightmap = QuantizedHeightmap(CopyOnWriteHeightmap(front.codes), front.height_scale)
+        else:
+            back.heightmap = CopyOnWriteHeightmap(front)
+        back.shared_memory = None
+        back.changes = DirtyRegionBus()
+        back.history = EditHistory(back)
+        back.history.enabled = False
+        # 메시는 프런트 버퍼 교체 후 메인 스레드에서 갱신
+        back.vertices = back.faces = back.normals = None
+        back.update_mesh = lambda full=False: None
+        return back
+
+    def _run(self):
+        """작업 스레드: 요청을 순서대로 백 버퍼에 적용"""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._release()
+                kind, payload = job
+                if kind == "edit":
+                    method, args, kwargs = payload
+                    try:
+                        getattr(self.back, method)(*args, **kwargs)
+                    except Exception as e:
+                        self.errors.append(e)
+                        print(f"브러시 작업 오류: {str(e)}")
+                        print(traceback.format_exc())
+                    self._stage_changes()
+                elif kind == "load":
+                    # 범위의 복사 타일을 버려 프런트 버퍼의 값을 다시 읽게 함
+                    buffer = self._storage(self.back.heightmap)
+                    buffer.release(buffer.tile_keys(payload))
+                else:
+                    self._ready.append(job)
+            finally:
+                self._queue.task_done()
+
+    def _stage_changes(self):
+        """백 버퍼에서 바뀐 범위의 저장값을 복사해 교체 대기열에 추가"""
+        rect = self._back_changes.pull_merged()
+        if rect is None:
+            return
+        x0, x1, z0, z1 = rect
+        buffer = self._storage(self.back.heightmap)
+        self._sequence += 1
+        for key in buffer.tile_keys(rect):
+            self._staged[key] = self._sequence
+        self._ready.append(("region", (rect, np.array(buffer[x0:x1, z0:z1]), self._sequence)))
+
+    def _release(self):
+        """프런트 버퍼에 반영된 뒤 다시 바뀌지 않은 복사 타일 해제 (작업 스레드)"""
+        swapped = self._swapped
+        released = [key for key, sequence in self._staged.items() if sequence <= swapped]
+        for key in released:
+            del self._staged[key]
+        self._storage(self.back.heightmap).release(released)
+
+    def submit(self, method, *args, **kwargs):
+        """
+        편집 요청 (Terrain 메서드 이름과 인자)
+
+        예: worker.submit("apply_stamps", xs, zs, 5, 0.5, "raise")
+        """
+        self._queue.put(("edit", (method, args, kwargs)))
+
+    def submit_commit(self, label=None):
+        """앞선 편집이 모두 프런트 버퍼에 반영된 시점에 되돌리기 기록을 commit"""
+        self._queue.put(("commit", label))
+
+    def load_region(self, rect):
+        """
+        프런트 버퍼에서 직접 바뀐 범위(되돌리기 등)를 백 버퍼에 반영
+
+        백 버퍼는 범위의 복사 타일을 버리고 프런트 버퍼를 다시 읽으므로, 앞선 편집이
+        모두 반영된 뒤(wait 이후)에 호출한다.
+
+        Args:
+            rect (tuple): (axis0 시작, axis0 끝, axis1 시작, axis1 끝), 끝은 미포함
+        """
+        self._queue.put(("load", rect))
+
+    def swap(self):
+        """
+        완료된 편집 범위를 프런트 버퍼에 반영 (메인 스레드에서 프레임마다 호출)
+
+        Returns:
+            bool: 반영한 범위가 있으면 True
+        """
+        swapped = False
+        while self._ready:
+            kind, payload = self._ready.popleft()
+            if kind == "region":
+                rect, data, sequence = payload
+                x0, x1, z0, z1 = rect
+                self.terrain._mark_dirty(rect)
+                self._storage(self.terrain.heightmap)[x0:x1, z0:z1] = data
+                self._swapped = sequence
+                swapped = True
+            elif kind == "commit":
+                self.terrain.history.commit(payload)
+        return swapped
+
+    def pending(self):
+        """처리 중이거나 대기 중인 요청 수"""
+        return self._queue.unfinished_tasks
+
+    def wait(self):
+        """모든 요청을 처리하고 프런트 버퍼에 반영할 때까지 대기"""
+        self._queue.join()
+        swapped = self.swap()
+        # 작업 스레드가 대기 중이므로 여기서 바로 해제해도 안전
+        self._release()
+        return swapped
+
+    def close(self):
+        """남은 요청을 처리하고 작업 스레드 종료"""
+        self._queue.put(None)
+        self._thread.join()
+        self.swap()
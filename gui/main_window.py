@@ -3,15 +3,17 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QPushButton, QVBoxLayout,
                             QHBoxLayout, QGroupBox, QFormLayout, QDoubleSpinBox, 
                             QCheckBox, QFileDialog, QMessageBox, QLabel, QAction,
                             QTabWidget, QMenu)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPainter, QPen, QColor
 from core.shapes import Rectangle, Circle
 from core.obj_loader import OBJLoader
 from core.unity_exporter import UnityExporter
 from core.terrain import Terrain
-from gui.preview_widget import PreviewWidget
+from core.worker import BrushWorker
+from gui.preview_widget import PreviewWidget, BRUSH_FPS
 from gui.terrain_editor import TerrainEditorWidget
 import json
+import os
 
 
 class MainWindow(QMainWindow):
@@ -35,6 +37,13 @@ class MainWindow(QMainWindow):
         self.terrain = None  # 지형 데이터
         self.ramp_start_point = None  # 경사로 시작점
         
+        # 지형 편집 작업자 (백 버퍼에 편집 적용) 및 프런트 버퍼 교체 타이머
+        self.brush_worker = None
+        self._swap_timer = QTimer(self)
+        self._swap_timer.setInterval(int(1000 / BRUSH_FPS))
+        self._swap_timer.timeout.connect(self.on_swap_tick)
+        self._swap_timer.start()
+        
         self._init_ui()
             
     def _init_ui(self):
@@ -117,11 +126,14 @@ class MainWindow(QMainWindow):
         # 지형 미리보기 위젯
         self.preview_widget = PreviewWidget()
         self.preview_widget.terrain_clicked.connect(self.on_terrain_clicked)
+        self.preview_widget.brush_stroke.connect(self.on_brush_stroke)
         
         # 지형 편집 위젯
         self.terrain_editor = TerrainEditorWidget()
         self.terrain_editor.create_terrain_btn.clicked.connect(self.on_create_terrain)
         self.terrain_editor.add_platform_btn.clicked.connect(self.on_add_platform)
+        self.terrain_editor.erode_btn.clicked.connect(self.on_erode_terrain)
+        self.terrain_editor.filter_btn.clicked.connect(self.on_filter_terrain)
         self.terrain_editor.import_obj_btn.clicked.connect(self.on_import_obj)
         self.terrain_editor.export_unity_btn.clicked.connect(self.on_export_to_unity)
         
@@ -304,6 +316,17 @@ class MainWindow(QMainWindow):
         file_menu.addAction(save_action)
 
         edit_menu = menubar.addMenu("편집")
+
+        # 지형 되돌리기/다시 실행 액션
+        undo_action = QAction("실행 취소", self)
+        undo_action.setShortcut("Ctrl+Z")
+        undo_action.triggered.connect(self.on_undo_terrain)
+        edit_menu.addAction(undo_action)
+
+        redo_action = QAction("다시 실행", self)
+        redo_action.setShortcut("Ctrl+Y")
+        redo_action.triggered.connect(self.on_redo_terrain)
+        edit_menu.addAction(redo_action)
         # 삭제 액션
         delete_action = QAction("선택한 도형 삭제", self)
         delete_action.setShortcut("Delete")
@@ -477,14 +500,37 @@ class MainWindow(QMainWindow):
             height_scale=params["height_scale"]
         )
         
+        # 절차적 생성 (평지가 아닌 경우)
+        if params["noise_type"] is not None:
+            self.terrain.generate(params["noise_type"], params["seed"])
+        
         # 미리보기 업데이트
-        self.preview_widget.set_terrain(self.terrain)
+        self._bind_terrain()
         self.preview_widget.set_brush(True, self.terrain_editor.get_brush_size())
         self.preview_widget.update()
         
         # 상태바 메시지 업데이트
         self.statusBar().showMessage(f"지형 생성 완료: {params['width']}m x {params['length']}m, 해상도: {params['resolution']} 격자/m")
     
+    def _bind_terrain(self):
+        """현재 지형을 미리보기와 편집 작업자에 연결"""
+        if self.brush_worker is not None:
+            self.brush_worker.close()
+            self.brush_worker = None
+        self.preview_widget.set_terrain(self.terrain)
+        if self.terrain is not None:
+            self.brush_worker = BrushWorker(self.terrain)
+
+    def _wait_terrain_edits(self):
+        """대기 중인 지형 편집을 모두 프런트 버퍼에 반영"""
+        if self.brush_worker is not None:
+            self.brush_worker.wait()
+
+    def on_swap_tick(self):
+        """타이머 틱: 작업자가 끝낸 편집 범위를 프런트 버퍼에 반영하고 다시 그리기"""
+        if self.brush_worker is not None and self.brush_worker.swap():
+            self.preview_widget.update()
+
     def on_terrain_clicked(self, x, z, button):
         """지형 클릭 이벤트 처리"""
         if self.terrain is None or self.tab_widget.currentIndex() != 1:
@@ -493,30 +539,12 @@ class MainWindow(QMainWindow):
         # 현재 도구 유형 가져오기
         tool_type = self.terrain_editor.get_tool_type()
         
-        # 브러시 정보 가져오기
-        brush_size = self.terrain_editor.get_brush_size()
-        brush_strength = self.terrain_editor.get_brush_strength()
-        
-        # 도구 유형에 따라 처리
-        # 높이기
-        if tool_type == 0 and button == 1:  # 높이기 도구 + 왼쪽 버튼
-            self.terrain.modify_height(x, z, brush_size, brush_strength, add=True)
-            self.preview_widget.update()
-            
-        # 낮추기
-        elif tool_type == 1 and button == 1:  # 낮추기 도구 + 왼쪽 버튼
-            self.terrain.modify_height(x, z, brush_size, brush_strength, add=False)
-            self.preview_widget.update()
-            
-        # 스무딩
-        elif tool_type == 2 and button == 1:  # 스무딩 도구 + 왼쪽 버튼
-            self.terrain.smooth_area(x, z, brush_size, brush_strength)
-            self.preview_widget.update()
-            
-        # 평탄화
-        elif tool_type == 3 and button == 1:  # 평탄화 도구 + 왼쪽 버튼
-            self.terrain.flatten_area(x, z, brush_size)
-            self.preview_widget.update()
+        # 높이기/낮추기/스무딩/평탄화 브러시는 미리보기 위젯이 입력을 모아
+        # 프레임마다 brush_stroke 시그널로 보내므로 on_brush_stroke 에서 처리
+
+        # 마우스 업: 브러시 스트로크를 되돌리기 한 단계로 저장
+        if tool_type in (0, 1, 2, 3) and button == 0:
+            self.brush_worker.submit_commit(("높이기", "낮추기", "스무딩", "평탄화")[tool_type])
         
         # 경사로 모드 처리
         if tool_type == 4:  # 경사로 도구
@@ -532,13 +560,15 @@ class MainWindow(QMainWindow):
             else:
                 # 끝점 설정 및 경사로 생성
                 ramp_params = self.terrain_editor.get_ramp_params()
-                self.terrain.add_ramp(
+                self.brush_worker.submit(
+                    "add_ramp",
                     self.ramp_start_point[0], self.ramp_start_point[2],
                     x, z,
                     ramp_params["width"],
                     ramp_params["start_height"],
                     ramp_params["end_height"]
                 )
+                self.brush_worker.submit_commit("경사로")
                 
                 # 상태 초기화
                 self.ramp_start_point = None
@@ -549,6 +579,20 @@ class MainWindow(QMainWindow):
                 # 상태바 메시지 업데이트
                 self.statusBar().showMessage("경사로 생성 완료")
                 
+    def on_brush_stroke(self, xs, zs):
+        """브러시 스트로크 처리 (프레임당 한 번, 모아 둔 스탬프를 일괄 적용)"""
+        if self.terrain is None or self.tab_widget.currentIndex() != 1:
+            return
+
+        tool_type = self.terrain_editor.get_tool_type()
+        if tool_type not in (0, 1, 2, 3):
+            return
+
+        op = ("raise", "lower", "smooth", "flatten")[tool_type]
+        self.brush_worker.submit("apply_stamps", xs, zs,
+                                 self.terrain_editor.get_brush_size(),
+                                 self.terrain_editor.get_brush_strength(), op)
+
     def on_add_platform(self):
         """플랫폼 추가 버튼 클릭 처리"""
         if self.terrain is None:
@@ -563,11 +607,13 @@ class MainWindow(QMainWindow):
         center_z = 0
         
         # 플랫폼 추가
-        self.terrain.add_platform(
+        self.brush_worker.submit(
+            "add_platform",
             center_x, center_z,
             params["width"], params["length"],
             params["height"]
         )
+        self.brush_worker.submit_commit("플랫폼")
         
         # 미리보기 업데이트
         self.preview_widget.update()
@@ -575,6 +621,58 @@ class MainWindow(QMainWindow):
         # 상태바 메시지 업데이트
         self.statusBar().showMessage(f"플랫폼 추가됨: {params['width']}m x {params['length']}m, 높이: {params['height']}m")
 
+    def on_erode_terrain(self):
+        """침식 적용 버튼 클릭 처리 (편집 작업자에서 실행)"""
+        if self.terrain is None:
+            QMessageBox.warning(self, "경고", "먼저 지형을 생성하세요.")
+            return
+        
+        params = self.terrain_editor.get_erosion_params()
+        self.brush_worker.submit("erode", params["erosion_type"], params["iterations"])
+        self.brush_worker.submit_commit("침식")
+        
+        # 상태바 메시지 업데이트
+        self.statusBar().showMessage(f"침식 적용 중: 반복 {params['iterations']}회")
+
+    def on_filter_terrain(self):
+        """전체 필터 적용 버튼 클릭 처리 (편집 작업자에서 실행)"""
+        if self.terrain is None:
+            QMessageBox.warning(self, "경고", "먼저 지형을 생성하세요.")
+            return
+        
+        params = self.terrain_editor.get_filter_params()
+        self.brush_worker.submit("apply_filter", params["filter_type"], params["radius"])
+        self.brush_worker.submit_commit("필터")
+        
+        # 상태바 메시지 업데이트
+        self.statusBar().showMessage(f"필터 적용 중: 반경 {params['radius']}격자")
+
+    def on_undo_terrain(self):
+        """지형 편집 되돌리기"""
+        if self.terrain is None:
+            return
+        self._wait_terrain_edits()
+        entry = self.terrain.history.undo()
+        if entry is None:
+            self.statusBar().showMessage("되돌릴 편집이 없습니다.")
+            return
+        self.brush_worker.load_region(entry.rect)
+        self.preview_widget.update()
+        self.statusBar().showMessage(f"실행 취소: {entry.label or '편집'}")
+
+    def on_redo_terrain(self):
+        """되돌린 지형 편집 다시 실행"""
+        if self.terrain is None:
+            return
+        self._wait_terrain_edits()
+        entry = self.terrain.history.redo()
+        if entry is None:
+            self.statusBar().showMessage("다시 실행할 편집이 없습니다.")
+            return
+        self.brush_worker.load_region(entry.rect)
+        self.preview_widget.update()
+        self.statusBar().showMessage(f"다시 실행: {entry.label or '편집'}")
+
     def on_import_obj(self):
         # OBJ 파일 열기 대화상자
         filepath, _ = QFileDialog.getOpenFileName(
@@ -602,6 +700,7 @@ class MainWindow(QMainWindow):
         filepath, _ = QFileDialog.getSaveFileName(self, "유니티 파일로 저장", "", "JSON 파일 (*.json)")
         
         if filepath:
+            self._wait_terrain_edits()
             try:
                 # 디버깅 코드 추가
                 print(f"Exporting terrain to: {filepath}")
@@ -643,7 +742,7 @@ class MainWindow(QMainWindow):
                 )
                 
                 # 미리보기 업데이트
-                self.preview_widget.set_terrain(self.terrain)
+                self._bind_terrain()
                 self.preview_widget.update()
                 
                 # 경사로 시작점 초기화
@@ -1137,7 +1236,11 @@ class MainWindow(QMainWindow):
         
         # 지형 데이터가 있으면 추가
         if self.terrain is not None:
-            terrain_data = self.terrain.get_heightmap_data()  # ✅ 이제 JSON 저장용 dict 반환됨
+            self._wait_terrain_edits()
+            # 높이맵은 JSON 리스트 대신 프로젝트 폴더의 .npy 파일로 저장
+            heightmap_path = os.path.splitext(filepath)[0] + '_heightmap.npy'
+            terrain_data = self.terrain.get_heightmap_data(heightmap_path)
+            terrain_data['heightmap_file'] = os.path.basename(heightmap_path)
             map_data['terrain'] = terrain_data
         
         try:
@@ -1186,23 +1289,16 @@ class MainWindow(QMainWindow):
             if 'terrain' in map_data and version >= '3.0':
                 terrain_data = map_data['terrain']
                 
-                # 지형 객체 생성
-                self.terrain = Terrain(
-                    width=terrain_data['width'],
-                    length=terrain_data['length'],
-                    resolution=terrain_data['resolution'],
-                    height_scale=terrain_data['height_scale']
-                )
-                
-                # 높이맵 설정
-                import numpy as np
-                self.terrain.heightmap = np.array(terrain_data['heightmap'])
-                
-                # 지형 오브젝트 설정
-                self.terrain.terrain_objects = terrain_data['terrain_objects']
+                heightmap_path = None
+                if 'heightmap_file' in terrain_data:
+                    # 높이맵 파일을 메모리 매핑으로 열기 (JSON 리스트를 파싱하지 않음)
+                    heightmap_path = os.path.join(os.path.dirname(filepath), terrain_data['heightmap_file'])
+
+                # 저장된 정밀도와 저장 방식으로 지형 객체 생성
+                self.terrain = Terrain.from_heightmap_data(terrain_data, heightmap_path)
                 
                 # 지형 미리보기 업데이트
-                self.preview_widget.set_terrain(self.terrain)
+                self._bind_terrain()
                 self.preview_widget.update()
             
             # 선택 초기화
@@ -1240,7 +1336,7 @@ class MainWindow(QMainWindow):
         # 지형 초기화
         self.terrain = None
         self.ramp_start_point = None
-        self.preview_widget.set_terrain(None)
+        self._bind_terrain()
         self.preview_widget.update()
         
         # 맵 크기 초기화 (기본값으로)
@@ -1,11 +1,21 @@
 # gui/preview_widget.py
 from PyQt5.QtWidgets import QOpenGLWidget
-from PyQt5.QtCore import Qt, QPoint, pyqtSignal
+from PyQt5.QtCore import Qt, QPoint, QTimer, pyqtSignal
 from PyQt5.QtGui import QPainter, QPen, QColor, QFont
+import numpy as np
+from core.brush import space_stroke
+
+# 브러시 스탬프 간격 (브러시 크기에 대한 비율)
+BRUSH_SPACING = 0.25
+# 브러시 입력 처리 최대 프레임 수 (초당)
+BRUSH_FPS = 60
+
 
 class PreviewWidget(QOpenGLWidget):
     # 지형 클릭 시그널 (x, z, 버튼)
     terrain_clicked = pyqtSignal(float, float, int)
+    # 브러시 스트로크 시그널 (스탬프 X 좌표 배열, 스탬프 Z 좌표 배열)
+    brush_stroke = pyqtSignal(object, object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -15,6 +25,9 @@ class PreviewWidget(QOpenGLWidget):
         # 지형 데이터
         self.terrain = None
         
+        # 지형 샘플 (피라미드 평균 레벨, 편집 범위는 피라미드가 갱신)
+        self._terrain_samples = None
+        self._terrain_step = 1
         
         # 카메라 설정
         self.camera_distance = 20
@@ -35,6 +48,14 @@ class PreviewWidget(QOpenGLWidget):
         self.ramp_mode = False
         self.ramp_start = None
         
+        # 브러시 입력 큐 (마우스 이벤트를 모아 타이머 틱마다 한 번에 처리)
+        self._stroke_points = []
+        self._stroke_prev = None
+        self._stroke_carry = 0.0
+        self._brush_timer = QTimer(self)
+        self._brush_timer.setInterval(int(1000 / BRUSH_FPS))
+        self._brush_timer.timeout.connect(self._flush_brush_stroke)
+        
         # 마우스 이벤트 추적 활성화
         self.setMouseTracking(True)
         
@@ -49,14 +70,86 @@ class PreviewWidget(QOpenGLWidget):
     def set_terrain(self, terrain):
         """지형 데이터 설정"""
         self.terrain = terrain
+        self._terrain_samples = None
         self.update()
     
+    def _refresh_terrain_samples(self, origin_x, origin_z, scale):
+        """
+        미리보기용 지형 샘플 갱신
+
+        2^n 간격의 격자점 대신 피라미드 레벨 n 의 평균 높이를 쓰므로 축소된 화면에서도
+        에일리어싱이 없고, 편집된 범위는 피라미드가 조회 시점에 갱신한다.
+        화면에 보이는 레벨 셀 범위만 읽으므로 (레벨 0 이면 높이맵의 그 범위만) 프레임당
+        비용은 지형 크기가 아닌 화면 크기에 비례한다. 프레임당 한 번(paintEvent) 호출된다.
+
+        Args:
+            origin_x, origin_z (float): 월드 원점의 화면 좌표
+            scale (float): 1m 당 픽셀 수
+        """
+        grid_width, grid_length = self.terrain.grid_width, self.terrain.grid_length
+        level = max(1, min(grid_width, grid_length) // 100).bit_length() - 1
+        step = 1 << level
+        self._terrain_step = step
+
+        # 화면에 보이는 격자 범위를 레벨 셀 범위로 변환 (그리기 간격과 같은 셀)
+        windows = []
+        for size, extent, origin, pixels in ((grid_width, self.terrain.width, origin_x, self.width()),
+                                             (grid_length, self.terrain.length, origin_z, self.height())):
+            cells = -(-size // step)
+            cells_per_meter = (size - 1) / extent / step if extent > 0 else 0.0
+            # 점 크기(펜 두께 2)와 정수 절단만큼 화면 밖 2픽셀까지 포함
+            low = ((-2 - origin) / scale + extent / 2) * cells_per_meter
+            high = ((pixels + 2 - origin) / scale + extent / 2) * cells_per_meter
+            windows.append((int(np.clip(np.floor(low) - 1, 0, cells)), int(np.clip(np.ceil(high) + 1, 0, cells))))
+        (i0, i1), (j0, j1) = windows
+        self._terrain_window = (i0, i1, j0, j1)
+        self._terrain_samples = self.terrain.get_level(level, self._terrain_window)["mean"]
+    
     def set_brush(self, active, size=5):
         """브러시 활성화/비활성화 및 크기 설정"""
         self.brush_active = active
         self.brush_size = size
         self.update()
     
+    def _begin_brush_stroke(self, x, z):
+        """브러시 스트로크 시작 (입력 큐 초기화 및 타이머 시작)"""
+        self._stroke_points = [(x, z)]
+        self._stroke_prev = None
+        self._stroke_carry = 0.0
+        self._brush_timer.start()
+
+    def _end_brush_stroke(self, x, z):
+        """브러시 스트로크 종료 (남은 입력 처리 후 타이머 정지)"""
+        self._stroke_points.append((x, z))
+        self._flush_brush_stroke()
+        self._brush_timer.stop()
+        self._stroke_prev = None
+
+    def _coalesce_stroke(self):
+        """
+        큐에 쌓인 마우스 위치를 브러시 크기 비율 간격의 스탬프 위치로 변환
+
+        이전 틱에서 이어지는 거리(carry)를 유지하므로 틱 경계와 무관하게
+        스트로크 경로를 따라 일정한 간격으로 스탬프가 찍힌다.
+
+        Returns:
+            tuple: (스탬프 X 좌표 배열, 스탬프 Z 좌표 배열)
+        """
+        spacing = max(self.brush_size * BRUSH_SPACING, 1e-3)
+        xs, zs, self._stroke_prev, self._stroke_carry = space_stroke(
+            self._stroke_points, spacing, self._stroke_prev, self._stroke_carry)
+        self._stroke_points = []
+        return xs, zs
+
+    def _flush_brush_stroke(self):
+        """타이머 틱: 쌓인 입력을 한 번의 일괄 편집과 한 번의 다시 그리기로 처리"""
+        if not self._stroke_points:
+            return
+        xs, zs = self._coalesce_stroke()
+        if len(xs):
+            self.brush_stroke.emit(xs, zs)
+        self.update()
+    
     def set_ramp_mode(self, active):
         """경사로 모드 설정"""
         self.ramp_mode = active
@@ -149,8 +242,11 @@ class PreviewWidget(QOpenGLWidget):
         terrain_width = self.terrain.width
         terrain_length = self.terrain.length
         
-        # 스텝 크기 계산 (모든 격자점을 그리면 너무 많으므로)
-        step = max(1, min(heightmap_width, heightmap_length) // 100)
+        # 샘플 캐시 갱신 (스텝 크기: 모든 격자점을 그리면 너무 많으므로, 화면 범위만)
+        self._refresh_terrain_samples(origin_x, origin_z, scale)
+        samples = self._terrain_samples
+        step = self._terrain_step
+        i0, i1, j0, j1 = self._terrain_window
         
         # 지형의 월드 좌표 범위
         min_x = -terrain_width / 2
@@ -159,12 +255,12 @@ class PreviewWidget(QOpenGLWidget):
         max_z = terrain_length / 2
         
         # 간략화된 격자점 그리기
-        for grid_x in range(0, heightmap_width, step):
-            for grid_z in range(0, heightmap_length, step):
+        for grid_x in range(i0 * step, i1 * step, step):
+            for grid_z in range(j0 * step, j1 * step, step):
                 # 실제 월드 좌표 계산
                 x = min_x + (grid_x / (heightmap_width - 1)) * terrain_width
                 z = min_z + (grid_z / (heightmap_length - 1)) * terrain_length
-                y = self.terrain.heightmap[grid_x, grid_z]
+                y = samples[grid_x // step - i0, grid_z // step - j0]
                 
                 # 화면 좌표 변환
                 screen_x = origin_x + x * scale
@@ -194,14 +290,26 @@ class PreviewWidget(QOpenGLWidget):
                 rect_width = width * scale
                 rect_height = length * scale
                 
-                # 사각형 그리기
+                # 사각형(또는 원) 그리기 - 플랫폼 중심 기준으로 회전
                 painter.setPen(QPen(QColor(0, 200, 0), 2))
-                painter.drawRect(
-                    int(screen_x - rect_width / 2),
-                    int(screen_z - rect_height / 2),
-                    int(rect_width),
-                    int(rect_height)
-                )
+                painter.save()
+                painter.translate(screen_x, screen_z)
+                painter.rotate(obj.get("rotation", 0.0))
+                if obj.get("shape", "box") == "circle":
+                    painter.drawEllipse(
+                        int(-rect_width / 2),
+                        int(-rect_height / 2),
+                        int(rect_width),
+                        int(rect_height)
+                    )
+                else:
+                    painter.drawRect(
+                        int(-rect_width / 2),
+                        int(-rect_height / 2),
+                        int(rect_width),
+                        int(rect_height)
+                    )
+                painter.restore()
                 
                 # 높이 텍스트 표시
                 painter.setFont(QFont("Arial", 8))
@@ -438,10 +546,12 @@ class PreviewWidget(QOpenGLWidget):
             
             if self.terrain:
                 try:
-                    height = self.terrain.get_height_at_point(x, z)
+                    height = float(self.terrain.sample_heights(x, z, mode="bilinear", fill=np.nan))
                     
-                    # 디버깅 정보 추가
-                    position_text = f"X: {x:.1f}, Z: {z:.1f}, 높이: {height:.1f}m"
+                    # 디버깅 정보 추가 (격자 밖이면 높이 표시 안 함)
+                    position_text = f"X: {x:.1f}, Z: {z:.1f}"
+                    if not np.isnan(height):
+                        position_text += f", 높이: {height:.1f}m"
                     painter.drawText(10, self.height() - 10, position_text)
                     
                 except Exception as e:
@@ -486,6 +596,10 @@ class PreviewWidget(QOpenGLWidget):
                 # 지형 클릭 시그널 발생 (월드 좌표, 버튼)
                 self.terrain_clicked.emit(world_pos[0], world_pos[2], 1)
                 
+                if not self.ramp_mode:
+                    # 브러시 스트로크 시작 (편집은 타이머 틱에서 처리)
+                    self._begin_brush_stroke(world_pos[0], world_pos[2])
+                
                 self.update()
             else:
                 # 카메라 회전 모드
@@ -503,6 +617,8 @@ class PreviewWidget(QOpenGLWidget):
             if self.brush_active and self.terrain:
                 # 브러시 모드에서 마우스 업 시 시그널 발생
                 world_pos = self.screen_to_world(event.x(), event.y())
+                if self._brush_timer.isActive():
+                    self._end_brush_stroke(world_pos[0], world_pos[2])
                 self.terrain_clicked.emit(world_pos[0], world_pos[2], 0)
         
         elif event.button() == Qt.RightButton:
@@ -539,11 +655,11 @@ class PreviewWidget(QOpenGLWidget):
             world_pos = self.screen_to_world(event.x(), event.y())
             self.brush_position = world_pos
             
-            if self.terrain and (event.buttons() & Qt.LeftButton):
-                # 드래그 중에도 지형 수정 (연속적인 브러시 효과)
-                self.terrain_clicked.emit(world_pos[0], world_pos[2], 1)
-            
-            self.update()
+            if self._brush_timer.isActive() and (event.buttons() & Qt.LeftButton):
+                # 드래그 중 입력은 큐에 쌓고 타이머 틱에서 한 번에 처리
+                self._stroke_points.append((world_pos[0], world_pos[2]))
+            else:
+                self.update()
         
         self.last_pos = event.pos()
     
@@ -2,7 +2,7 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
                             QLabel, QDoubleSpinBox, QComboBox, QPushButton,
                             QSlider, QTabWidget, QFormLayout, QFileDialog,
-                            QMessageBox)
+                            QMessageBox, QSpinBox)
 from PyQt5.QtCore import Qt
 
 class TerrainEditorWidget(QWidget):
@@ -54,6 +54,14 @@ class TerrainEditorWidget(QWidget):
         self.height_scale_field.setSuffix(" m")
         self.height_scale_field.setSingleStep(1.0)
         
+        # 절차적 생성 방식 및 시드 설정
+        self.noise_combo = QComboBox()
+        self.noise_combo.addItems(["평지", "fBm", "릿지", "도메인 워프"])
+        
+        self.seed_field = QSpinBox()
+        self.seed_field.setRange(0, 999999)
+        self.seed_field.setValue(0)
+        
         # 지형 생성 버튼
         self.create_terrain_btn = QPushButton("지형 생성")
         
@@ -62,6 +70,8 @@ class TerrainEditorWidget(QWidget):
         creation_layout.addRow("길이:", self.length_field)
         creation_layout.addRow("해상도:", self.resolution_field)
         creation_layout.addRow("최대 높이:", self.height_scale_field)
+        creation_layout.addRow("생성 방식:", self.noise_combo)
+        creation_layout.addRow("시드:", self.seed_field)
         creation_layout.addRow("", self.create_terrain_btn)
         
         creation_group.setLayout(creation_layout)
@@ -191,6 +201,58 @@ class TerrainEditorWidget(QWidget):
         # 플랫폼 탭 최종 설정
         platform_tab.setLayout(platform_layout)
         
+        # 지형 처리 탭
+        process_tab = QWidget()
+        process_layout = QVBoxLayout()
+        
+        # 침식 설정 그룹
+        erosion_group = QGroupBox("침식")
+        erosion_layout = QFormLayout()
+        
+        # 침식 방식 및 반복 횟수 설정
+        self.erosion_combo = QComboBox()
+        self.erosion_combo.addItems(["수력 침식", "열 침식"])
+        
+        self.erosion_iterations_field = QSpinBox()
+        self.erosion_iterations_field.setRange(1, 1000)
+        self.erosion_iterations_field.setValue(50)
+        
+        # 침식 적용 버튼
+        self.erode_btn = QPushButton("침식 적용")
+        
+        erosion_layout.addRow("방식:", self.erosion_combo)
+        erosion_layout.addRow("반복 횟수:", self.erosion_iterations_field)
+        erosion_layout.addRow("", self.erode_btn)
+        
+        erosion_group.setLayout(erosion_layout)
+        process_layout.addWidget(erosion_group)
+        
+        # 필터 설정 그룹
+        filter_group = QGroupBox("필터")
+        filter_layout = QFormLayout()
+        
+        # 필터 종류 및 반경 설정
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(["가우시안", "박스", "미디언"])
+        
+        self.filter_radius_field = QSpinBox()
+        self.filter_radius_field.setRange(1, 64)
+        self.filter_radius_field.setValue(2)
+        self.filter_radius_field.setSuffix(" 격자")
+        
+        # 필터 적용 버튼
+        self.filter_btn = QPushButton("전체 필터 적용")
+        
+        filter_layout.addRow("종류:", self.filter_combo)
+        filter_layout.addRow("반경:", self.filter_radius_field)
+        filter_layout.addRow("", self.filter_btn)
+        
+        filter_group.setLayout(filter_layout)
+        process_layout.addWidget(filter_group)
+        
+        # 지형 처리 탭 최종 설정
+        process_tab.setLayout(process_layout)
+        
         # 임포트/익스포트 탭
         export_tab = QWidget()
         export_layout = QVBoxLayout()
@@ -223,6 +285,7 @@ class TerrainEditorWidget(QWidget):
         # 탭 추가
         tools_tabs.addTab(brush_tab, "브러시 도구")
         tools_tabs.addTab(platform_tab, "플랫폼 추가")
+        tools_tabs.addTab(process_tab, "지형 처리")
         tools_tabs.addTab(export_tab, "임포트/익스포트")
         
         # 메인 레이아웃에 위젯 추가
@@ -280,7 +343,23 @@ class TerrainEditorWidget(QWidget):
             "width": self.width_field.value(),
             "length": self.length_field.value(),
             "resolution": self.resolution_field.value(),
-            "height_scale": self.height_scale_field.value()
+            "height_scale": self.height_scale_field.value(),
+            "noise_type": (None, "fbm", "ridged", "warped")[self.noise_combo.currentIndex()],
+            "seed": self.seed_field.value()
+        }
+    
+    def get_erosion_params(self):
+        """침식 매개변수 반환"""
+        return {
+            "erosion_type": ("hydraulic", "thermal")[self.erosion_combo.currentIndex()],
+            "iterations": self.erosion_iterations_field.value()
+        }
+    
+    def get_filter_params(self):
+        """필터 매개변수 반환"""
+        return {
+            "filter_type": ("gaussian", "box", "median")[self.filter_combo.currentIndex()],
+            "radius": self.filter_radius_field.value()
         }
     
     def get_ramp_params(self):
@@ -0,0 +1,136 @@
+# tests/test_brush.py
+import math
+
+import numpy as np
+import pytest
+
+from core.brush import BrushStampCache, FALLOFF_QUADRATIC, radial_falloff, space_stroke
+from core.terrain import Terrain
+
+
+def _window(terrain, x, z, brush_size, border=0):
+    center_x = int((x + terrain.width / 2) * terrain.resolution)
+    center_z = int((z + terrain.length / 2) * terrain.resolution)
+    radius = int(brush_size * terrain.resolution)
+    return (center_x, center_z, radius,
+            range(max(border, center_x - radius), min(terrain.grid_width - 1 - border, center_x + radius) + 1),
+            range(max(border, center_z - radius), min(terrain.grid_length - 1 - border, center_z + radius) + 1))
+
+
+def reference_modify(terrain, heights, x, z, brush_size, strength, add=True):
+    """셀 단위 반복 구현 (벡터화 전 동작)"""
+    center_x, center_z, radius, xs, zs = _window(terrain, x, z, brush_size)
+    for gx in xs:
+        for gz in zs:
+            distance = math.sqrt((gx - center_x) ** 2 + (gz - center_z) ** 2)
+            if distance <= radius:
+                effect = strength * 0.1 * (1.0 - distance / radius)
+                heights[gx, gz] += effect if add else -effect
+                heights[gx, gz] = max(0, min(terrain.height_scale, heights[gx, gz]))
+
+
+def reference_flatten(terrain, heights, x, z, brush_size):
+    center_x, center_z, radius, xs, zs = _window(terrain, x, z, brush_size)
+    target = heights[center_x, center_z]
+    for gx in xs:
+        for gz in zs:
+            distance = math.sqrt((gx - center_x) ** 2 + (gz - center_z) ** 2)
+            if distance <= radius:
+                falloff = 1.0 - (distance / radius) ** 2
+                heights[gx, gz] = heights[gx, gz] * (1 - falloff) + target * falloff
+
+
+def reference_smooth(terrain, heights, x, z, brush_size, strength):
+    center_x, center_z, radius, xs, zs = _window(terrain, x, z, brush_size, border=1)
+    source = heights.copy()
+    for gx in xs:
+        for gz in zs:
+            distance = math.sqrt((gx - center_x) ** 2 + (gz - center_z) ** 2)
+            if distance <= radius:
+                average = (source[gx - 1:gx + 2, gz - 1:gz + 2].sum() - source[gx, gz]) / 8
+                effect = strength * (1.0 - distance / radius)
+                heights[gx, gz] = heights[gx, gz] * (1 - effect) + average * effect
+
+
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 16}])
+def test_brush_ops_match_cell_loops(options):
+    terrain = Terrain(60, 50, 2.0, 10.0, **options)
+    rng = np.random.default_rng(0)
+    terrain.heightmap[:, :] = rng.uniform(0, 10.0, terrain.heightmap.shape)
+    expected = np.asarray(terrain.heightmap).copy()
+
+    # 격자 가장자리에 걸치는 브러시도 포함
+    for _ in range(25):
+        x, z = rng.uniform(-32, 32), rng.uniform(-27, 27)
+        size, strength = rng.uniform(1, 8), rng.uniform(0.1, 1.0)
+        op = rng.integers(4)
+        if op == 0:
+            terrain.modify_height(x, z, size, strength, add=True)
+            reference_modify(terrain, expected, x, z, size, strength, add=True)
+        elif op == 1:
+            terrain.modify_height(x, z, size, strength, add=False)
+            reference_modify(terrain, expected, x, z, size, strength, add=False)
+        elif op == 2 and abs(x) < 30 and abs(z) < 25:
+            terrain.flatten_area(x, z, size)
+            reference_flatten(terrain, expected, x, z, size)
+        else:
+            terrain.smooth_area(x, z, size, strength)
+            reference_smooth(terrain, expected, x, z, size, strength)
+        np.testing.assert_allclose(np.asarray(terrain.heightmap), expected, atol=1e-6)
+
+
+def test_stamp_cache_reuses_kernels_and_evicts_lru():
+    cache = BrushStampCache(maxsize=3)
+    weights, inside = cache.get(4.0, 1.0)
+    assert weights.dtype == np.float32
+    expected, expected_inside = radial_falloff(4)
+    np.testing.assert_allclose(weights, expected, atol=1e-7)
+    np.testing.assert_array_equal(inside, expected_inside)
+    assert cache.get(4.0, 1.0)[0] is weights
+
+    clipped, _ = cache.get(4.0, 1.0, clip=(2, 9, 0, 5))
+    np.testing.assert_array_equal(clipped, weights[2:9, 0:5])
+    cache.get(4.0, 1.0, FALLOFF_QUADRATIC)
+    cache.get(3.0, 1.0)
+    assert cache.stats()["size"] == 3
+    # 가장 오래 안 쓴 전체 커널이 제거되고 잘린 커널은 남음
+    cache.get(4.0, 1.0, clip=(2, 9, 0, 5))
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 4)
+    cache.get(4.0, 1.0)
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 5)
+
+
+def test_stroke_hits_cache():
+    cache = BrushStampCache()
+    terrain = Terrain(60, 50, 1.0, 10.0)
+    terrain.stamp_cache = cache
+    for k in range(50):
+        terrain.modify_height(-20 + 0.8 * k, 3.0, 5, 0.5)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] > 0.95
+
+
+def test_stroke_spacing_is_independent_of_ticks():
+    rng = np.random.default_rng(2)
+    points = list(map(tuple, np.cumsum(rng.uniform(-1.5, 1.5, (60, 2)), axis=0)))
+    points.insert(20, points[19])
+    xs, zs, _, _ = space_stroke(points, 0.75)
+
+    # 타이머 틱마다 몇 개씩 나눠 넣어도 같은 스탬프
+    prev, carry, parts = None, 0.0, []
+    for start, end in [(0, 1), (1, 7), (7, 8), (8, 8), (8, 30), (30, 61)]:
+        part_x, part_z, prev, carry = space_stroke(points[start:end], 0.75, prev, carry)
+        parts.append(np.stack([part_x, part_z], axis=1))
+    np.testing.assert_allclose(np.concatenate(parts), np.stack([xs, zs], axis=1), atol=1e-9)
+
+    # 첫 점에서 시작해 경로 길이를 따라 간격마다 스탬프
+    path_length = np.hypot(*np.diff(np.array(points), axis=0).T).sum()
+    assert (xs[0], zs[0]) == points[0]
+    assert len(xs) == int(path_length / 0.75 + 1e-9) + 1
+
+
+def test_stroke_spacing_carries_across_corners():
+    xs, zs, prev, carry = space_stroke([(0.0, 0.0), (1.0, 0.0), (1.0, 2.0)], 0.75)
+    np.testing.assert_allclose(xs, [0.0, 0.75, 1.0, 1.0, 1.0])
+    np.testing.assert_allclose(zs, [0.0, 0.0, 0.5, 1.25, 2.0])
+    assert prev == (1.0, 2.0) and carry == pytest.approx(0.0)
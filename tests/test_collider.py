@@ -0,0 +1,51 @@
+# tests/test_collider.py
+import numpy as np
+import pytest
+
+from core.collider import read_collider
+from core.terrain import Terrain
+
+
+@pytest.fixture
+def terrain():
+    terrain = Terrain(70, 50, 2.0, 25.0, storage="tiled", tile_size=32)
+    terrain.generate("ridged", seed=9)
+    return terrain
+
+
+def _heightfield_vertices(collider):
+    """높이장 샘플을 월드 정점으로 복원 (행 우선, _generate_mesh 정점 순서)"""
+    heights = np.asarray(collider["heights"], dtype=np.float64)
+    (sx, sy, sz), (ox, oy, oz) = collider["scale"], collider["offset"]
+    rows, cols = np.indices(heights.shape)
+    return np.stack([ox + cols * sx, oy + heights * sy, oz + rows * sz], axis=-1).reshape(-1, 3)
+
+
+def test_heightfield_round_trip_matches_mesh(terrain, tmp_path):
+    path = str(tmp_path / "terrain.hf")
+    terrain.generate_collider(path, "heightfield")
+    collider = read_collider(path)
+    assert collider["type"] == "heightfield"
+    assert collider["heights"].shape == terrain.heightmap.shape
+
+    mesh_vertices, _ = terrain._generate_mesh()
+    restored = _heightfield_vertices(collider)
+    np.testing.assert_allclose(restored[:, [0, 2]], mesh_vertices[:, [0, 2]], atol=1e-4)
+    # 높이는 uint16 양자화 간격의 절반 이내
+    assert np.abs(restored[:, 1] - mesh_vertices[:, 1]).max() <= collider["scale"][1] / 2 + 1e-4
+
+    in_memory = terrain.generate_collider(collider_type="heightfield")
+    np.testing.assert_array_equal(in_memory["heights"], collider["heights"])
+    np.testing.assert_allclose(in_memory["scale"], collider["scale"], rtol=1e-6)
+    np.testing.assert_allclose(in_memory["offset"], collider["offset"], rtol=1e-6)
+
+
+@pytest.mark.parametrize("max_error", [None, 0.2])
+def test_mesh_round_trip(terrain, tmp_path, max_error):
+    path = str(tmp_path / "terrain.mc")
+    info = terrain.generate_collider(path, "mesh", max_error)
+    collider = read_collider(path)
+    expected = terrain.generate_collider(collider_type="mesh", max_error=max_error)
+    assert info["face_count"] == len(collider["faces"])
+    np.testing.assert_array_equal(collider["vertices"], expected["vertices"])
+    np.testing.assert_array_equal(collider["faces"], expected["faces"])
@@ -0,0 +1,28 @@
+# tests/test_derived.py
+import numpy as np
+import pytest
+
+from core.derived import DERIVED_MAPS, compute_derived, decode_octahedral, encode_octahedral
+from core.terrain import Terrain
+
+
+@pytest.mark.parametrize("name", DERIVED_MAPS)
+def test_incremental_update_matches_full(name):
+    # 300 행이면 COPY_ROWS 띠 두 개로 나뉘어 계산된다
+    terrain = Terrain(300, 90, 1.0, 20.0, storage="tiled", tile_size=64)
+    terrain.generate("fbm", seed=8)
+    terrain.derived(name)
+    rng = np.random.default_rng(2)
+    for _ in range(15):
+        terrain.modify_height(rng.uniform(-150, 150), rng.uniform(-45, 45), rng.uniform(2, 10), 1.0)
+    terrain.smooth_area(0.0, 0.0, 20, 0.5)
+
+    expected = compute_derived(name, np.asarray(terrain.heightmap, dtype=np.float64), 1.0 / terrain.resolution)
+    np.testing.assert_array_equal(terrain.derived(name), expected)
+
+
+def test_octahedral_round_trip():
+    normals = np.random.default_rng(3).normal(size=(500, 3))
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+    decoded = decode_octahedral(encode_octahedral(normals))
+    assert np.abs(decoded - normals).max() < 1e-3
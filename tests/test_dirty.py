@@ -0,0 +1,56 @@
+# tests/test_dirty.py
+import numpy as np
+
+from core.dirty import DirtyRegionBus
+from core.terrain import Terrain
+
+
+def test_touching_rects_merge_and_pull_clears():
+    bus = DirtyRegionBus()
+    subscriber = bus.subscribe("mesh")
+    assert bus.subscribe("mesh") is subscriber
+    bus.publish((0, 4, 0, 4))
+    bus.publish((4, 8, 2, 6))
+    bus.publish((20, 22, 20, 22))
+    bus.publish((5, 5, 0, 3))
+    assert sorted(subscriber.pull()) == [(0, 8, 0, 6), (20, 22, 20, 22)]
+    assert not subscriber.has_pending()
+    assert subscriber.pull_merged() is None
+
+
+def test_subscribers_are_independent_and_capped():
+    bus = DirtyRegionBus()
+    preview = bus.subscribe("preview", max_regions=3)
+    mesh = bus.subscribe("mesh")
+    for k in range(4):
+        bus.publish((10 * k, 10 * k + 2, 0, 2))
+    assert preview.pull() == [(0, 32, 0, 2)]
+    assert len(mesh.pull()) == 4
+    bus.unsubscribe("mesh")
+    bus.publish((0, 1, 0, 1))
+    assert not mesh.has_pending() and preview.has_pending()
+
+
+def test_terrain_edits_publish_every_changed_cell():
+    terrain = Terrain(60, 40, 1.0, 10.0, storage="tiled", tile_size=16)
+    terrain.heightmap[:, :] = np.random.default_rng(10).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    subscriber = terrain.changes.subscribe("test", max_regions=64)
+    rng = np.random.default_rng(0)
+    edits = [
+        lambda x, z: terrain.modify_height(x, z, 4, 1.0),
+        lambda x, z: terrain.smooth_area(x, z, 5, 0.5),
+        lambda x, z: terrain.flatten_area(x, z, 3),
+        lambda x, z: terrain.add_ramp(x, z, x + 10, z - 6, 4, 1.0, 6.0),
+        lambda x, z: terrain.add_platform(x, z, 6, 4, 8.0, rotation=30),
+        lambda x, z: terrain.apply_stamps([x, x + 3], [z, z], [3, 3], [0.5, 0.5], "raise"),
+        lambda x, z: terrain.apply_filter("gaussian", 2, region=(x - 5, x + 5, z - 5, z + 5)),
+    ]
+    for edit in edits:
+        before = np.asarray(terrain.heightmap, dtype=np.float64).copy()
+        edit(rng.uniform(-25, 25), rng.uniform(-15, 15))
+        covered = np.zeros(before.shape, dtype=bool)
+        for x0, x1, z0, z1 in subscriber.pull():
+            covered[x0:x1, z0:z1] = True
+        changed = np.asarray(terrain.heightmap, dtype=np.float64) != before
+        assert changed.any()
+        assert not (changed & ~covered).any()
@@ -0,0 +1,33 @@
+# tests/test_erosion.py
+import numpy as np
+import pytest
+
+from core.erosion import EROSION_TYPES, erode_block
+from core.noise import noise_heights
+from core.parallel import tile_rects
+
+
+def _heights(size=96):
+    coords = np.arange(size, dtype=np.float64)
+    return noise_heights(coords[:, None], coords[None, :], 30.0, "ridged", seed=2)
+
+
+@pytest.mark.parametrize("erosion_type", EROSION_TYPES)
+def test_erosion_conserves_mass(erosion_type):
+    heights = _heights()
+    eroded = erode_block(heights, erosion_type=erosion_type, iterations=25)
+    assert not np.allclose(eroded, heights)
+    assert eroded.sum() == pytest.approx(heights.sum(), rel=1e-9)
+
+
+@pytest.mark.parametrize("erosion_type", EROSION_TYPES)
+def test_halo_tiles_match_single_block(erosion_type):
+    heights = _heights()
+    iterations = 6
+    whole = erode_block(heights, erosion_type=erosion_type, iterations=iterations)
+
+    tiled = np.empty_like(heights)
+    for (x0, x1, z0, z1), (hx0, hx1, hz0, hz1) in tile_rects(heights.shape, 40, 2 * iterations):
+        block = erode_block(heights[hx0:hx1, hz0:hz1], erosion_type=erosion_type, iterations=iterations)
+        tiled[x0:x1, z0:z1] = block[x0 - hx0:x1 - hx0, z0 - hz0:z1 - hz0]
+    np.testing.assert_allclose(tiled, whole, atol=1e-12)
@@ -0,0 +1,29 @@
+# tests/test_filters.py
+import numpy as np
+import pytest
+
+from core.filters import FILTER_TYPES, _convolve_axis, _convolve_axis_fft, filter_block, gaussian_kernel
+from core.terrain import Terrain
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_fft_convolution_matches_direct(axis):
+    values = np.random.default_rng(0).normal(size=(70, 50))
+    kernel = gaussian_kernel(12)
+    np.testing.assert_allclose(_convolve_axis_fft(values, kernel, axis), _convolve_axis(values, kernel, axis),
+                               atol=1e-12)
+
+
+@pytest.mark.parametrize("filter_type", FILTER_TYPES)
+def test_region_filter_matches_whole_grid(filter_type):
+    terrain = Terrain(80, 60, 1.0, 20.0)
+    terrain.generate("fbm", seed=3)
+    heights = np.asarray(terrain.heightmap).copy()
+    whole = filter_block(heights, filter_type=filter_type, radius=3)
+
+    terrain.apply_filter(filter_type, radius=3, region=(-10.0, 15.0, -5.0, 12.0))
+    x0, x1, z0, z1 = terrain._region_rect((-10.0, 15.0, -5.0, 12.0))
+    result = np.asarray(terrain.heightmap)
+    np.testing.assert_allclose(result[x0:x1, z0:z1], whole[x0:x1, z0:z1], atol=1e-12)
+    result[x0:x1, z0:z1] = heights[x0:x1, z0:z1]
+    np.testing.assert_array_equal(result, heights)
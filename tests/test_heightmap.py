@@ -0,0 +1,152 @@
+# tests/test_heightmap.py
+import json
+
+import numpy as np
+import pytest
+
+from core.heightmap import (HEIGHTMAP_PRECISIONS, PRECISION_DTYPES, QuantizedHeightmap, TiledHeightmap,
+                            quantization_report)
+from core.terrain import Terrain
+
+
+def test_tiled_indexing_matches_dense():
+    rng = np.random.default_rng(0)
+    dense = np.zeros((70, 45))
+    tiled = TiledHeightmap(dense.shape, 16)
+    keys = [(slice(3, 40), slice(10, 44)), (slice(None), slice(5, 6)), (5, slice(None)),
+            (slice(60, 2, -3), slice(1, 44, 7)), (-1, -2), (slice(None), 17)]
+    for key in keys:
+        values = rng.uniform(0, 1, np.shape(dense[key]))
+        dense[key] = values
+        tiled[key] = values
+        np.testing.assert_array_equal(tiled[key], dense[key])
+
+    rows, cols = rng.integers(0, 70, (4, 30)), rng.integers(0, 45, (4, 30))
+    tiled[rows, cols] = rows * 0.5
+    dense[rows, cols] = rows * 0.5
+    np.testing.assert_array_equal(tiled[rows, cols], dense[rows, cols])
+    np.testing.assert_array_equal(np.asarray(tiled), dense)
+    np.testing.assert_array_equal(tiled[:, :], dense)
+    assert (tiled.min(), tiled.max()) == (dense.min(), dense.max())
+    with pytest.raises(IndexError):
+        tiled[70, 0]
+
+
+def test_tiles_are_allocated_lazily():
+    tiled = TiledHeightmap((100, 100), 32)
+    assert tiled.allocated_tiles == 0 and tiled.nbytes == 0
+    assert tiled[50, 50] == 0.0 and tiled[10:90, 10:90].sum() == 0.0
+    tiled[:, :] = 0.0
+    assert tiled.allocated_tiles == 0
+    tiled[30:35, 70:72] = 1.0
+    assert tiled.allocated_tiles == 2
+    assert tiled.nbytes == 2 * 32 * 32 * 8
+
+    tiled[30:35, 70:72] = 0.0
+    assert tiled.compact() == 2 and tiled.allocated_tiles == 0
+
+
+def test_tiled_terrain_only_allocates_edited_tiles():
+    terrain = Terrain(500, 500, 1.0, 10.0, storage="tiled", tile_size=64)
+    assert terrain.heightmap.allocated_tiles == 0
+    terrain.modify_height(0.0, 0.0, 10, 1.0)
+    assert terrain.heightmap.allocated_tiles == 4
+    assert terrain.heightmap.nbytes < 501 * 501 * 8 / 10
+
+
+@pytest.mark.parametrize("precision", HEIGHTMAP_PRECISIONS)
+@pytest.mark.parametrize("storage", ["dense", "tiled"])
+def test_precision_stores_within_quantization_step(storage, precision):
+    rng = np.random.default_rng(0)
+    heights = rng.uniform(0, 20.0, (40, 30))
+    terrain = Terrain(39, 29, 1.0, 20.0, storage=storage, tile_size=16, precision=precision)
+    terrain.heightmap[:, :] = heights
+    stored = np.asarray(terrain.heightmap, dtype=np.float64)
+
+    report = terrain.precision_report()[precision]
+    error = np.abs(stored - heights).max()
+    # uint16 은 반 단계 + float32 복원 오차, 부동소수점은 최댓값에서의 간격 이내
+    if precision == "uint16":
+        bound = report["step_at_max"] / 2 + np.spacing(np.float32(20.0))
+    else:
+        bound = report["step_at_max"]
+    assert error <= bound
+    assert report["bytes_per_cell"] == np.dtype(PRECISION_DTYPES[precision]).itemsize
+    assert terrain.heightmap.nbytes <= heights.size * report["bytes_per_cell"]
+
+
+def test_quantization_report_matches_encoded_error():
+    rng = np.random.default_rng(1)
+    heights = rng.uniform(0, 50.0, (64, 64))
+    report = quantization_report(heights, 50.0)
+    assert report["float64"]["max_error"] == 0.0
+    expected = np.abs(heights.astype(np.float32).astype(np.float64) - heights)
+    assert report["float32"]["max_error"] == expected.max()
+    assert report["uint16"]["step_at_max"] == 50.0 / 65535
+    assert report["float16"]["max_error"] > report["uint16"]["max_error"] > report["float32"]["max_error"]
+    assert report["float16"]["megabytes"] == heights.size * 2 / 1e6
+
+
+def test_quantized_values_clip_to_height_range():
+    terrain = Terrain(10, 10, 1.0, 20.0, precision="uint16")
+    terrain.heightmap[0:3, 0] = [-5.0, 10.0, 25.0]
+    np.testing.assert_allclose(terrain.heightmap[0:3, 0], [0.0, 10.0, 20.0], atol=20.0 / 65535)
+    assert terrain.heightmap.codes.dtype == np.uint16
+
+
+@pytest.mark.parametrize("sidecar", [False, True])
+@pytest.mark.parametrize("precision", HEIGHTMAP_PRECISIONS)
+@pytest.mark.parametrize("storage", ["dense", "tiled"])
+def test_project_roundtrip_keeps_precision_and_storage(tmp_path, storage, precision, sidecar):
+    terrain = Terrain(40, 30, 1.0, 20.0, storage=storage, tile_size=16, precision=precision)
+    terrain.heightmap[:, :] = np.random.default_rng(3).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+
+    # 프로젝트 저장과 같이 높이맵을 .npy 파일로 따로 저장하는 경우 포함
+    path = str(tmp_path / "project_heightmap.npy") if sidecar else None
+    data = json.loads(json.dumps(terrain.get_heightmap_data(path)))
+    assert ("heightmap" in data) != sidecar
+    loaded = Terrain.from_heightmap_data(data, path)
+
+    assert loaded.storage == storage
+    assert loaded.precision == precision
+    assert loaded.heightmap.dtype == terrain.heightmap.dtype
+    if precision == "uint16":
+        assert isinstance(loaded.heightmap, QuantizedHeightmap)
+        np.testing.assert_array_equal(np.asarray(loaded.heightmap.codes), np.asarray(terrain.heightmap.codes))
+    else:
+        assert loaded.heightmap.dtype == PRECISION_DTYPES[precision]
+    np.testing.assert_array_equal(np.asarray(loaded.heightmap), np.asarray(terrain.heightmap))
+
+
+@pytest.mark.parametrize("precision", HEIGHTMAP_PRECISIONS)
+def test_memmap_project_roundtrip(tmp_path, precision):
+    terrain = Terrain(40, 30, 1.0, 20.0, storage="memmap", precision=precision,
+                      heightmap_path=str(tmp_path / "work.npy"))
+    terrain.heightmap[:, :] = np.random.default_rng(5).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+
+    saved_path = str(tmp_path / "project_heightmap.npy")
+    data = json.loads(json.dumps(terrain.get_heightmap_data(saved_path)))
+    loaded = Terrain.from_heightmap_data(data, saved_path)
+
+    assert loaded.storage == "memmap"
+    assert loaded.precision == precision
+    np.testing.assert_array_equal(np.asarray(loaded.heightmap), np.asarray(terrain.heightmap))
+
+
+def test_memmap_edits_match_dense_and_reach_disk(tmp_path):
+    path = str(tmp_path / "work.npy")
+    mapped = Terrain(60, 40, 1.0, 20.0, storage="memmap", heightmap_path=path)
+    dense = Terrain(60, 40, 1.0, 20.0)
+    for terrain in (mapped, dense):
+        terrain.heightmap[:, :] = np.random.default_rng(2).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+        terrain.modify_height(5.0, -3.0, 8, 1.0)
+        terrain.add_platform(-10.0, 4.0, 8, 6, 15.0)
+    mapped.flush()
+    np.testing.assert_array_equal(np.asarray(mapped.heightmap), np.asarray(dense.heightmap))
+    np.testing.assert_array_equal(np.load(path), np.asarray(dense.heightmap))
+
+    # 같은 파일을 다시 열면 기존 값을 그대로 사용
+    reopened = Terrain(60, 40, 1.0, 20.0, storage="memmap", heightmap_path=path)
+    np.testing.assert_array_equal(np.asarray(reopened.heightmap), np.asarray(dense.heightmap))
+    with pytest.raises(ValueError):
+        Terrain(60, 40, 1.0, 20.0, storage="memmap", precision="float32", heightmap_path=path)
@@ -0,0 +1,79 @@
+# tests/test_history.py
+import numpy as np
+import pytest
+
+from core.heightmap import HEIGHTMAP_PRECISIONS
+from core.terrain import Terrain
+
+
+def _hills(terrain, seed):
+    """부드러운 무작위 언덕 높이 기록"""
+    rng = np.random.default_rng(seed)
+    i, j = np.indices(terrain.heightmap.shape)
+    heights = np.zeros(terrain.heightmap.shape)
+    for _ in range(4):
+        fx, fz = rng.uniform(0.02, 0.2, size=2)
+        phase = rng.uniform(0.0, 2 * np.pi)
+        heights += np.sin(i * fx + phase) * np.cos(j * fz)
+    terrain.heightmap[:, :] = (heights / 8 + 0.5) * terrain.height_scale
+
+
+@pytest.mark.parametrize("precision", HEIGHTMAP_PRECISIONS)
+def test_undo_redo_restores_exact_heights(precision):
+    terrain = Terrain(150, 120, 1.0, 20.0, storage="tiled", tile_size=32, precision=precision)
+    _hills(terrain, 1)
+    original = np.asarray(terrain.heightmap).copy()
+
+    for k in range(10):
+        terrain.modify_height(-40 + 8 * k, 10 - 2 * k, 6, 0.8)
+    terrain.smooth_area(0, 0, 12, 0.5)
+    terrain.history.commit("stroke")
+    edited = np.asarray(terrain.heightmap).copy()
+    assert not np.array_equal(edited, original)
+
+    terrain.history.undo()
+    np.testing.assert_array_equal(np.asarray(terrain.heightmap), original)
+    terrain.history.redo()
+    np.testing.assert_array_equal(np.asarray(terrain.heightmap), edited)
+
+
+def test_pending_snapshots_are_compressed_and_counted():
+    terrain = Terrain(255, 255, 1.0, 20.0)
+    _hills(terrain, 2)
+    terrain.history.touch((0, terrain.grid_width, 0, terrain.grid_length))
+
+    stats = terrain.history.stats()
+    assert stats["pending_tiles"] == 16
+    assert 0 < stats["pending_nbytes"] < terrain.heightmap.nbytes
+
+
+def test_pending_snapshots_evict_old_steps():
+    terrain = Terrain(127, 127, 1.0, 20.0)
+    _hills(terrain, 2)
+    terrain.modify_height(0, 0, 5, 1.0)
+    terrain.history.commit("small")
+    small = terrain.history.nbytes
+
+    # 변경 없는 스냅샷 크기 측정 (commit 해도 단계가 생기지 않음)
+    terrain.history.touch((0, 64, 0, 64))
+    pending = terrain.history.pending_nbytes
+    assert terrain.history.commit() is None
+
+    terrain.history.budget = small + pending - 1
+    terrain.history.touch((0, 64, 0, 64))
+    stats = terrain.history.stats()
+    assert stats["undo"] == 0
+    assert stats["pending_nbytes"] == pending
+
+
+def test_edit_larger_than_budget_is_not_recorded():
+    terrain = Terrain(127, 127, 1.0, 20.0, history_budget=1024)
+    _hills(terrain, 4)
+    before = np.asarray(terrain.heightmap).copy()
+
+    terrain.smooth_area(0, 0, 100, 0.5)
+    assert terrain.history.stats()["pending_tiles"] == 0
+    assert terrain.history.commit("smooth") is None
+    assert not terrain.history.can_undo()
+    assert terrain.history.undo() is None
+    assert not np.array_equal(np.asarray(terrain.heightmap), before)
@@ -0,0 +1,88 @@
+# tests/test_mesh.py
+import numpy as np
+import pytest
+import trimesh
+
+from core.terrain import Terrain, grid_faces
+
+
+def reference_mesh(terrain):
+    """셀 단위 반복 구현 (벡터화 전 동작)"""
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    n_rows, n_cols = heights.shape
+    vertices = []
+    for row in range(n_rows):
+        for col in range(n_cols):
+            vertices.append([col * terrain.resolution - terrain.width / 2,
+                             heights[row, col] * terrain.height_scale,
+                             row * terrain.resolution - terrain.length / 2])
+    faces = []
+    for row in range(n_rows - 1):
+        for col in range(n_cols - 1):
+            v0, v2 = row * n_cols + col, (row + 1) * n_cols + col
+            faces.append([v0, v0 + 1, v2 + 1])
+            faces.append([v0, v2 + 1, v2])
+    return np.array(vertices), np.array(faces)
+
+
+@pytest.mark.parametrize("size", [(30, 30, 1.0), (40, 25, 2.0)])
+def test_mesh_matches_cell_loop(size):
+    terrain = Terrain(*size, 10.0)
+    terrain.heightmap[:, :] = np.random.default_rng(8).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    vertices, faces = terrain._generate_mesh()
+    expected_vertices, expected_faces = reference_mesh(terrain)
+    assert vertices.dtype == np.float32 and faces.dtype == np.uint32
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=1e-6, atol=1e-5)
+    np.testing.assert_array_equal(faces, expected_faces)
+
+
+def test_faces_are_cached_and_read_only():
+    terrain = Terrain(30, 30, 1.0, 10.0)
+    _, faces = terrain._generate_mesh()
+    terrain.modify_height(0.0, 0.0, 5, 1.0)
+    assert terrain._generate_mesh()[1] is faces
+    assert grid_faces(*terrain.heightmap.shape) is faces
+    with pytest.raises(ValueError):
+        faces[0, 0] = 1
+
+
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 16}])
+def test_incremental_update_matches_full_rebuild(options):
+    terrain = Terrain(60, 40, 1.0, 10.0, **options)
+    terrain.heightmap[:, :] = np.random.default_rng(9).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    terrain.update_mesh()
+    vertices, normals = terrain.vertices, terrain.normals
+
+    rng = np.random.default_rng(0)
+    for k in range(15):
+        x, z = rng.uniform(-32, 32), rng.uniform(-22, 22)
+        if k % 3 == 0:
+            terrain.add_platform(x, z, rng.uniform(2, 10), rng.uniform(2, 10), rng.uniform(2, 8))
+        elif k % 5 == 0:
+            terrain.add_ramp(x, z, x + 8, z - 5, 4, 1.0, 6.0)
+        else:
+            terrain.modify_height(x, z, rng.uniform(1, 6), 1.0, add=k % 2 == 0)
+        if k % 4 == 0:
+            terrain.history.commit()
+            terrain.history.undo()
+        terrain.update_mesh()
+    terrain.erode("thermal", iterations=5, region=(-10.0, 10.0, -5.0, 5.0))
+    terrain.update_mesh()
+
+    # 버퍼는 그대로 두고 제자리에서 갱신
+    assert terrain.vertices is vertices and terrain.normals is normals
+    expected_vertices, _ = terrain._generate_mesh()
+    expected_normals = terrain._grid_normals(0, terrain.heightmap.shape[0], 0, terrain.heightmap.shape[1])
+    np.testing.assert_allclose(terrain.vertices, expected_vertices, atol=1e-5)
+    np.testing.assert_allclose(terrain.normals, expected_normals, atol=1e-5)
+
+
+def test_grid_normals_match_face_normals_on_plane():
+    terrain = Terrain(20, 20, 1.0, 10.0)
+    i, j = np.indices(terrain.heightmap.shape)
+    terrain.heightmap[:, :] = 0.05 * i + 0.02 * j
+    terrain.update_mesh(full=True)
+    face_normal = trimesh.Trimesh(terrain.vertices, terrain.faces, process=False).face_normals[0].copy()
+    # 격자 감기 방향은 아래(-Y)를 향하고 정점 법선은 위(+Y)를 향함
+    face_normal *= np.sign(face_normal[1])
+    np.testing.assert_allclose(terrain.normals, np.broadcast_to(face_normal, terrain.normals.shape), atol=1e-5)
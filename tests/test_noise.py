@@ -0,0 +1,30 @@
+# tests/test_noise.py
+import numpy as np
+import pytest
+
+from core.noise import NOISE_TYPES
+from core.terrain import Terrain
+
+
+@pytest.mark.parametrize("noise_type", NOISE_TYPES)
+def test_generate_is_deterministic_and_chunk_independent(noise_type):
+    whole = Terrain(90, 70, 1.0, 20.0)
+    whole.generate(noise_type, seed=7, chunk_size=512)
+    chunked = Terrain(90, 70, 1.0, 20.0, storage="tiled", tile_size=32)
+    chunked.generate(noise_type, seed=7, chunk_size=17)
+    np.testing.assert_array_equal(np.asarray(chunked.heightmap), np.asarray(whole.heightmap))
+
+    other = Terrain(90, 70, 1.0, 20.0)
+    other.generate(noise_type, seed=8)
+    assert not np.array_equal(np.asarray(other.heightmap), np.asarray(whole.heightmap))
+
+
+def test_generate_leaves_mesh_to_subscribers():
+    terrain = Terrain(80, 60, 1.0, 20.0)
+    terrain.update_mesh()
+    terrain.generate("fbm", seed=1, chunk_size=32)
+    assert terrain.vertices[:, 1].max() == 0.0
+
+    terrain.update_mesh()
+    vertices, _ = terrain._generate_mesh()
+    np.testing.assert_array_equal(terrain.vertices, vertices)
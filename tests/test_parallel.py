@@ -0,0 +1,33 @@
+# tests/test_parallel.py
+import numpy as np
+import pytest
+
+from core.heightmap import HEIGHTMAP_STORAGES, HEIGHTMAP_PRECISIONS
+from core.terrain import Terrain
+
+
+def make_terrain(tmp_path, name, storage, precision):
+    path = str(tmp_path / f"{name}.npy") if storage == "memmap" else None
+    return Terrain(60, 45, 1.0, 20.0, storage=storage, precision=precision, heightmap_path=path)
+
+
+@pytest.mark.parametrize("precision", HEIGHTMAP_PRECISIONS)
+@pytest.mark.parametrize("storage", HEIGHTMAP_STORAGES)
+def test_parallel_matches_serial(tmp_path, storage, precision):
+    serial = make_terrain(tmp_path, "serial", storage, precision)
+    parallel = make_terrain(tmp_path, "parallel", storage, precision)
+    try:
+        serial.generate("fbm", seed=7, chunk_size=16)
+        parallel.generate("fbm", seed=7, chunk_size=16, workers=2)
+        np.testing.assert_array_equal(np.asarray(parallel.heightmap), np.asarray(serial.heightmap))
+
+        serial.erode("hydraulic", iterations=3)
+        parallel.erode("hydraulic", iterations=3, workers=2, tile_size=16)
+        np.testing.assert_array_equal(np.asarray(parallel.heightmap), np.asarray(serial.heightmap))
+
+        serial.apply_filter("gaussian", radius=3)
+        parallel.apply_filter("gaussian", radius=3, workers=2, tile_size=16)
+        np.testing.assert_array_equal(np.asarray(parallel.heightmap), np.asarray(serial.heightmap))
+    finally:
+        serial.close()
+        parallel.close()
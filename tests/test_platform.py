@@ -0,0 +1,73 @@
+# tests/test_platform.py
+import numpy as np
+import pytest
+
+from core.terrain import Terrain
+
+
+def reference_platform(terrain, heights, center_x, center_z, width, length, height, rotation=0.0, shape="box"):
+    """셀 단위 반복 구현 (회전/원형은 플랫폼 기준 좌표에서 같은 규칙 적용)"""
+    half_width, half_length = width / 2, length / 2
+    angle = np.radians(rotation)
+    cos_a, sin_a = np.cos(angle), np.sin(angle)
+    for col in range(terrain.cols):
+        for row in range(terrain.rows):
+            x = col / terrain.resolution - terrain.width / 2 - center_x
+            z = row / terrain.resolution - terrain.length / 2 - center_z
+            dx = abs(x * cos_a + z * sin_a) / half_width
+            dz = abs(z * cos_a - x * sin_a) / half_length
+            if shape == "circle":
+                dr = np.sqrt(dx ** 2 + dz ** 2)
+                if dr > 1.0:
+                    continue
+                edge_factor = min(1.0, (1.0 - dr) * 5)
+            else:
+                if dx > 1.0 or dz > 1.0:
+                    continue
+                edge_factor = min(1.0, (1.0 - dx) * 5) * min(1.0, (1.0 - dz) * 5)
+            current_height = heights[col, row]
+            if height > current_height:
+                heights[col, row] = max(current_height, current_height * (1 - edge_factor) + height * edge_factor)
+
+
+def _random_platforms(rng, count):
+    return (rng.uniform(-35, 35, count), rng.uniform(-25, 25, count), rng.uniform(2, 15, count),
+            rng.uniform(2, 15, count), rng.uniform(2, 9, count), rng.uniform(0, 360, count),
+            rng.choice(["box", "circle"], count))
+
+
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 16}])
+def test_platform_matches_cell_loop(options):
+    terrain = Terrain(70, 50, 2.0, 10.0, **options)
+    terrain.heightmap[:, :] = np.random.default_rng(6).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    expected = np.asarray(terrain.heightmap, dtype=np.float64).copy()
+    rng = np.random.default_rng(0)
+    for platform in zip(*_random_platforms(rng, 12)):
+        terrain.add_platform(*platform)
+        reference_platform(terrain, expected, *platform)
+    np.testing.assert_allclose(np.asarray(terrain.heightmap), expected, atol=1e-9)
+
+
+def test_axis_aligned_box_keeps_original_rule():
+    terrain = Terrain(40, 40, 1.0, 10.0)
+    expected = np.asarray(terrain.heightmap, dtype=np.float64).copy()
+    terrain.add_platform(3.0, -4.0, 10.0, 6.0, 5.0)
+    reference_platform(terrain, expected, 3.0, -4.0, 10.0, 6.0, 5.0)
+    np.testing.assert_array_equal(np.asarray(terrain.heightmap), expected)
+    assert expected.max() == 5.0
+
+
+def test_batch_matches_single_calls():
+    rng = np.random.default_rng(1)
+    # 겹치는 플랫폼이 많아 여러 웨이브로 나뉨
+    platforms = _random_platforms(rng, 200)
+    single = Terrain(70, 50, 2.0, 10.0)
+    single.heightmap[:, :] = np.random.default_rng(7).uniform(0, single.height_scale, single.heightmap.shape)
+    batch = Terrain(70, 50, 2.0, 10.0)
+    batch.heightmap[:, :] = np.random.default_rng(7).uniform(0, batch.height_scale, batch.heightmap.shape)
+
+    for platform in zip(*platforms):
+        single.add_platform(*platform)
+    batch.add_platforms(*platforms[:5], rotations=platforms[5], shapes=platforms[6])
+    np.testing.assert_array_equal(np.asarray(batch.heightmap), np.asarray(single.heightmap))
+    assert batch.terrain_objects == single.terrain_objects
@@ -0,0 +1,46 @@
+# tests/test_pyramid.py
+import numpy as np
+import pytest
+
+from core.terrain import Terrain
+
+
+def _reference_level(heights, level):
+    """레벨 셀마다 원본 블록의 최소/최대/평균을 직접 계산"""
+    span = 1 << level
+    rows, cols = -(-heights.shape[0] // span), -(-heights.shape[1] // span)
+    padded = np.full((rows * span, cols * span), np.nan)
+    padded[:heights.shape[0], :heights.shape[1]] = heights
+    blocks = padded.reshape(rows, span, cols, span)
+    return (np.nanmin(blocks, axis=(1, 3)), np.nanmax(blocks, axis=(1, 3)),
+            np.nanmean(blocks, axis=(1, 3)))
+
+
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 48}])
+def test_incremental_levels_match_full_reduction(options):
+    # 300 행이면 레벨 1 이 COPY_ROWS 띠 두 개로 나뉘어 계산된다
+    terrain = Terrain(300, 140, 1.0, 20.0, **options)
+    terrain.heightmap[:, :] = np.random.default_rng(3).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    terrain.get_level(1)
+    rng = np.random.default_rng(0)
+    for k in range(20):
+        terrain.modify_height(rng.uniform(-150, 150), rng.uniform(-70, 70), rng.uniform(2, 15), 1.0)
+        if k % 6 == 0:
+            terrain.get_level(2)
+
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    for level in range(terrain.pyramid.num_levels):
+        cells = terrain.get_level(level)
+        for key, expected in zip(("min", "max", "mean"), _reference_level(heights, level)):
+            np.testing.assert_allclose(cells[key], expected, rtol=1e-6, atol=1e-5)
+
+
+@pytest.mark.parametrize("level", [0, 1, 3])
+def test_window_matches_full_level(level):
+    terrain = Terrain(200, 120, 1.0, 20.0)
+    terrain.heightmap[:, :] = np.random.default_rng(4).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    window = (3, 17, 2, 9)
+    full = terrain.get_level(level)
+    part = terrain.get_level(level, window)
+    for key in ("min", "max", "mean"):
+        np.testing.assert_array_equal(part[key], full[key][3:17, 2:9])
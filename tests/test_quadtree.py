@@ -0,0 +1,88 @@
+# tests/test_quadtree.py
+import numpy as np
+import pytest
+
+from core.terrain import Terrain
+
+
+@pytest.fixture(params=[{}, {"storage": "tiled", "tile_size": 16}])
+def terrain(request):
+    terrain = Terrain(70, 45, 1.0, 20.0, **request.param)
+    # 위를 향하는 광선의 시작 높이(5 이상)보다 낮은 무작위 높이
+    terrain.heightmap[:, :] = np.random.default_rng(11).uniform(0, 4.0, terrain.heightmap.shape)
+    return terrain
+
+
+def brute_force_raycast(terrain, origin, direction):
+    """모든 격자 셀 기둥과 광선의 교차를 직접 계산해 가장 가까운 t 반환"""
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    i, j = np.indices(heights.shape)
+    bounds = [(i / terrain.resolution - terrain.width / 2, (i + 1) / terrain.resolution - terrain.width / 2),
+              (np.full(heights.shape, -np.inf), heights),
+              (j / terrain.resolution - terrain.length / 2, (j + 1) / terrain.resolution - terrain.length / 2)]
+    t_enter, t_exit = np.zeros(heights.shape), np.full(heights.shape, np.inf)
+    for axis, (low, high) in enumerate(bounds):
+        if direction[axis] == 0:
+            outside = (origin[axis] < low) | (origin[axis] > high)
+            t_exit = np.where(outside, -np.inf, t_exit)
+            continue
+        with np.errstate(invalid="ignore"):
+            t1 = (low - origin[axis]) / direction[axis]
+            t2 = (high - origin[axis]) / direction[axis]
+        t_enter = np.maximum(t_enter, np.minimum(t1, t2))
+        t_exit = np.minimum(t_exit, np.maximum(t1, t2))
+    hit = t_enter <= t_exit
+    return t_enter[hit].min() if hit.any() else np.inf
+
+
+def test_region_min_max_matches_brute_force(terrain):
+    terrain.modify_height(3.0, -2.0, 6, 1.0)
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        min_x, max_x = np.sort(rng.uniform(-40, 40, 2))
+        min_z, max_z = np.sort(rng.uniform(-27, 27, 2))
+        result = terrain.region_min_max(min_x, max_x, min_z, max_z)
+
+        x0 = max(0, int(np.floor((min_x + terrain.width / 2) * terrain.resolution)))
+        x1 = max(0, int(np.floor((max_x + terrain.width / 2) * terrain.resolution)) + 1)
+        z0 = max(0, int(np.floor((min_z + terrain.length / 2) * terrain.resolution)))
+        z1 = max(0, int(np.floor((max_z + terrain.length / 2) * terrain.resolution)) + 1)
+        block = heights[x0:x1, z0:z1]
+        if block.size == 0:
+            assert result is None
+        else:
+            assert result == pytest.approx((block.min(), block.max()))
+    assert terrain.region_min_max(50.0, 60.0, 0.0, 1.0) is None
+
+
+def test_raycast_matches_brute_force(terrain):
+    rng = np.random.default_rng(1)
+    origins = np.column_stack([rng.uniform(-50, 50, 60), rng.uniform(5, 40, 60), rng.uniform(-35, 35, 60)])
+    targets = np.column_stack([rng.uniform(-35, 35, 60), np.zeros(60), rng.uniform(-22, 22, 60)])
+    directions = targets - origins
+    # 축과 평행한 광선과 위를 향하는 광선도 포함
+    origins[:5, [0, 2]] = targets[:5, [0, 2]]
+    directions[:5, [0, 2]] = 0.0
+    directions[5:8, 1] = 1.0
+
+    hits, ts, points = terrain.raycast_batch(origins, directions)
+    for k in range(len(origins)):
+        expected = brute_force_raycast(terrain, origins[k], directions[k])
+        assert hits[k] == np.isfinite(expected)
+        if hits[k]:
+            assert ts[k] == pytest.approx(expected, abs=1e-9)
+            np.testing.assert_allclose(points[k], origins[k] + directions[k] * expected, atol=1e-9)
+    assert hits[:5].all() and not hits[5:8].any()
+
+    first = terrain.raycast(origins[10], directions[10])
+    np.testing.assert_allclose(first, points[10])
+
+
+def test_raycast_follows_edits(terrain):
+    origin, direction = (0.5, 100.0, 0.5), (0.0, -1.0, 0.0)
+    terrain.raycast(origin, direction)
+    terrain.add_platform(0.0, 0.0, 6, 6, 19.0)
+    point = terrain.raycast(origin, direction)
+    assert point[1] == pytest.approx(terrain.get_height_at_point(0.5, 0.5))
+    assert point[1] > 18.0
@@ -0,0 +1,104 @@
+# tests/test_ramp.py
+import math
+
+import numpy as np
+import pytest
+
+from core.terrain import Terrain
+
+
+def reference_ramp(terrain, heights, start_x, start_z, end_x, end_z, width, start_height, end_height):
+    """셀 단위 반복 구현 (벡터화 전 동작)"""
+    dx, dz = end_x - start_x, end_z - start_z
+    length = math.sqrt(dx ** 2 + dz ** 2)
+    dx, dz = dx / length, dz / length
+    half_width = width / 2
+    min_col = max(0, int((min(start_x, end_x) - half_width + terrain.width / 2) / terrain.resolution))
+    max_col = min(terrain.cols - 1, int((max(start_x, end_x) + half_width + terrain.width / 2) / terrain.resolution))
+    min_row = max(0, int((min(start_z, end_z) - half_width + terrain.length / 2) / terrain.resolution))
+    max_row = min(terrain.rows - 1, int((max(start_z, end_z) + half_width + terrain.length / 2) / terrain.resolution))
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            x = col * terrain.resolution - terrain.width / 2
+            z = row * terrain.resolution - terrain.length / 2
+            t = ((x - start_x) * dx + (z - start_z) * dz) / length
+            if t < 0 or t > 1:
+                continue
+            dist = math.sqrt((x - start_x - t * (end_x - start_x)) ** 2 + (z - start_z - t * (end_z - start_z)) ** 2)
+            if dist <= half_width:
+                weight = 1.0 - (dist / half_width) ** 2
+                ramp_height = start_height * (1 - t) + end_height * t
+                heights[row, col] = heights[row, col] * (1 - weight) + ramp_height * weight
+
+
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 16}])
+def test_ramp_matches_cell_loop(options):
+    terrain = Terrain(64, 64, 1.0, 10.0, **options)
+    terrain.heightmap[:, :] = np.random.default_rng(2).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    expected = np.asarray(terrain.heightmap, dtype=np.float64).copy()
+
+    rng = np.random.default_rng(0)
+    # 격자 밖으로 나가는 경사로도 포함
+    for _ in range(10):
+        start, end = rng.uniform(-40, 40, 2), rng.uniform(-40, 40, 2)
+        width, low, high = rng.uniform(2, 10), rng.uniform(0, 3), rng.uniform(3, 9)
+        terrain.add_ramp(start[0], start[1], end[0], end[1], width, low, high)
+        reference_ramp(terrain, expected, start[0], start[1], end[0], end[1], width, low, high)
+    np.testing.assert_allclose(np.asarray(terrain.heightmap), expected, atol=1e-9)
+
+
+def test_ramp_path_uses_nearest_segment():
+    terrain = Terrain(64, 64, 1.0, 10.0)
+    terrain.heightmap[:, :] = np.random.default_rng(3).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    original = np.asarray(terrain.heightmap, dtype=np.float64).copy()
+    points = np.array([(-25.0, -20.0), (0.0, 5.0), (20.0, -10.0), (22.0, 25.0)])
+    vertex_heights = np.array([1.0, 6.0, 3.0, 8.0])
+    terrain.add_ramp_path(points, 6.0, vertex_heights)
+
+    # 격자점마다 모든 구간을 비교해 가장 가까운 구간 하나만 반영
+    # (경로 양 끝만 선분 밖을 제외하고, 안쪽 정점은 정점까지의 거리)
+    expected = original.copy()
+    last = len(points) - 2
+    for row in range(terrain.rows):
+        for col in range(terrain.cols):
+            x, z = col - terrain.width / 2, row - terrain.length / 2
+            best = None
+            for k in range(len(points) - 1):
+                (sx, sz), (ex, ez) = points[k], points[k + 1]
+                t = ((x - sx) * (ex - sx) + (z - sz) * (ez - sz)) / ((ex - sx) ** 2 + (ez - sz) ** 2)
+                if (k == 0 and t < 0) or (k == last and t > 1):
+                    continue
+                t = min(max(t, 0.0), 1.0)
+                dist = math.hypot(x - sx - t * (ex - sx), z - sz - t * (ez - sz))
+                if dist <= 3.0 and (best is None or dist < best[0]):
+                    best = (dist, t, k)
+            if best is not None:
+                dist, t, k = best
+                weight = 1.0 - (dist / 3.0) ** 2
+                ramp_height = vertex_heights[k] * (1 - t) + vertex_heights[k + 1] * t
+                expected[row, col] = original[row, col] * (1 - weight) + ramp_height * weight
+    np.testing.assert_allclose(np.asarray(terrain.heightmap), expected, atol=1e-9)
+
+
+def test_ramp_path_bend_has_no_gap():
+    terrain = Terrain(100, 100, 1, 20)
+    terrain.add_ramp_path([(-30, 0), (0, 0), (0, 30)], 10, [5, 5, 5])
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+
+    # 꺾은선까지의 거리가 반폭보다 작은 격자점은 모두 높아져야 함 (경로 양 끝은 평평하게 끊김)
+    z, x = np.indices(heights.shape) - 50.0
+    to_first = np.where(x >= -30, np.hypot(x - np.minimum(x, 0), z), np.inf)
+    to_second = np.where(z <= 30, np.hypot(x, z - np.maximum(z, 0)), np.inf)
+    near = np.minimum(to_first, to_second) < 5
+    assert near[45:50, 51:56].any()
+    assert np.all(heights[near] > 0)
+    assert np.all(heights[~near] == 0)
+
+
+def test_ramp_path_two_heights_follow_path_length():
+    straight = Terrain(64, 64, 1.0, 10.0)
+    path = Terrain(64, 64, 1.0, 10.0)
+    # 같은 직선을 정점 3개로 나누면 구간 길이에 비례해 높이가 보간됨
+    straight.add_ramp(-20.0, 0.0, 20.0, 0.0, 6.0, 2.0, 8.0)
+    path.add_ramp_path([(-20.0, 0.0), (10.0, 0.0), (20.0, 0.0)], 6.0, (2.0, 8.0))
+    np.testing.assert_allclose(np.asarray(path.heightmap), np.asarray(straight.heightmap), atol=1e-9)
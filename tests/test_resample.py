@@ -0,0 +1,58 @@
+# tests/test_resample.py
+import json
+
+import numpy as np
+import pytest
+
+from core.resample import RESAMPLE_MODES, resample_heightmap
+from core.terrain import Terrain
+from core.unity_exporter import UnityExporter
+
+
+@pytest.fixture
+def terrain():
+    terrain = Terrain(200, 100, 1.0, 20.0)
+    terrain.generate("fbm", seed=6)
+    return terrain
+
+
+@pytest.mark.parametrize("mode", RESAMPLE_MODES)
+def test_tiles_match_single_block(terrain, mode):
+    whole = np.empty((150, 80))
+    tiled = np.empty((150, 80))
+    scale = (200 / 149, 100 / 79)
+    resample_heightmap(terrain.heightmap, whole, scale, mode, chunk_size=1024)
+    resample_heightmap(terrain.heightmap, tiled, scale, mode, chunk_size=37)
+    np.testing.assert_allclose(tiled, whole, atol=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["nearest", "bilinear", "bicubic"])
+def test_same_resolution_is_identity(terrain, mode):
+    same = terrain.resample(terrain.resolution, mode)
+    np.testing.assert_allclose(np.asarray(same.heightmap), np.asarray(terrain.heightmap), atol=1e-12)
+
+
+def test_power_of_two_snaps_both_axes(terrain):
+    snapped = terrain.resample(power_of_two=True, storage="tiled")
+    assert snapped.heightmap.shape == (257, 129)
+    assert snapped.vertices is None
+
+
+def test_power_of_two_rejects_unsnappable_aspect():
+    terrain = Terrain(200, 120, 1.0, 20.0)
+    with pytest.raises(ValueError):
+        terrain.resample(power_of_two=True)
+
+
+def test_unity_export_writes_square_grid(tmp_path):
+    terrain = Terrain(200, 120, 1.0, 20.0)
+    terrain.generate("fbm", seed=6)
+    heights = terrain.unity_heightmap()
+    assert heights.shape == (257, 257)
+    corners = np.asarray(terrain.heightmap)[[0, 0, -1, -1], [0, -1, 0, -1]]
+    np.testing.assert_allclose(heights[[0, 0, -1, -1], [0, -1, 0, -1]], corners)
+
+    path = tmp_path / "terrain.json"
+    UnityExporter.export(terrain, str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    np.testing.assert_allclose(np.array(data["terrain"]["heightmap"]), heights)
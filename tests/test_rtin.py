@@ -0,0 +1,86 @@
+# tests/test_rtin.py
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from core.heightmap import TiledHeightmap
+from core.noise import noise_heights
+from core.rtin import rtin_errors, rtin_mesh
+from core.terrain import Terrain
+
+
+def _heights(shape):
+    x = np.arange(shape[0], dtype=np.float64)
+    z = np.arange(shape[1], dtype=np.float64)
+    return noise_heights(x[:, None], z[None, :], 10.0, "fbm", seed=1)
+
+
+def _max_error(grid_points, faces, heights):
+    """모든 격자점에서 삼각형 평면 높이와 실제 높이의 최대 차이"""
+    worst = 0.0
+    for a, b, c in grid_points[faces]:
+        lo, hi = np.minimum(np.minimum(a, b), c), np.maximum(np.maximum(a, b), c)
+        px, pz = np.meshgrid(np.arange(lo[0], hi[0] + 1), np.arange(lo[1], hi[1] + 1), indexing="ij")
+        det = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+        wb = ((px - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (pz - a[1])) / det
+        wc = ((b[0] - a[0]) * (pz - a[1]) - (px - a[0]) * (b[1] - a[1])) / det
+        inside = (wb >= 0) & (wc >= 0) & (wb + wc <= 1)
+        plane = heights[tuple(a)] * (1 - wb - wc) + heights[tuple(b)] * wb + heights[tuple(c)] * wc
+        worst = max(worst, np.abs(plane - heights[px, pz])[inside].max())
+    return worst
+
+
+def _assert_crack_free(grid_points, faces, shape):
+    """T 접합 없음, 내부 변은 삼각형 두 개가 공유, 면적 합 = 격자 면적"""
+    triangles = grid_points[faces]
+    vertices = {tuple(p) for p in grid_points}
+    edges = Counter()
+    for triangle in triangles:
+        for p, q in ((0, 1), (1, 2), (2, 0)):
+            start, end = triangle[p], triangle[q]
+            edges[tuple(sorted((tuple(start), tuple(end))))] += 1
+            steps = np.abs(end - start).max()
+            for k in range(1, steps):
+                assert tuple(start + (end - start) // steps * k) not in vertices
+    for (start, end), count in edges.items():
+        on_border = any(start[axis] == end[axis] in (0, shape[axis] - 1) for axis in (0, 1))
+        assert count == (1 if on_border else 2)
+
+    edge1 = triangles[:, 1] - triangles[:, 0]
+    edge2 = triangles[:, 2] - triangles[:, 0]
+    area = np.abs(edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]).sum() / 2
+    assert area == (shape[0] - 1) * (shape[1] - 1)
+
+
+@pytest.mark.parametrize("shape", [(65, 65), (60, 37), (33, 140)])
+@pytest.mark.parametrize("max_error", [0.0, 0.05, 0.5])
+def test_error_bound_and_crack_free(shape, max_error):
+    heights = _heights(shape)
+    grid_points, faces = rtin_mesh(heights, max_error)
+    assert _max_error(grid_points, faces, heights) <= max_error + 1e-9
+    _assert_crack_free(grid_points, faces, shape)
+
+
+def test_errors_independent_of_band_and_storage():
+    heights = _heights((90, 50))
+    tiled = TiledHeightmap(heights.shape, 16)
+    tiled[:, :] = heights
+    expected = rtin_errors(heights)
+    assert expected.shape == (129, 65)
+    np.testing.assert_array_equal(rtin_errors(heights, band_rows=6), expected)
+    np.testing.assert_array_equal(rtin_errors(tiled, band_rows=10), expected)
+
+
+def test_adaptive_mesh_error_is_in_metres():
+    terrain = Terrain(60, 40, 1.0, 25.0)
+    terrain.generate("fbm", seed=4)
+    vertices, faces = terrain.adaptive_mesh(0.5)
+    full, _ = terrain._generate_mesh()
+    mesh_heights = full[:, 1].reshape(terrain.heightmap.shape).astype(np.float64)
+
+    grid_points = np.stack([np.round((vertices[:, 2] + terrain.length / 2) / terrain.resolution),
+                            np.round((vertices[:, 0] + terrain.width / 2) / terrain.resolution)],
+                           axis=1).astype(np.int64)
+    assert _max_error(grid_points, faces, mesh_heights) <= 0.5 + 1e-4
+    assert len(faces) < 2 * (terrain.grid_width - 1) * (terrain.grid_length - 1)
@@ -0,0 +1,58 @@
+# tests/test_sampling.py
+import numpy as np
+import pytest
+
+from core.sampling import SAMPLE_MODES
+from core.terrain import Terrain
+
+
+@pytest.fixture
+def terrain():
+    terrain = Terrain(60, 40, 2.0, 20.0, storage="tiled", tile_size=16)
+    terrain.heightmap[:, :] = np.random.default_rng(5).uniform(0, terrain.height_scale, terrain.heightmap.shape)
+    return terrain
+
+
+@pytest.mark.parametrize("mode", SAMPLE_MODES)
+def test_grid_points_return_stored_heights(terrain, mode):
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    i, j = np.meshgrid(np.arange(0, terrain.grid_width, 7), np.arange(0, terrain.grid_length, 5), indexing="ij")
+    xs = i / terrain.resolution - terrain.width / 2
+    zs = j / terrain.resolution - terrain.length / 2
+    np.testing.assert_allclose(terrain.sample_heights(xs, zs, mode), heights[i, j], atol=1e-9)
+
+
+def test_bilinear_matches_cell_interpolation(terrain):
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    rng = np.random.default_rng(1)
+    gx = rng.uniform(0, terrain.grid_width - 1, 200)
+    gz = rng.uniform(0, terrain.grid_length - 1, 200)
+    ix = np.minimum(gx.astype(int), terrain.grid_width - 2)
+    iz = np.minimum(gz.astype(int), terrain.grid_length - 2)
+    fx, fz = gx - ix, gz - iz
+    expected = (heights[ix, iz] * (1 - fx) * (1 - fz) + heights[ix, iz + 1] * (1 - fx) * fz +
+                heights[ix + 1, iz] * fx * (1 - fz) + heights[ix + 1, iz + 1] * fx * fz)
+
+    xs = gx / terrain.resolution - terrain.width / 2
+    zs = gz / terrain.resolution - terrain.length / 2
+    np.testing.assert_allclose(terrain.sample_heights(xs, zs, "bilinear"), expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("mode", SAMPLE_MODES)
+def test_off_grid_positions(terrain, mode):
+    xs = np.array([-31.0, 0.0, 45.0])
+    zs = np.array([0.0, 25.0, 0.0])
+    np.testing.assert_array_equal(terrain.sample_heights(xs, zs, mode, fill=0.0), 0.0)
+    assert np.isnan(terrain.sample_heights(xs, zs, mode, fill=np.nan)).all()
+    assert terrain.sample_heights(0.0, 0.0, mode, fill=0.0) != 0.0
+    clamped = terrain.sample_heights(xs, zs, mode)
+    assert clamped[0] == terrain.sample_heights(-30.0, 0.0, mode)
+    assert terrain.get_height_at_point(-31.0, 0.0) == 0
+
+
+def test_get_height_at_point_uses_containing_cell(terrain):
+    heights = np.asarray(terrain.heightmap, dtype=np.float64)
+    x, z = 3.3, -7.8
+    i = int((x + terrain.width / 2) * terrain.resolution)
+    j = int((z + terrain.length / 2) * terrain.resolution)
+    assert terrain.get_height_at_point(x, z) == heights[i, j]
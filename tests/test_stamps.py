@@ -0,0 +1,44 @@
+# tests/test_stamps.py
+import numpy as np
+import pytest
+
+from core.brush import STAMP_OPS
+from core.terrain import Terrain
+
+
+def _apply_sequential(terrain, xs, zs, radii, strengths, op):
+    for x, z, radius, strength in zip(xs, zs, radii, strengths):
+        if op == "raise":
+            terrain.modify_height(x, z, radius, strength, add=True)
+        elif op == "lower":
+            terrain.modify_height(x, z, radius, strength, add=False)
+        elif op == "flatten":
+            # 중심이 격자 밖인 평탄화는 기준 높이가 없으므로 apply_stamps 처럼 건너뜀
+            center_x = int((x + terrain.width / 2) * terrain.resolution)
+            center_z = int((z + terrain.length / 2) * terrain.resolution)
+            if 0 <= center_x < terrain.grid_width and 0 <= center_z < terrain.grid_length:
+                terrain.flatten_area(x, z, radius)
+        else:
+            terrain.smooth_area(x, z, radius, strength)
+
+
+@pytest.mark.parametrize("op", STAMP_OPS)
+@pytest.mark.parametrize("options", [{}, {"storage": "tiled", "tile_size": 32}, {"precision": "float32"}])
+def test_stamps_match_sequential_calls(op, options):
+    rng = np.random.default_rng(4)
+    # 겹치는 스탬프와 격자 밖으로 걸치는 스탬프를 함께 사용
+    count = 300
+    xs = rng.uniform(-45, 45, count)
+    zs = rng.uniform(-35, 35, count)
+    radii = rng.uniform(1, 9, count)
+    strengths = rng.uniform(0.1, 1.0, count)
+
+    batched = Terrain(80, 60, 1.0, 3.0, **options)
+    sequential = Terrain(80, 60, 1.0, 3.0, **options)
+    heights = rng.uniform(0, 3.0, batched.heightmap.shape)
+    batched.heightmap[:, :] = heights
+    sequential.heightmap[:, :] = heights
+
+    batched.apply_stamps(xs, zs, radii, strengths, op)
+    _apply_sequential(sequential, xs, zs, radii, strengths, op)
+    np.testing.assert_allclose(np.asarray(batched.heightmap), np.asarray(sequential.heightmap), atol=1e-5)
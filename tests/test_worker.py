@@ -0,0 +1,89 @@
+# tests/test_worker.py
+import numpy as np
+import pytest
+
+from core.terrain import Terrain
+from core.worker import BrushWorker
+
+
+def make_terrain(tmp_path, name, **kwargs):
+    if kwargs.get("storage") == "memmap":
+        kwargs["heightmap_path"] = str(tmp_path / f"{name}.npy")
+    return Terrain(300, 260, 1.0, 20.0, **kwargs)
+
+
+def edit_jobs():
+    rng = np.random.default_rng(3)
+    jobs = []
+    for k in range(12):
+        count = int(rng.integers(1, 12))
+        xs = rng.uniform(-150, 150, count)
+        zs = rng.uniform(-130, 130, count)
+        op = ("raise", "lower", "smooth", "flatten")[k % 4]
+        jobs.append(("apply_stamps", (xs, zs, float(rng.uniform(3, 25)), 0.7, op)))
+    jobs.append(("add_platform", (20.0, -10.0, 40, 20, 8.0)))
+    jobs.append(("add_ramp", (-100, -100, 100, 80, 10, 0, 15)))
+    return jobs
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"storage": "tiled", "tile_size": 64},
+                                    {"storage": "memmap"}, {"precision": "uint16"}])
+def test_worker_matches_synchronous_edits(tmp_path, kwargs):
+    reference = make_terrain(tmp_path, "reference", **kwargs)
+    terrain = make_terrain(tmp_path, "worker", **kwargs)
+    for method, args in edit_jobs():
+        getattr(reference, method)(*args)
+
+    worker = BrushWorker(terrain)
+    for method, args in edit_jobs():
+        worker.submit(method, *args)
+    worker.submit_commit("edits")
+    worker.wait()
+    try:
+        np.testing.assert_array_equal(np.asarray(terrain.heightmap), np.asarray(reference.heightmap))
+        # 반영이 끝난 복사 타일은 해제됨
+        assert BrushWorker._storage(worker.back.heightmap).allocated_tiles == 0
+    finally:
+        worker.close()
+
+
+def test_back_buffer_does_not_copy_heightmap(tmp_path):
+    terrain = make_terrain(tmp_path, "large", storage="memmap")
+    worker = BrushWorker(terrain)
+    try:
+        back = worker.back.heightmap
+        assert back.base is terrain.heightmap
+        assert back.allocated_tiles == 0
+
+        worker.submit("modify_height", 0, 0, 5, 1.0)
+        worker._queue.join()
+        # 반영 전에는 편집한 타일만 복사해 보관
+        assert back.allocated_tiles == 1
+        worker.swap()
+        worker.submit("modify_height", 100, 100, 5, 1.0)
+        worker.wait()
+        assert back.allocated_tiles == 0
+    finally:
+        worker.close()
+
+
+def test_undo_reloads_back_buffer():
+    reference = Terrain(200, 200, 1.0, 20.0)
+    terrain = Terrain(200, 200, 1.0, 20.0)
+    worker = BrushWorker(terrain)
+    try:
+        worker.submit("modify_height", 0, 0, 30, 1.0)
+        worker.submit_commit("a")
+        worker.submit("modify_height", 10, 0, 30, 1.0)
+        worker.submit_commit("b")
+        worker.wait()
+        entry = terrain.history.undo()
+        worker.load_region(entry.rect)
+        worker.submit("smooth_area", 0, 0, 20, 0.5)
+        worker.wait()
+
+        reference.modify_height(0, 0, 30, 1.0)
+        reference.smooth_area(0, 0, 20, 0.5)
+        np.testing.assert_array_equal(np.asarray(terrain.heightmap), np.asarray(reference.heightmap))
+    finally:
+        worker.close()